@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Adaptive Timeouts for Job Portal Crawlers
+Tracks recent page load latencies per wait kind and derives timeouts from a
+high percentile of them, clamped between a floor and a ceiling
+"""
+
+from collections import deque
+
+
+# Timeouts used until enough latencies have been observed (the old hard-coded values)
+DEFAULT_TIMEOUTS = {
+    'detail': 10,
+    'cards': 20,
+    'pagination': 15,
+}
+
+
+class LatencyTracker:
+    """
+    Rolling window of observed latencies for each kind of wait ('detail', 'cards', ...).
+
+    timeout(kind) = percentile(window) * margin, clamped to [floor, ceiling].
+    A wait that times out is recorded at its timeout value, so a run of
+    timeouts pushes the timeout up towards the ceiling while a single outlier
+    barely moves it.
+    """
+
+    def __init__(self, window=50, percentile=95, margin=1.5, floor=3.0, ceiling=30.0,
+                 min_samples=5, defaults=None):
+        self.window = window
+        self.percentile = percentile
+        self.margin = margin
+        self.floor = floor
+        self.ceiling = ceiling
+        self.min_samples = min_samples
+        self.defaults = dict(DEFAULT_TIMEOUTS if defaults is None else defaults)
+        self.samples = {}
+
+    def _samples(self, kind):
+        if kind not in self.samples:
+            self.samples[kind] = deque(maxlen=self.window)
+        return self.samples[kind]
+
+    def record(self, kind, seconds):
+        """Record a successful wait that took `seconds`"""
+        self._samples(kind).append(seconds)
+
+    def record_timeout(self, kind, timeout):
+        """Record a wait that gave up after `timeout` seconds"""
+        self._samples(kind).append(timeout)
+
+    def latency_percentile(self, kind, percentile=None):
+        """Nearest-rank percentile of the recorded latencies, or None without samples"""
+        samples = self.samples.get(kind)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        pct = self.percentile if percentile is None else percentile
+        rank = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * len(ordered))) - 1))
+        return ordered[rank]
+
+    def timeout(self, kind):
+        """Current timeout in seconds for a wait of this kind"""
+        samples = self.samples.get(kind)
+        if not samples or len(samples) < self.min_samples:
+            timeout = self.defaults.get(kind, self.ceiling)
+        else:
+            timeout = self.latency_percentile(kind) * self.margin
+        return max(self.floor, min(self.ceiling, timeout))
+
+    def summary(self):
+        """Per-kind sample count, median, p95 and current timeout"""
+        return {
+            kind: {
+                'samples': len(samples),
+                'p50': self.latency_percentile(kind, 50),
+                'p95': self.latency_percentile(kind, 95),
+                'timeout': self.timeout(kind),
+            }
+            for kind, samples in self.samples.items()
+        }
@@ -6,32 +6,101 @@ Contains common functionality for scraping job portals
 
 import time
 import random
-import pandas as pd
 from datetime import datetime
 from abc import ABC, abstractmethod
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import WebDriverException, TimeoutException
 from bs4 import BeautifulSoup
 import re
 import os
+from collections import deque
+from concurrent.futures import Future
+from contextlib import nullcontext
+from crawl_logging import get_logger, ProgressReporter
+from resilience import RetryQueue, CircuitBreaker, CircuitOpenError
+from adaptive_timeout import LatencyTracker
+from work_queue import default_worker_id
+from job_ids import canonical_job_id
+from frontier import Frontier
+from selector_stats import SelectorStats
+from network_trace import enable_performance_logging
+from session_watchdog import Watchdog, kill_session, session_rss_mb
+from dom_scripts import PROBE_SELECTORS_SCRIPT, START_NAVIGATION_SCRIPT, NAVIGATION_DONE_SCRIPT
+
+
+# Selenium is imported where a browser is actually driven, so that parsing
+# archived pages (cli.py replay) works without loading it. Locator strategies
+# are plain strings, the same values as selenium's By.CSS_SELECTOR / By.TAG_NAME.
+CSS_SELECTOR = "css selector"
+TAG_NAME = "tag name"
 
 
 class BaseCrawler(ABC):
     """Base class for job portal crawlers"""
     
-    def __init__(self, portal_name, search_url):
+    # Query parameter that selects a result page (e.g. "p" for &p=3)
+    page_param = "page"
+    
+    # In-browser JavaScript returning the job fields (see dom_scripts.py);
+    # portals without one are parsed from driver.page_source
+    extraction_script = None
+    
+    def __init__(self, portal_name, search_url, worker_id=None):
         self.portal_name = portal_name
         self.search_url = search_url
+        self.worker_id = worker_id
         self.driver = None
         self.all_jobs_data = []
+        self.log = get_logger(portal_name, worker_id)
+        self.retry_queue = RetryQueue()
+        self.circuit_breaker = CircuitBreaker()
+        self.timeouts = LatencyTracker()
+        self.use_extraction_script = True
+        # Pipelined fetching: number of tabs loading detail pages ahead (1 = off)
+        self.pipeline_window = 1
+        self.pipeline_tabs = []
+        # Optional shared helpers set by the multi-query scheduler
+        self.rate_limiter = None
+        self.dedupe = None
+        # Optional listing page change detection (PageFingerprintStore)
+        self.fingerprints = None
+        self.unchanged_pages_stop = 3
+        # Optional ParsePool: detail page HTML is parsed in worker processes
+        self.parse_pool = None
+        # Fallback chain hit counts (the scheduler shares a persisted store)
+        self.selector_stats = SelectorStats(path=None)
+        # Optional CDP network tracing of page loads (NetworkTracer), and where
+        # the slowest pages are dumped at the end of a run
+        self.tracer = None
+        self.trace_dir = None
+        # Optional PageArchive keeping each detail page's HTML for offline replay
+        self.archive = None
+        # Hard page load deadline: Chrome's own timeout, then the watchdog kills
+        # the session if driver.get still hasn't returned after the grace period
+        self.page_load_timeout = 60
+        # The page load timeout currently set on the driver (detail pages use the adaptive one)
+        self.applied_page_load_timeout = None
+        self.watchdog_grace = 30
+        self.watchdog = Watchdog(self.kill_hung_session, name=f"{portal_name}-watchdog")
+        self.session_hung = False
+        # Sessions are replaced after this many page loads or above this RSS (MB)
+        self.recycle_after_pages = 300
+        self.max_session_rss_mb = 1500
+        self.pages_loaded = 0
+        # pages_loaded at the last RSS check
+        self.rss_checked_at = 0
+        # Bounded-memory mode: listing pages keep only job URLs, and with a
+        # sink (output_files.CsvSink) rows are streamed out instead of kept
+        self.bounded_memory = False
+        self.sink = None
+        self.jobs_streamed = 0
+        # Optional MemoryProfiler measuring each stage with tracemalloc
+        self.memory_profiler = None
         
     def setup_chrome_driver(self):
         """
         Setup Chrome driver in headless mode (no browser window shown)
         """
+        from selenium import webdriver
+        
         options = webdriver.ChromeOptions()
         options.add_argument('--headless')  # Run in headless mode (no GUI)
         options.add_argument('--no-sandbox')
@@ -42,64 +111,514 @@ class BaseCrawler(ABC):
         options.add_argument('--disable-blink-features=AutomationControlled')
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
+        if self.tracer is not None:
+            enable_performance_logging(options)
         
         try:
-            print(f"Setting up Chrome driver for {self.portal_name}...")
+            self.log.info("Setting up Chrome driver...")
             driver = webdriver.Chrome(options=options)
+            driver.set_page_load_timeout(self.page_load_timeout)
+            self.applied_page_load_timeout = self.page_load_timeout
             driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            print(f"✓ Chrome driver setup successful for {self.portal_name}")
+            self.log.info("✓ Chrome driver setup successful")
             return driver
         except Exception as e:
-            print(f"✗ Chrome driver setup failed for {self.portal_name}: {e}")
+            self.log.error("✗ Chrome driver setup failed: %s", e)
             raise Exception(f"Could not setup Chrome driver for {self.portal_name}. Please ensure Chrome browser is installed and try again.")
 
-    def wait_for_element(self, driver, selector, timeout=10):
+    def page_url(self, page_number):
+        """URL of a given search result page"""
+        if page_number <= 1:
+            return self.search_url
+        separator = '&' if '?' in self.search_url else '?'
+        return f"{self.search_url}{separator}{self.page_param}={page_number}"
+
+    @property
+    def fingerprint_key(self):
+        return f"{self.portal_name}|{self.search_url}"
+
+    def page_fingerprint(self, job_urls):
+        """Fingerprint of a result page's ordered job IDs, or None without a fingerprint store"""
+        if self.fingerprints is None:
+            return None
+        job_ids = [canonical_job_id(job_url, self.portal_name) for job_url in job_urls]
+        return self.fingerprints.fingerprint(job_ids)
+
+    def probe_selectors(self, driver, selectors, attributes=(), link_text=None, limit=20):
+        """
+        Resolve a list of candidate selectors, their attributes, text and
+        displayed/enabled state in one batched in-browser call, instead of a
+        WebDriver round-trip per find_element/get_attribute/is_enabled.
+        Returns {'selectors': {selector: [match, ...] or None if invalid},
+                 'text_matches': [match, ...]} where each match is a dict with
+        'element', 'attributes', 'text', 'displayed' and 'enabled'.
+        """
+        return driver.execute_script(
+            PROBE_SELECTORS_SCRIPT, list(selectors), list(attributes),
+            link_text.lower() if link_text else None, limit
+        )
+
+    def selector_chain(self, field):
+        return f"{self.portal_name}.{field}"
+
+    def select_first(self, soup, field, selectors):
+        """
+        soup.select_one over a fallback chain, trying the selector that hit most
+        often first. Returns the first match or None.
+        """
+        chain = self.selector_chain(field)
+        tried = []
+        for selector in self.selector_stats.order(chain, selectors):
+            tried.append(selector)
+            element = soup.select_one(selector)
+            if element:
+                self.selector_stats.record(chain, tried, selector)
+                return element
+        self.selector_stats.record(chain, tried)
+        return None
+
+    def select_all_first(self, soup, field, selectors):
+        """Like select_first, but returns every match of the first selector that matches anything"""
+        chain = self.selector_chain(field)
+        tried = []
+        for selector in self.selector_stats.order(chain, selectors):
+            tried.append(selector)
+            elements = soup.select(selector)
+            if elements:
+                self.selector_stats.record(chain, tried, selector)
+                return elements
+        self.selector_stats.record(chain, tried)
+        return []
+
+    def ordered_selectors(self, field, templates, page_number=None):
+        """
+        A fallback chain in its adaptive order, as (template, selector) pairs.
+        Templates may contain {next_page}, filled in with page_number + 1; stats
+        are kept per template so they add up across pages.
+        """
+        ordered = self.selector_stats.order(self.selector_chain(field), templates)
+        if page_number is None:
+            return [(template, template) for template in ordered]
+        return [(template, template.replace('{next_page}', str(page_number + 1))) for template in ordered]
+
+    def record_selector_hit(self, field, tried, hit=None):
+        """Record a lookup done outside select_first, e.g. over probe_selectors results"""
+        self.selector_stats.record(self.selector_chain(field), tried, hit)
+
+    def load_page(self, driver, url, timeout=None):
+        """
+        driver.get() with Chrome's page load timeout set to `timeout` (default:
+        the hard page_load_timeout), under the watchdog's deadline
+        """
+        timeout = timeout or self.page_load_timeout
+        if timeout != self.applied_page_load_timeout:
+            driver.set_page_load_timeout(timeout)
+            self.applied_page_load_timeout = timeout
+        self.pages_loaded += 1
+        with self.watchdog.guard(timeout + self.watchdog_grace, driver):
+            driver.get(url)
+
+    def kill_hung_session(self, driver):
+        """Watchdog callback: the page load outlived every deadline, kill the browser"""
+        self.log.error(
+            "✗ Page load hung for over %ds, killing the browser session",
+            self.applied_page_load_timeout + self.watchdog_grace
+        )
+        self.session_hung = True
+        kill_session(driver)
+
+    def needs_recycling(self):
+        """Why the current session should be replaced, or None"""
+        if self.session_hung:
+            return "hung page load"
+        if self.recycle_after_pages and self.pages_loaded >= self.recycle_after_pages:
+            return f"{self.pages_loaded} pages loaded"
+        # Reading /proc is cheap, but there is no need to do it on every job.
+        # Pipelined batches add several pages at once, so count from the last check.
+        if self.max_session_rss_mb and self.pages_loaded - self.rss_checked_at >= 10:
+            self.rss_checked_at = self.pages_loaded
+            rss = session_rss_mb(self.driver)
+            if rss is not None and rss > self.max_session_rss_mb:
+                return f"{rss:.0f} MB resident"
+        return None
+
+    def ensure_session(self):
+        """Replace a hung, worn or bloated browser session before the next page load"""
+        if self.driver is None:
+            return
+        reason = self.needs_recycling()
+        if reason:
+            self.log.info("↻ Recycling browser session (%s)", reason)
+            self.close_session()
+            self.start_session()
+
+    def trace_start(self, driver):
+        """Begin tracing a page load (no-op unless network tracing is on)"""
+        if self.tracer is None:
+            return
+        try:
+            self.tracer.start(driver)
+        except Exception as e:
+            self.log.debug("Network trace start failed: %s", e)
+
+    def trace_finish(self, driver, url, kind):
+        """Record the network activity since trace_start"""
+        if self.tracer is None:
+            return
+        try:
+            trace = self.tracer.finish(driver, url, kind)
+        except Exception as e:
+            self.log.debug("Network trace failed: %s", e)
+            return
+        self.log.debug(
+            "  ⇅ %s: %d requests, %.0f KB, TTFB %s",
+            kind, trace.requests, trace.bytes / 1024,
+            f"{trace.ttfb:.2f}s" if trace.ttfb is not None else "n/a"
+        )
+
+    def memory_stage(self, name):
+        """Context manager measuring a stage when a MemoryProfiler is set"""
+        if self.memory_profiler is None:
+            return nullcontext()
+        return self.memory_profiler.stage(name)
+
+    def collect(self, job_data):
+        """Keep a scraped row, or stream it to the sink in bounded-memory mode"""
+        if self.sink is not None:
+            self.sink.write(job_data)
+            self.jobs_streamed += 1
+        else:
+            self.all_jobs_data.append(job_data)
+
+    def throttle(self):
+        """Wait for the shared rate budget, if one is configured"""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
+    def claim_job(self, job_url):
+        """
+        Check the shared dedupe index before fetching a job. Returns False if
+        another query has already fetched (or is fetching) the same posting.
+        """
+        if self.dedupe is None:
+            return True
+        return self.dedupe.claim(canonical_job_id(job_url, self.portal_name))
+
+    def wait_for_element(self, driver, selector, timeout=None, kind='element'):
         """Wait for an element to be present on the page"""
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException
+        
         try:
-            WebDriverWait(driver, timeout).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-            )
+            if timeout is None:
+                self.timed_wait(driver, selector, kind)
+            else:
+                WebDriverWait(driver, timeout).until(
+                    EC.presence_of_element_located((CSS_SELECTOR, selector))
+                )
             return True
         except TimeoutException:
             return False
 
-    def scrape_job_details(self, driver, job_url):
-        """Scrape detailed information from individual job page - to be overridden by child classes"""
+    def timed_wait(self, driver, selector, kind, started=None, by=CSS_SELECTOR):
+        """
+        Wait for an element using the portal's adaptive timeout for this kind of
+        wait, and record how long it took. `started` lets the measured latency
+        include a preceding driver.get().
+        """
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException
+        
+        timeout = self.timeouts.timeout(kind)
+        if started is None:
+            started = time.monotonic()
         try:
-            print(f"  → Navigating to job details: {job_url}")
-            driver.get(job_url)
-            
-            # Wait for page to load
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
+            element = WebDriverWait(driver, timeout).until(
+                EC.presence_of_element_located((by, selector))
             )
-            
-            # Wait for dynamic content
-            time.sleep(random.uniform(1, 2))
-            
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+        except TimeoutException:
+            self.timeouts.record_timeout(kind, timeout)
+            raise
+        self.timeouts.record(kind, time.monotonic() - started)
+        return element
+
+    def fetch_job_details(self, driver, job_url):
+        """Load an individual job page and extract its details; raises on failure"""
+        from selenium.common.exceptions import TimeoutException
+        
+        self.throttle()
+        self.log.debug("  → Navigating to job details: %s", job_url)
+        started = time.monotonic()
+        self.trace_start(driver)
+        # The adaptive timeout bounds the page load itself, so a stalled page
+        # fails (and is retried later) after about the p95 load time
+        timeout = self.timeouts.timeout('detail')
+        try:
+            self.load_page(driver, job_url, timeout=timeout)
+        except TimeoutException:
+            self.timeouts.record_timeout('detail', timeout)
+            raise
+        
+        # Wait for page to load
+        self.timed_wait(driver, "body", 'detail', started=started, by=TAG_NAME)
+        
+        # Wait for dynamic content
+        time.sleep(random.uniform(1, 2))
+        self.trace_finish(driver, job_url, 'detail')
+        
+        return self.extract_current_page(driver, job_url)
+
+    def extract_current_page(self, driver, job_url, defer=False):
+        """
+        Extract job details from the page currently loaded in the driver's
+        window. With defer and a parse pool, a page that needs a full parse is
+        returned as a Future for parsed_details instead of being waited for, so
+        the browser can move on to the next page meanwhile.
+        """
+        # Prefer the portal's in-browser extraction script: one small JSON
+        # round-trip instead of transferring and re-parsing the whole page
+        details = self.extract_details_in_browser(driver, job_url)
+        html = None
+        if details is None or self.archive is not None:
+            html = driver.page_source
+        if self.archive is not None:
+            self.archive.save(self.portal_name, job_url, html)
+        
+        if details is None and self.parse_pool is not None:
+            # Parse in a worker process so concurrent crawlers are not serialized by the GIL
+            future = self.parse_pool.submit(
+                self.portal_name, html, job_url, self.selector_stats.snapshot(self.selector_chain(""))
+            )
+            return future if defer else self.parsed_details(future)
+        elif details is None:
+            soup = BeautifulSoup(html, 'html.parser')
             
             # Extract specific information using portal-specific selectors
             details = self.extract_job_details(soup, job_url)
-            
-            # Add source information
-            details['source'] = self.portal_name
-            details['job_url'] = job_url
-            
-            print(f"  ✓ Successfully scraped details for: {details['title'][:50]}...")
-            return details
-            
+            # Break the tree's reference cycles now rather than at the next GC pass
+            soup.decompose()
+        
+        # Add source information
+        details['source'] = self.portal_name
+        details['job_url'] = job_url
+        return details
+
+    def parsed_details(self, future):
+        """Wait for a parse pool Future and merge its selector lookups into this crawler's statistics"""
+        details, lookups = future.result()
+        self.selector_stats.replay(lookups)
+        return details
+
+    def extract_details_in_browser(self, driver, job_url):
+        """
+        Run the portal's extraction_script in the page and return its fields, or
+        None when the portal has no script or it failed (callers then fall back
+        to parsing driver.page_source).
+        """
+        if not self.extraction_script or not self.use_extraction_script:
+            return None
+        try:
+            result = driver.execute_script(self.extraction_script)
+        except Exception as e:
+            self.log.debug("  ⚠ Extraction script failed, falling back to page source: %s", e)
+            return None
+        if not isinstance(result, dict) or not result.get('title'):
+            self.log.debug("  ⚠ Extraction script found no title, falling back to page source")
+            return None
+        return {
+            field: "N/A" if result.get(field) is None else result[field]
+            for field in ('title', 'company', 'location', 'salary', 'description')
+        }
+
+    def scrape_job_details(self, driver, job_url):
+        """
+        Scrape detailed information from individual job page.
+        Returns None on failure, after queueing the URL for a retry with backoff.
+        Raises CircuitOpenError when the portal keeps failing.
+        """
+        self.circuit_breaker.before_request()
+        if driver is self.driver:
+            self.ensure_session()
+            driver = self.driver
+        try:
+            details = self.fetch_job_details(driver, job_url)
         except Exception as e:
-            print(f"  ✗ Error scraping job details: {e}")
-            return {
-                'title': 'Error loading',
-                'company': 'N/A',
-                'location': 'N/A',
-                'salary': 'N/A',
-                'description': 'N/A',
-                'job_url': job_url,
-                'source': self.portal_name
-            }
+            return self.record_fetch_result(job_url, None, e)
+        return self.record_fetch_result(job_url, details)
+
+    def record_fetch_result(self, job_url, details, error=None):
+        """
+        Update the circuit breaker and retry queue for a finished fetch.
+        Returns the details, or None for a failed fetch.
+        """
+        if details is None:
+            self.log.warning("  ✗ Error scraping job details for %s: %s", job_url, error)
+            if self.circuit_breaker.record_failure():
+                self.log.warning(
+                    "✗ %d consecutive failures, pausing %s for %.0fs",
+                    self.circuit_breaker.consecutive_failures, self.portal_name,
+                    self.circuit_breaker.cooldown
+                )
+            if self.retry_queue.push(job_url, error):
+                self.log.debug("  ↻ Queued for retry (attempt %d)", self.retry_queue.attempts[job_url])
+            else:
+                self.log.error("  ✗ Giving up on %s after %d attempts", job_url, self.retry_queue.attempts[job_url])
+                if self.dedupe is not None:
+                    # Let another query have a go at it
+                    self.dedupe.release(canonical_job_id(job_url, self.portal_name))
+            return None
+        
+        self.circuit_breaker.record_success()
+        self.log.debug("  ✓ Successfully scraped details for: %s...", details['title'][:50])
+        return details
+
+    def process_job(self, job_url, progress=None):
+        """Fetch one job (unless another query already has it) and collect the result"""
+        if not self.claim_job(job_url):
+            self.log.debug("  ⤳ Already fetched by another query, skipping")
+            return None
+        
+        self.log.debug("  → Scraping detailed information...")
+        with self.memory_stage('detail'):
+            job_data = self.scrape_job_details(self.driver, job_url)
+            if job_data is not None:
+                self.collect(job_data)
+        if progress:
+            progress.job_done(failed=job_data is None)
+        
+        # Wait between jobs to avoid being blocked
+        time.sleep(random.uniform(1, 2))
+        return job_data
+
+    def process_jobs_pipelined(self, job_urls, progress=None):
+        """Fetch and collect a batch of jobs through fetch_pipelined"""
+        job_urls = [job_url for job_url in job_urls if self.claim_job(job_url)]
+        self.ensure_session()
+        self.pages_loaded += len(job_urls)
+        with self.memory_stage('detail'):
+            parsing = []
+            pages = self.fetch_pipelined(self.driver, job_urls, self.pipeline_window, defer_parsing=True)
+            for job_url, details, error in pages:
+                if isinstance(details, Future):
+                    # Parsed in a worker process while the browser loads the next pages
+                    parsing.append((job_url, details))
+                else:
+                    self.finish_pipelined_job(job_url, details, error, progress)
+            for job_url, future in parsing:
+                try:
+                    details, error = self.parsed_details(future), None
+                except Exception as e:
+                    details, error = None, e
+                self.finish_pipelined_job(job_url, details, error, progress)
+
+    def finish_pipelined_job(self, job_url, details, error, progress=None):
+        """Record a pipelined fetch's outcome and collect the record"""
+        job_data = self.record_fetch_result(job_url, details, error)
+        if job_data is not None:
+            self.collect(job_data)
+        if progress:
+            progress.job_done(failed=job_data is None)
+
+    def fetch_pipelined(self, driver, job_urls, window=2, poll_interval=0.1, defer_parsing=False):
+        """
+        Fetch job pages through a small window of browser tabs on the same driver.
+        Navigation to the next URLs starts ahead of time in the other tabs, so
+        page loads overlap with extraction of the page that has finished.
+        Yields (job_url, details, error) in input order; the driver is switched
+        back to the original (listing page) window afterwards. With
+        defer_parsing, details may be a parse pool Future (see extract_current_page).
+        """
+        from selenium.common.exceptions import WebDriverException, TimeoutException
+        
+        home = driver.current_window_handle
+        while len(self.pipeline_tabs) < window:
+            driver.switch_to.new_window('tab')
+            self.pipeline_tabs.append(driver.current_window_handle)
+        
+        pending = deque(job_urls)
+        free_tabs = deque(self.pipeline_tabs[:window])
+        in_flight = deque()
+        last_start = 0.0
+        try:
+            while pending or in_flight:
+                # Start navigation in every idle tab, politely spaced out
+                while pending and free_tabs:
+                    self.circuit_breaker.before_request()
+                    self.throttle()
+                    gap = random.uniform(1, 2) - (time.monotonic() - last_start)
+                    if gap > 0 and in_flight:
+                        time.sleep(gap)
+                    tab, job_url = free_tabs.popleft(), pending.popleft()
+                    driver.switch_to.window(tab)
+                    self.log.debug("  → Loading in background tab: %s", job_url)
+                    driver.execute_script(START_NAVIGATION_SCRIPT, job_url)
+                    last_start = time.monotonic()
+                    in_flight.append((tab, job_url, last_start))
+                
+                # Collect the oldest navigation once its page has loaded
+                tab, job_url, started = in_flight.popleft()
+                free_tabs.append(tab)
+                driver.switch_to.window(tab)
+                timeout = self.timeouts.timeout('detail')
+                loaded_at = None
+                while time.monotonic() - started < timeout:
+                    try:
+                        done = driver.execute_script(NAVIGATION_DONE_SCRIPT)
+                    except WebDriverException:
+                        # The old document may be unloading mid-call
+                        done = False
+                    if done:
+                        loaded_at = time.monotonic()
+                        break
+                    time.sleep(poll_interval)
+                if loaded_at is None:
+                    self.timeouts.record_timeout('detail', timeout)
+                    yield job_url, None, TimeoutException(f"page did not load within {timeout:.1f}s")
+                    continue
+                self.timeouts.record('detail', loaded_at - started)
+                
+                # Give dynamic content the same settle time as sequential fetching
+                time.sleep(random.uniform(1, 2))
+                try:
+                    yield job_url, self.extract_current_page(driver, job_url, defer=defer_parsing), None
+                except Exception as e:
+                    yield job_url, None, e
+        finally:
+            driver.switch_to.window(home)
+
+    def process_retries(self, progress=None, wait=False, deadline=None, merge_into=None):
+        """
+        Retry failed job URLs whose backoff has elapsed. With wait=True, keep
+        sleeping until the retry queue is fully drained (or the deadline passes).
+        `merge_into` maps job URLs to existing rows (listing-only mode) that the
+        retried details are merged into instead of being appended.
+        """
+        while True:
+            for job_url in self.retry_queue.pop_ready():
+                if deadline is not None and deadline.expired():
+                    return
+                self.log.info("↻ Retrying %s", job_url)
+                with self.memory_stage('retry'):
+                    job_data = self.scrape_job_details(self.driver, job_url)
+                    if job_data is not None:
+                        if merge_into is not None and job_url in merge_into:
+                            self.merge_details(merge_into[job_url], job_data)
+                        else:
+                            self.collect(job_data)
+                if progress:
+                    progress.job_done(failed=job_data is None)
+                time.sleep(random.uniform(1, 2))
+            
+            delay = self.retry_queue.seconds_until_ready()
+            if not wait or delay is None:
+                return
+            if deadline is not None and not deadline.fits(delay):
+                return
+            if delay > 0:
+                self.log.debug("Waiting %.1fs for the next retry...", delay)
+                time.sleep(delay)
 
     @abstractmethod
     def extract_job_details(self, soup, job_url):
@@ -121,69 +640,178 @@ class BaseCrawler(ABC):
         """Navigate to next page - must be implemented by child classes"""
         pass
 
+    def start_session(self):
+        """Start a browser session for this crawler"""
+        self.applied_page_load_timeout = None
+        self.driver = self.setup_chrome_driver()
+        self.session_hung = False
+        self.pages_loaded = 0
+        self.rss_checked_at = 0
+        return self.driver
+
+    def close_session(self):
+        """Close the browser session, if any"""
+        if self.driver:
+            try:
+                self.driver.quit()
+                self.log.info("✓ Browser closed successfully")
+            except:
+                pass
+            self.driver = None
+            self.pipeline_tabs = []
+
+    def iter_listing_pages(self, max_pages, urls_only=False):
+        """
+        Walk the search result pages and yield (page_number, job_cards) for each.
+        The caller may visit job pages between iterations; the walk returns to
+        the search results before looking for the next page. With urls_only,
+        (page_number, job_urls) is yielded instead and the page's parse tree is
+        freed before the caller starts on its jobs.
+        """
+        # Navigate to search page
+        self.log.info("Navigating to: %s", self.search_url)
+        self.throttle()
+        self.trace_start(self.driver)
+        self.load_results_page(self.search_url)
+        
+        # Wait for page to load
+        self.log.debug("Waiting for page to load...")
+        time.sleep(3)
+        self.trace_finish(self.driver, self.search_url, 'listing')
+        
+        page_number = 1
+        
+        while page_number <= max_pages:
+            self.log.info("Scraping page %d...", page_number)
+            
+            # First, go back to the search results page if we're on a job detail page
+            current_url = self.driver.current_url
+            if '/job/' in current_url:
+                self.log.debug("Currently on job detail page, returning to search results...")
+                self.throttle()
+                self.load_results_page(self.page_url(page_number))
+                time.sleep(random.uniform(2, 3))
+            
+            # Wait for job cards to load using portal-specific selector
+            try:
+                self.wait_for_job_cards()
+                self.log.debug("✓ Job cards loaded successfully")
+            except Exception as e:
+                self.log.warning("✗ Timeout waiting for job cards: %s", e)
+                return
+            
+            # Parse job cards
+            with self.memory_stage('listing'):
+                soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+                job_cards = self.get_job_cards(soup)
+                page = job_cards
+                if urls_only:
+                    page = [self.extract_job_url(card) for card in job_cards]
+                    soup.decompose()
+                # Only `page` may outlive this block: the generator frame is
+                # suspended (and its locals kept alive) while the caller works
+                del soup, job_cards
+            
+            if not page:
+                self.log.info("✓ No more job cards found. Ending scrape.")
+                return
+            
+            self.log.info("✓ Found %d jobs on page %d.", len(page), page_number)
+            driver = self.driver
+            yield page_number, page
+            del page
+            if self.memory_profiler is not None:
+                self.memory_profiler.page_done(self.portal_name, page_number)
+            
+            self.ensure_session()
+            if self.driver is not driver:
+                # The session was recycled while this page's jobs were fetched
+                self.load_results_page(self.page_url(page_number))
+            
+            # Navigate to next page
+            if page_number < max_pages:
+                if not self.navigate_to_next_page(self.driver, page_number):
+                    self.log.info("No more pages available")
+                    return
+                page_number += 1
+            else:
+                self.log.info("✓ Reached maximum pages limit (%d)", max_pages)
+                return
+
+    def load_results_page(self, url):
+        """
+        Load a search results page in the current session, replacing a hung or
+        worn session first. A failed load is retried once on a fresh session.
+        """
+        self.ensure_session()
+        try:
+            self.load_page(self.driver, url)
+        except Exception as e:
+            self.log.warning("↻ Results page load failed, retrying on a new session: %s", e)
+            self.close_session()
+            self.start_session()
+            self.load_page(self.driver, url)
+
+    def load_listing_page(self, page_number):
+        """
+        Jump straight to one search result page (no pagination clicks) and
+        return its job cards; an empty list when the page has none.
+        """
+        self.throttle()
+        self.ensure_session()
+        self.trace_start(self.driver)
+        self.load_page(self.driver, self.page_url(page_number))
+        try:
+            self.wait_for_job_cards()
+        except Exception as e:
+            self.log.debug("No job cards on page %d: %s", page_number, e)
+            return []
+        finally:
+            self.trace_finish(self.driver, self.page_url(page_number), 'listing')
+        soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+        return self.get_job_cards(soup)
+
     def scrape_jobs(self, max_pages=2):
         """Main scraping method that uses the portal-specific implementations"""
         try:
-            print(f"{self.portal_name} Detailed Job Scraper")
-            print("=" * 50)
-            
-            # Setup driver
-            self.driver = self.setup_chrome_driver()
+            self.log.info("%s Detailed Job Scraper", self.portal_name)
             
-            # Navigate to search page
-            print(f"Navigating to: {self.search_url}")
-            self.driver.get(self.search_url)
+            progress = ProgressReporter(self.portal_name, self.worker_id)
             
-            # Wait for page to load
-            print("Waiting for page to load...")
-            time.sleep(3)
-            
-            page_number = 1
+            # Setup driver
+            self.start_session()
             
-            while page_number <= max_pages:
-                print(f"\nScraping page {page_number} for {self.portal_name}...")
-                
-                # First, go back to the search results page if we're on a job detail page
-                current_url = self.driver.current_url
-                if '/job/' in current_url:
-                    print("Currently on job detail page, returning to search results...")
-                    self.driver.get(self.search_url)
-                    time.sleep(random.uniform(2, 3))
-                
-                # Wait for job cards to load using portal-specific selector
-                try:
-                    self.wait_for_job_cards()
-                    print("✓ Job cards loaded successfully")
-                except Exception as e:
-                    print(f"✗ Timeout waiting for job cards: {e}")
-                    break
+            unchanged_pages = 0
+            # Pages whose fingerprint waits for their retried jobs to finish
+            unsettled_pages = []
+            for page_number, page in self.iter_listing_pages(max_pages, urls_only=self.bounded_memory):
+                progress.page_started(page_number)
+                job_urls = page if self.bounded_memory else [self.extract_job_url(card) for card in page]
                 
-                # Parse job cards
-                soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-                job_cards = self.get_job_cards(soup)
-                
-                if not job_cards:
-                    print("✓ No more job cards found. Ending scrape.")
-                    break
-                
-                print(f"✓ Found {len(job_cards)} jobs on page {page_number}.")
+                # Skip result pages whose jobs are exactly as in the previous run
+                fingerprint = self.page_fingerprint(job_urls)
+                if fingerprint and self.fingerprints.is_unchanged(self.fingerprint_key, page_number, fingerprint):
+                    unchanged_pages += 1
+                    self.log.info("≡ Page %d unchanged since last run, skipping its jobs", page_number)
+                    if unchanged_pages >= self.unchanged_pages_stop:
+                        self.log.info("✓ %d consecutive unchanged pages, stopping pagination", unchanged_pages)
+                        break
+                    continue
+                unchanged_pages = 0
                 
                 # Process each job card
-                for i, card in enumerate(job_cards, 1):
-                    print(f"\nProcessing job {i}/{len(job_cards)} on page {page_number}")
-                    
-                    # Extract job URL
-                    job_url = self.extract_job_url(card)
+                page_job_urls = []
+                for i, job_url in enumerate(job_urls, 1):
+                    self.log.debug("Processing job %d/%d on page %d", i, len(job_urls), page_number)
                     
                     if job_url and job_url != "N/A":
-                        print(f"  → Scraping detailed information...")
-                        job_data = self.scrape_job_details(self.driver, job_url)
-                        
-                        # Wait between jobs to avoid being blocked
-                        time.sleep(random.uniform(1, 2))
+                        if self.pipeline_window > 1:
+                            page_job_urls.append(job_url)
+                        else:
+                            self.process_job(job_url, progress)
                     else:
-                        print(f"  ⚠ No job URL found, skipping job")
-                        job_data = {
+                        self.log.warning("  ⚠ No job URL found for job %d on page %d, skipping job", i, page_number)
+                        self.collect({
                             'title': 'N/A',
                             'company': 'N/A',
                             'location': 'N/A',
@@ -191,38 +819,365 @@ class BaseCrawler(ABC):
                             'description': 'N/A',
                             'job_url': 'N/A',
                             'source': self.portal_name
-                        }
-                    
-                    self.all_jobs_data.append(job_data)
-                    print(f"✓ Completed job {i}/{len(job_cards)}")
+                        })
+                        progress.job_done(failed=True)
+                    self.log.debug("✓ Completed job %d/%d", i, len(job_urls))
                 
-                # Navigate to next page
-                if page_number < max_pages:
-                    if not self.navigate_to_next_page(self.driver, page_number):
-                        print(f"No more pages available for {self.portal_name}")
-                        break
-                    page_number += 1
-                else:
-                    print(f"✓ Reached maximum pages limit ({max_pages}) for {self.portal_name}")
-                    break
+                # Pipelined mode: fetch the page's jobs in background tabs
+                if page_job_urls:
+                    self.process_jobs_pipelined(page_job_urls, progress)
+                
+                # Retry earlier failures whose backoff has elapsed
+                self.process_retries(progress)
+                
+                if fingerprint:
+                    unsettled_pages.append((page_number, fingerprint, job_urls))
+                    self.settle_fingerprints(unsettled_pages)
             
-            print(f"\n✓ {self.portal_name} scraping completed. Total jobs: {len(self.all_jobs_data)}")
+            # Drain the retry queue before finishing
+            self.process_retries(progress, wait=True)
+            self.settle_fingerprints(unsettled_pages, final=True)
+            
+            self.log_run_summary(progress)
+            return self.all_jobs_data
+            
+        except CircuitOpenError as e:
+            # The portal is blocking or down - keep what was collected so far
+            self.log.error("✗ Stopping %s scraping, portal keeps failing: %s", self.portal_name, e)
             return self.all_jobs_data
             
         except Exception as e:
-            print(f"✗ An error occurred during {self.portal_name} scraping: {e}")
-            import traceback
-            traceback.print_exc()
-            return []
+            # Keep what was collected before the failure
+            self.log.exception("✗ An error occurred during scraping: %s", e)
+            return self.all_jobs_data
             
         finally:
             # Always close the driver
-            if self.driver:
+            self.close_session()
+
+    def settle_fingerprints(self, pages, final=False):
+        """
+        Save the fingerprints of pages (page_number, fingerprint, job_urls)
+        whose jobs have all finished, and remove them from the list. A page
+        with a job that failed every retry is not fingerprinted, so the next
+        run fetches it again instead of skipping it as unchanged. With final,
+        jobs still waiting for a retry count as failed.
+        """
+        queued = self.retry_queue.queued_urls()
+        exhausted = {job_url for job_url, _ in self.retry_queue.exhausted}
+        unsettled = []
+        saved = False
+        for page_number, fingerprint, job_urls in pages:
+            if not final and queued.intersection(job_urls):
+                unsettled.append((page_number, fingerprint, job_urls))
+            elif exhausted.intersection(job_urls) or queued.intersection(job_urls):
+                self.log.info("⚠ Page %d has jobs that failed every retry, not marking it unchanged", page_number)
+            else:
+                self.fingerprints.update(self.fingerprint_key, page_number, fingerprint, len(job_urls))
+                saved = True
+        pages[:] = unsettled
+        if saved:
+            self.fingerprints.save()
+
+    def scrape_jobs_by_priority(self, deadline, max_pages=2, seen_job_ids=(), promoted='normal',
+                                discovery_share=0.3):
+        """
+        Time-budgeted scraping. The listing pages are walked first (using at most
+        `discovery_share` of the budget) to fill a priority frontier: unseen jobs
+        first, then earlier pages, with promoted cards first/last if asked for.
+        Jobs are then fetched in priority order until the deadline, and
+        everything fetched so far is returned.
+        """
+        frontier = Frontier(seen_job_ids, promoted)
+        try:
+            self.log.info("%s Time-Budgeted Job Scraper (%.0fs budget)", self.portal_name, deadline.remaining())
+            progress = ProgressReporter(self.portal_name, self.worker_id)
+            discovery_ends = time.monotonic() + deadline.remaining() * discovery_share
+            
+            self.start_session()
+            
+            # Discovery: collect job URLs from the listing pages
+            for page_number, job_cards in self.iter_listing_pages(max_pages):
+                progress.page_started(page_number)
+                for position, card in enumerate(job_cards, 1):
+                    job_url = self.extract_job_url(card)
+                    if job_url and job_url != "N/A":
+                        frontier.push(job_url, canonical_job_id(job_url, self.portal_name),
+                                      page_number, position, self.is_promoted(card, job_url))
+                if time.monotonic() >= discovery_ends:
+                    self.log.info("⏱ Discovery budget used up after page %d", page_number)
+                    break
+            self.log.info("✓ Frontier holds %d jobs (%d unseen)", len(frontier), frontier.unseen_count())
+            
+            # Fetch in priority order while the budget lasts
+            job_seconds = None
+            while frontier:
+                if deadline.expired() or (job_seconds and not deadline.fits(job_seconds)):
+                    self.log.info("⏱ Time budget used up, %d jobs left unfetched", len(frontier))
+                    break
+                entry = frontier.pop()
+                started = time.monotonic()
+                self.process_job(entry['job_url'], progress)
+                elapsed = time.monotonic() - started
+                job_seconds = elapsed if job_seconds is None else 0.7 * job_seconds + 0.3 * elapsed
+                self.process_retries(progress, deadline=deadline)
+            
+            self.process_retries(progress, wait=True, deadline=deadline)
+            self.log_run_summary(progress)
+            return self.all_jobs_data
+            
+        except CircuitOpenError as e:
+            self.log.error("✗ Stopping %s scraping, portal keeps failing: %s", self.portal_name, e)
+            return self.all_jobs_data
+            
+        except Exception as e:
+            # In budget mode partial results are still worth keeping
+            self.log.exception("✗ An error occurred during scraping: %s", e)
+            return self.all_jobs_data
+            
+        finally:
+            self.close_session()
+
+    def scrape_listings(self, max_pages=2, describe=None, deadline=None):
+        """
+        Listing-only fast mode: build full rows straight from the listing cards
+        (one page load per 20+ jobs), and load a job's detail page only when its
+        card lacks the basic fields or `describe(row)` asks for its description.
+        Portals whose cards carry no job fields fall back to detail pages. With
+        a deadline, no detail page or further listing page is loaded once it
+        has passed; the card rows collected so far are kept.
+        """
+        # job_url -> row, so that retried detail fetches are merged into their card row
+        rows_by_url = {}
+        try:
+            self.log.info("%s Listing-Only Job Scraper", self.portal_name)
+            progress = ProgressReporter(self.portal_name, self.worker_id)
+            self.start_session()
+            
+            for page_number, job_cards in self.iter_listing_pages(max_pages):
+                progress.page_started(page_number)
+                page_rows = []
+                for card in job_cards:
+                    job_url = self.extract_job_url(card)
+                    if not job_url or job_url == "N/A" or not self.claim_job(job_url):
+                        continue
+                    row = self.extract_card_details(card) or {}
+                    row.setdefault('description', "N/A")
+                    row['source'] = self.portal_name
+                    row['job_url'] = job_url
+                    rows_by_url[job_url] = row
+                    page_rows.append(row)
+                
+                # Lazily load detail pages only where they are needed
+                for row in page_rows:
+                    if self.needs_details(row, describe) and not (deadline is not None and deadline.expired()):
+                        self.fill_details(row, progress)
+                    else:
+                        progress.job_done()
+                self.all_jobs_data.extend(page_rows)
+                self.log.info("✓ %d rows from page %d", len(page_rows), page_number)
+                self.process_retries(progress, deadline=deadline, merge_into=rows_by_url)
+                if deadline is not None and deadline.expired():
+                    self.log.info("⏱ Time budget spent after listing page %d", page_number)
+                    break
+            
+            self.process_retries(progress, wait=True, deadline=deadline, merge_into=rows_by_url)
+            self.log_run_summary(progress)
+            return self.all_jobs_data
+            
+        except CircuitOpenError as e:
+            self.log.error("✗ Stopping %s scraping, portal keeps failing: %s", self.portal_name, e)
+            return self.all_jobs_data
+            
+        except Exception as e:
+            # Keep what was collected before the failure
+            self.log.exception("✗ An error occurred during scraping: %s", e)
+            return self.all_jobs_data
+            
+        finally:
+            self.close_session()
+
+    @staticmethod
+    def needs_details(row, describe=None):
+        """A row needs its detail page if the card lacked basic fields or its description is requested"""
+        if any(row.get(field) in (None, '', 'N/A') for field in ('title', 'company', 'location')):
+            return True
+        return bool(describe and row.get('description') in (None, '', 'N/A') and describe(row))
+
+    @staticmethod
+    def merge_details(row, details):
+        """Fill a card row with detail page fields, keeping card values the detail page lacks"""
+        for key, value in details.items():
+            if value not in (None, '', 'N/A') or row.get(key) in (None, '', 'N/A'):
+                row[key] = value
+        return row
+
+    def fill_details(self, row, progress=None):
+        """Load a row's detail page and merge it into the row; returns True on success"""
+        details = self.scrape_job_details(self.driver, row['job_url'])
+        if details is not None:
+            self.merge_details(row, details)
+        if progress:
+            progress.job_done(failed=details is None)
+        time.sleep(random.uniform(1, 2))
+        return details is not None
+
+    def fetch_descriptions(self, rows, describe=None):
+        """
+        Lazily fetch descriptions for rows produced by scrape_listings, e.g. once a
+        consumer asks for them. Only rows that still need details are loaded.
+        Returns the number of rows filled in.
+        """
+        pending = [row for row in rows if row.get('source') == self.portal_name
+                   and self.needs_details(row, describe or (lambda row: True))]
+        if not pending:
+            return 0
+        filled = 0
+        own_session = self.driver is None
+        try:
+            if own_session:
+                self.start_session()
+            for row in pending:
+                filled += self.fill_details(row)
+            self.process_retries(wait=True, merge_into={row['job_url']: row for row in pending})
+            return filled
+        except CircuitOpenError as e:
+            self.log.error("✗ Stopping %s description fetch, portal keeps failing: %s", self.portal_name, e)
+            return filled
+        finally:
+            if own_session:
+                self.close_session()
+
+    def log_run_summary(self, progress):
+        """Log throughput, latency and failure statistics at the end of a run"""
+        progress.report(final=True)
+        for kind, stats in self.timeouts.summary().items():
+            self.log.debug(
+                "Latency %s: %d samples, p50 %.1fs, p95 %.1fs, timeout %.1fs",
+                kind, stats['samples'], stats['p50'], stats['p95'], stats['timeout']
+            )
+        self.log_network_summary()
+        if self.retry_queue.exhausted:
+            self.log.warning("✗ %d jobs failed after all retries", len(self.retry_queue.exhausted))
+        if self.sink is not None:
+            self.log.info("✓ Scraping completed. Total jobs: %d (written to %s)", self.jobs_streamed, self.sink.path)
+        else:
+            self.log.info("✓ Scraping completed. Total jobs: %d", len(self.all_jobs_data))
+
+    def log_network_summary(self):
+        """Log per-page network cost and dump the slowest pages, if tracing is on"""
+        if self.tracer is None:
+            return
+        for kind, stats in self.tracer.summary().items():
+            self.log.info(
+                "⇅ %s pages: %d traced, %.0f requests and %.0f KB per page, p50 TTFB %s, %.1fs per page",
+                kind, stats['pages'], stats['avg_requests'], stats['avg_kb'],
+                f"{stats['p50_ttfb']:.2f}s" if stats['p50_ttfb'] is not None else "n/a", stats['avg_seconds']
+            )
+        for host, size in self.tracer.top_hosts():
+            self.log.info("  - %s: %.0f KB", host, size / 1024)
+        if self.trace_dir:
+            paths = self.tracer.dump_slowest(self.trace_dir)
+            if paths:
+                self.log.info("✓ Slowest %d pages written to %s", len(paths), self.trace_dir)
+
+    def publish_jobs(self, work_queue, max_pages=2):
+        """
+        Coordinator mode: walk the listing pages and publish every job URL to the
+        shared work queue instead of fetching it. Returns the number of new jobs.
+        """
+        published = 0
+        work_queue.start_publishing(self.portal_name)
+        try:
+            self.start_session()
+            for page_number, job_cards in self.iter_listing_pages(max_pages):
+                job_urls = [url for url in map(self.extract_job_url, job_cards) if url and url != "N/A"]
+                new_jobs = work_queue.publish(self.portal_name, job_urls)
+                published += new_jobs
+                self.log.info("✓ Published %d new of %d jobs from page %d", new_jobs, len(job_urls), page_number)
+            return published
+        except Exception as e:
+            self.log.exception("✗ An error occurred while publishing jobs: %s", e)
+            return published
+        finally:
+            # Also after an error: workers drain what was published, then exit
+            work_queue.finish_publishing(self.portal_name)
+            self.close_session()
+
+    def run_worker(self, work_queue, idle_timeout=60, poll_interval=5):
+        """
+        Worker mode: claim jobs for this portal from the shared work queue, fetch
+        them and ack the results. Exits once the coordinator has finished
+        publishing and nothing is left pending or in flight, or once no work
+        has been claimable for idle_timeout seconds (e.g. the coordinator died).
+        Returns the number of jobs completed by this worker.
+        """
+        worker_id = str(self.worker_id or default_worker_id())
+        progress = ProgressReporter(self.portal_name, self.worker_id)
+        completed = 0
+        idle_since = None
+        try:
+            self.start_session()
+            while True:
+                # Replace a session the watchdog killed before claiming more work
+                self.ensure_session()
+                item = work_queue.claim(worker_id, portal=self.portal_name)
+                if item is None:
+                    # An empty queue only means done once the coordinator has
+                    # published every page; until then more jobs may arrive
+                    published = work_queue.publishing_finished(self.portal_name)
+                    if published and not work_queue.has_open_work(self.portal_name):
+                        break
+                    idle_since = idle_since or time.monotonic()
+                    if time.monotonic() - idle_since >= idle_timeout:
+                        self.log.info(
+                            "No claimable jobs for %ds%s, exiting", idle_timeout,
+                            "" if published else " and the coordinator has not finished publishing"
+                        )
+                        break
+                    time.sleep(poll_interval)
+                    continue
+                idle_since = None
+                
+                self.circuit_breaker.before_request()
                 try:
-                    self.driver.quit()
-                    print(f"✓ Browser closed successfully for {self.portal_name}")
-                except:
-                    pass
+                    job_data = self.fetch_job_details(self.driver, item['job_url'])
+                except Exception as e:
+                    self.log.warning("  ✗ Error scraping job details for %s: %s", item['job_url'], e)
+                    self.circuit_breaker.record_failure()
+                    if not work_queue.fail(item, e, retry_delay=self.retry_queue.backoff(item['attempts'])):
+                        self.log.error("  ✗ Giving up on %s after %d attempts", item['job_url'], item['attempts'])
+                    progress.job_done(failed=True)
+                else:
+                    self.circuit_breaker.record_success()
+                    work_queue.ack(item, job_data)
+                    completed += 1
+                    progress.job_done()
+                
+                # Wait between jobs to avoid being blocked
+                time.sleep(random.uniform(1, 2))
+            
+            progress.report(final=True)
+            return completed
+            
+        except CircuitOpenError as e:
+            # Unclaimed jobs stay in the queue for other workers
+            self.log.error("✗ Stopping %s worker, portal keeps failing: %s", self.portal_name, e)
+            return completed
+            
+        finally:
+            self.close_session()
+
+    def extract_card_details(self, card):
+        """
+        Extract title/company/location/salary from a listing card - overridden by
+        child classes whose cards carry them. Returns a dict, or None if unsupported.
+        """
+        return None
+
+    def is_promoted(self, card, job_url):
+        """Whether a job card is a promoted/sponsored listing - overridden by child classes"""
+        return False
 
     def wait_for_job_cards(self):
         """Wait for job cards to load - to be overridden by child classes if needed"""
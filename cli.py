@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Job Scraper Command Line
+One entry point with subcommands. Only `crawl` (and `replay`, which parses
+pages) import the heavy dependencies, so the other commands start in tens
+of milliseconds:
+
+    python cli.py crawl [main.py options]   # scrape the portals
+    python cli.py export                    # merge job_lists.csv (and history) into the SQLite store
+    python cli.py dump                      # SQLite store -> one CSV
+    python cli.py stats                     # summarize job_lists.csv or the store
+    python cli.py search "DAMA"             # ranked full-text search of the store
+    python cli.py replay                    # re-extract archived pages offline
+    python cli.py enrich                    # add typed columns parsed from descriptions
+    python cli.py gazetteer AU.txt          # rebuild data/au_gazetteer.csv from GeoNames
+    python cli.py bench                     # startup/import time check
+"""
+
+import argparse
+import os
+import sys
+import time
+
+
+OUTPUT_COLUMNS = ['source', 'title', 'company', 'location', 'salary', 'description', 'job_url']
+
+# Modules no command other than crawl/replay may load at startup
+HEAVY_MODULES = ('selenium', 'pandas', 'bs4', 'numpy')
+
+
+def read_csv_rows(path):
+    import csv
+    # Job descriptions can exceed the csv module's default field limit
+    csv.field_size_limit(sys.maxsize)
+    with open(path, newline='', encoding='utf-8') as f:
+        yield from csv.DictReader(f)
+
+
+def cmd_crawl(args):
+    """Run the crawler (all main.py options are accepted)"""
+    import main
+    return main.main(args.main_args)
+
+
+def cmd_export(args):
+    """Merge scraped CSVs into the SQLite store (the master dataset), oldest file first"""
+    from job_store import JobStore
+    from output_files import find_output_files, output_file_info
+
+    files = [output_file_info(path) for path in args.input if os.path.exists(path)]
+    if args.history:
+        files += find_output_files(args.history)
+    if not files:
+        print("✗ No input files found")
+        return 1
+    store = JobStore(args.sqlite)
+    try:
+        for info in sorted(files, key=lambda info: info['scraped_at']):
+            rows = read_csv_rows(info['path'])
+            if info['source']:
+                # Legacy files have no source column; their name gives the portal
+                rows = ({**row, 'source': row.get('source') or info['source']} for row in rows)
+            if args.dedupe:
+                from near_duplicates import assign_clusters
+                rows = list(rows)
+                assign_clusters(rows, threshold=args.dedupe_threshold, store=store)
+            inserted, updated = store.upsert(rows, scraped_at=info['scraped_at'])
+            print(f"✓ {info['path']} ({info['scraped_at']:%Y-%m-%d %H:%M}) -> {args.sqlite}: "
+                  f"{inserted} new jobs, {updated} updated")
+    finally:
+        store.close()
+
+
+def cmd_dump(args):
+    """Write the SQLite store's jobs to a CSV, one row per job"""
+    import csv
+    from job_store import JobStore
+    if not os.path.exists(args.sqlite):
+        print(f"✗ No job store at {args.sqlite}")
+        return 1
+    store = JobStore(args.sqlite)
+    try:
+        cursor = store.iter_jobs(source=args.source, since=args.since)
+        fieldnames = [column[0] for column in cursor.description]
+        count = 0
+        with open(args.output, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            for row in cursor:
+                writer.writerow(row)
+                count += 1
+    finally:
+        store.close()
+    print(f"✓ {count} jobs -> {args.output}")
+
+
+def print_counts(title, counts, limit=None):
+    print(f"{title}:")
+    items = sorted(counts.items(), key=lambda item: item[1], reverse=True)
+    for key, count in items[:limit]:
+        print(f"  - {key}: {count}")
+
+
+def cmd_stats(args):
+    """Jobs per portal/state (and top companies for CSVs)"""
+    if args.sqlite:
+        # The store keeps these counts in summary tables, no scan needed
+        from job_store import JobStore
+        store = JobStore(args.sqlite)
+        try:
+            summary = store.summary()
+            print(f"Total jobs: {store.count()}")
+        finally:
+            store.close()
+        print_counts("Jobs by source", summary['source'])
+        print_counts("Jobs by state", summary['state'])
+        print("New jobs by day:")
+        for day, count in summary['day'].items():
+            print(f"  - {day}: {count}")
+        return
+
+    from collections import Counter
+    # The state code named in the string: the gazetteer (and its suburb lookup)
+    # is only needed for locations that name no state, which stats counts as Unknown
+    from locations import state_code
+    sources, states, companies = Counter(), Counter(), Counter()
+    total = with_salary = with_description = 0
+    for row in read_csv_rows(args.input):
+        total += 1
+        sources[row.get('source') or 'N/A'] += 1
+        states[state_code(row.get('location')) or 'Unknown'] += 1
+        companies[row.get('company') or 'N/A'] += 1
+        with_salary += row.get('salary') not in (None, '', 'N/A')
+        with_description += row.get('description') not in (None, '', 'N/A')
+    print(f"Total jobs: {total}")
+    if total:
+        print(f"With salary: {with_salary} ({with_salary / total:.0%}), "
+              f"with description: {with_description} ({with_description / total:.0%})")
+    print_counts("Jobs by source", sources)
+    print_counts("Jobs by state", states)
+    print_counts("Top companies", companies, limit=10)
+
+
+def cmd_search(args):
+    """Ranked full-text search over the SQLite store"""
+    from job_store import JobStore
+    if not os.path.exists(args.sqlite):
+        print(f"✗ No job store at {args.sqlite} (create it with `cli.py export` or main.py --sqlite)")
+        return 1
+    store = JobStore(args.sqlite)
+    try:
+        started = time.perf_counter()
+        rows = store.search(args.query, source=args.source, since=args.since, until=args.until, limit=args.limit)
+        elapsed = (time.perf_counter() - started) * 1000
+    finally:
+        store.close()
+    for row in rows:
+        print(f"{row['rank']:7.2f}  {row['source']:<5} {row['scrape_date']}  {row['title']} — {row['company']} ({row['location']})")
+        print(f"         {row['job_url']}")
+        if args.snippets:
+            print(f"         {' '.join(row['snippet'].split())}")
+    print(f"{len(rows)} matches in {elapsed:.1f} ms")
+
+
+def cmd_replay(args):
+    """Re-run extract_job_details over archived pages and write the records to a CSV"""
+    import csv
+    from page_archive import PageArchive
+
+    archive = PageArchive(args.archive)
+    entries = archive.entries(args.portal)
+    if not entries:
+        print(f"✗ No archived pages in {args.archive}")
+        return 1
+    from parse_pool import ParsePool, parse_job_html
+
+    started = time.monotonic()
+    with open(args.output, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=OUTPUT_COLUMNS, extrasaction='ignore')
+        writer.writeheader()
+        portals = sorted({entry['portal'] for entry in entries})
+        if args.workers:
+            with ParsePool(args.workers) as pool:
+                for portal in portals:
+                    pages = ((archive.load(entry), entry['job_url']) for entry in entries if entry['portal'] == portal)
+                    writer.writerows(pool.parse_many(portal, pages))
+        else:
+            for entry in entries:
+                writer.writerow(parse_job_html(entry['portal'], archive.load(entry), entry['job_url']))
+    elapsed = time.monotonic() - started
+    print(f"✓ Replayed {len(entries)} pages in {elapsed:.1f}s -> {args.output}")
+
+
+def cmd_enrich(args):
+    """Add the enrichment columns (and optionally locations and cluster IDs) to every row of a jobs CSV"""
+    import csv
+    from enrichment import ENRICHED_COLUMNS, enrich_records
+    from locations import LOCATION_COLUMNS, normalize_records
+
+    started = time.monotonic()
+    rows = list(read_csv_rows(args.input))
+    if not rows:
+        print(f"✗ No rows in {args.input}")
+        return 1
+    enrich_records(rows, workers=args.workers)
+    columns = ENRICHED_COLUMNS
+    if args.locations:
+        normalize_records(rows)
+        columns += LOCATION_COLUMNS
+    if args.dedupe:
+        from near_duplicates import assign_clusters
+        store = None
+        if args.sqlite:
+            from job_store import JobStore
+            store = JobStore(args.sqlite)
+        try:
+            duplicates = assign_clusters(rows, threshold=args.dedupe_threshold, store=store, save_signatures=False)
+        finally:
+            if store is not None:
+                store.close()
+        columns += ('cluster_id',)
+        print(f"✓ {duplicates} of {len(rows)} rows repeat an earlier posting")
+    fieldnames = list(rows[0]) + [column for column in columns if column not in rows[0]]
+    with open(args.output, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+    print(f"✓ Enriched {len(rows)} rows in {time.monotonic() - started:.2f}s -> {args.output}")
+
+
+def cmd_gazetteer(args):
+    """Rebuild the location gazetteer from the GeoNames Australian postal codes"""
+    from locations import build_gazetteer
+
+    rows = build_gazetteer(args.source, path=args.output)
+    print(f"✓ Wrote {rows} places -> {args.output}")
+
+
+def cmd_bench(args):
+    """Time the startup of each light subcommand and check no heavy module is imported"""
+    import statistics
+    import subprocess
+
+    cli = os.path.abspath(__file__)
+    commands = [['--help'], ['stats', '--help'], ['export', '--help'], ['dump', '--help'], ['search', '--help'], ['replay', '--help'], ['enrich', '--help']]
+    if os.path.exists(args.input):
+        commands.append(['stats', '--input', args.input])
+
+    failed = False
+    for command in commands:
+        timings = []
+        for _ in range(args.runs):
+            started = time.perf_counter()
+            subprocess.run([sys.executable, cli] + command, stdout=subprocess.DEVNULL, check=True)
+            timings.append((time.perf_counter() - started) * 1000)
+        median = statistics.median(timings)
+        slow = median > args.max_ms
+        failed |= slow
+        print(f"{'✗' if slow else '✓'} {' '.join(command):<40} {median:6.1f} ms")
+
+    # Importing the CLI (and the stats path) must not pull in the crawl stack
+    probe = (
+        "import sys, cli, job_store; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    loaded = subprocess.run(
+        [sys.executable, '-c', probe], cwd=os.path.dirname(cli),
+        capture_output=True, text=True, check=True
+    ).stdout.strip()
+    if loaded:
+        failed = True
+        print(f"✗ Heavy modules imported at startup: {loaded}")
+    else:
+        print("✓ No heavy modules imported at startup")
+
+    if args.importtime:
+        # Slowest imports of the last command timed above, as reported by python -X importtime
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', cli] + commands[-1],
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+        )
+        rows = []
+        for line in result.stderr.splitlines():
+            parts = line.split('|')
+            if len(parts) == 3 and parts[1].strip().isdigit():
+                rows.append((int(parts[1]), parts[2].rstrip()))
+        print("Slowest imports (cumulative µs):")
+        for cumulative, module in sorted(rows, reverse=True)[:args.importtime]:
+            print(f"  {cumulative:>8} {module}")
+    return 1 if failed else 0
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Jora/Seek job scraper")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    crawl = commands.add_parser('crawl', help="Scrape the portals (accepts every main.py option)")
+    crawl.add_argument('main_args', nargs=argparse.REMAINDER, help="Options passed on to main.py")
+    crawl.set_defaults(handler=cmd_crawl)
+
+    export = commands.add_parser('export', help="Merge jobs CSVs into the SQLite store (the master dataset)")
+    export.add_argument('--input', nargs='*', default=["job_lists.csv"], metavar='CSV',
+                        help="CSVs to merge (default: job_lists.csv); legacy timestamped names give source and time")
+    export.add_argument('--history', metavar='DIR',
+                        help="Also merge every legacy *_jobs_detailed_<timestamp>.csv in DIR, oldest first")
+    export.add_argument('--sqlite', default="jobs.db")
+    export.add_argument('--dedupe', action='store_true',
+                        help="Link near duplicates across the imported files and the store's history")
+    export.add_argument('--dedupe-threshold', type=float, default=0.7, metavar='SIMILARITY')
+    export.set_defaults(handler=cmd_export)
+
+    dump = commands.add_parser('dump', help="Write the jobs in the SQLite store to a CSV")
+    dump.add_argument('--sqlite', default="jobs.db")
+    dump.add_argument('--output', default="job_master.csv")
+    dump.add_argument('--source', help="Only jobs from this portal")
+    dump.add_argument('--since', metavar='YYYY-MM-DD', help="Only jobs seen on or after this date")
+    dump.set_defaults(handler=cmd_dump)
+
+    stats = commands.add_parser('stats', help="Summarize a jobs CSV or the SQLite store")
+    stats.add_argument('--input', default="job_lists.csv")
+    stats.add_argument('--sqlite', help="Read the store's summary tables instead of a CSV")
+    stats.set_defaults(handler=cmd_stats)
+
+    search = commands.add_parser('search', help="Ranked full-text search of titles, companies and descriptions")
+    search.add_argument('query', help='FTS5 query, e.g. DAMA, "Certificate III", chef AND sydney')
+    search.add_argument('--sqlite', default="jobs.db")
+    search.add_argument('--source', help="Only jobs from this portal")
+    search.add_argument('--since', metavar='YYYY-MM-DD', help="Only jobs scraped on or after this date")
+    search.add_argument('--until', metavar='YYYY-MM-DD', help="Only jobs scraped on or before this date")
+    search.add_argument('--limit', type=int, default=20)
+    search.add_argument('--snippets', action='store_true', help="Show the matching part of each description")
+    search.set_defaults(handler=cmd_search)
+
+    replay = commands.add_parser('replay', help="Re-extract pages archived with main.py --archive")
+    replay.add_argument('--archive', default="page_archive")
+    replay.add_argument('--portal', help="Only replay this portal's pages")
+    replay.add_argument('--output', default="replay.csv")
+    replay.add_argument('--workers', type=int, help="Parse in this many worker processes")
+    replay.set_defaults(handler=cmd_replay)
+
+    enrich = commands.add_parser('enrich', help="Add typed columns parsed from the descriptions of a jobs CSV")
+    enrich.add_argument('--input', default="job_lists.csv")
+    enrich.add_argument('--output', default="job_lists_enriched.csv")
+    enrich.add_argument('--workers', type=int, help="Scan descriptions in this many processes")
+    enrich.add_argument('--locations', action='store_true',
+                        help="Also add suburb, region, state and postcode columns")
+    enrich.add_argument('--dedupe', action='store_true', help="Also add a cluster_id linking near-duplicate postings")
+    enrich.add_argument('--dedupe-threshold', type=float, default=0.7, metavar='SIMILARITY')
+    enrich.add_argument('--sqlite', metavar='PATH', help="With --dedupe, also link to near duplicates stored here")
+    enrich.set_defaults(handler=cmd_enrich)
+
+    gazetteer = commands.add_parser('gazetteer', help="Rebuild the location gazetteer from GeoNames postal codes")
+    gazetteer.add_argument('source', help="AU.txt from https://download.geonames.org/export/zip/AU.zip")
+    gazetteer.add_argument('--output', default=os.path.join("data", "au_gazetteer.csv"))
+    gazetteer.set_defaults(handler=cmd_gazetteer)
+
+    bench = commands.add_parser('bench', help="Check the startup time of the light commands")
+    bench.add_argument('--runs', type=int, default=5)
+    bench.add_argument('--max-ms', type=float, default=100,
+                       help="Fail if a command's median startup exceeds this (default: 100)")
+    bench.add_argument('--input', default="job_lists.csv", help="CSV used to time `stats`")
+    bench.add_argument('--importtime', type=int, nargs='?', const=15, metavar='N',
+                       help="Also list the N slowest imports")
+    bench.set_defaults(handler=cmd_bench)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
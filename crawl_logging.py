@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Logging Setup for Job Portal Crawlers
+Leveled, queue-backed logging with per-portal and per-worker context
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+import time
+
+
+LOGGER_NAME = "jobscraper"
+PROGRESS_LOGGER_NAME = LOGGER_NAME + ".progress"
+
+LOG_FORMAT = "%(asctime)s %(levelname)-7s [%(portal)s/%(worker)s] %(message)s"
+DATE_FORMAT = "%H:%M:%S"
+
+_listener = None
+
+
+class _ContextFilter(logging.Filter):
+    """Make sure every record carries portal/worker fields for the formatter"""
+
+    def filter(self, record):
+        if not hasattr(record, 'portal'):
+            record.portal = "main"
+        if not hasattr(record, 'worker'):
+            record.worker = "-"
+        return True
+
+
+class _QuietFilter(logging.Filter):
+    """Only let progress lines and warnings/errors through in quiet mode"""
+
+    def filter(self, record):
+        return record.name == PROGRESS_LOGGER_NAME or record.levelno >= logging.WARNING
+
+
+def setup_logging(level=logging.INFO, quiet=False, log_file=None):
+    """
+    Route all crawler logging through a queue to a background listener thread,
+    so the thread driving the browser never blocks on terminal or file I/O.
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    formatter = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
+    context_filter = _ContextFilter()
+
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(formatter)
+    console.addFilter(context_filter)
+    if quiet:
+        console.addFilter(_QuietFilter())
+    handlers = [console]
+
+    if log_file:
+        # The log file always receives the full record stream, even in quiet mode
+        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        file_handler.setFormatter(formatter)
+        file_handler.addFilter(context_filter)
+        handlers.append(file_handler)
+
+    log_queue = queue.SimpleQueue()
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.setLevel(level)
+    logger.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    logger.propagate = False
+
+    # Progress lines are always emitted, whatever the configured level
+    logging.getLogger(PROGRESS_LOGGER_NAME).setLevel(logging.INFO)
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+    return _listener
+
+
+def shutdown_logging():
+    """Flush queued records and stop the background listener"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def get_logger(portal=None, worker=None):
+    """Return a logger that tags every record with portal and worker context"""
+    return logging.LoggerAdapter(
+        logging.getLogger(LOGGER_NAME),
+        {'portal': portal or "main", 'worker': worker if worker is not None else "-"}
+    )
+
+
+def get_progress_logger(portal=None, worker=None):
+    """Return the progress logger, which stays visible in quiet mode"""
+    return logging.LoggerAdapter(
+        logging.getLogger(PROGRESS_LOGGER_NAME),
+        {'portal': portal or "main", 'worker': worker if worker is not None else "-"}
+    )
+
+
+class ProgressReporter:
+    """Emit periodic progress and throughput lines for a crawl"""
+
+    def __init__(self, portal=None, worker=None, interval=30):
+        self.log = get_progress_logger(portal, worker)
+        self.interval = interval
+        self.started = time.monotonic()
+        self.last_report = self.started
+        self.jobs_done = 0
+        self.jobs_failed = 0
+        self.page_number = 0
+
+    def page_started(self, page_number):
+        self.page_number = page_number
+
+    def job_done(self, failed=False):
+        """Count a processed job and report if the interval has elapsed"""
+        self.jobs_done += 1
+        if failed:
+            self.jobs_failed += 1
+        now = time.monotonic()
+        if now - self.last_report >= self.interval:
+            self.last_report = now
+            self.report()
+
+    def report(self, final=False):
+        elapsed = max(time.monotonic() - self.started, 1e-6)
+        rate = self.jobs_done / elapsed
+        self.log.info(
+            "%s %d jobs (%d failed), page %d, %.1fs elapsed, %.2f jobs/s",
+            "Finished:" if final else "Progress:",
+            self.jobs_done, self.jobs_failed, self.page_number, elapsed, rate
+        )
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Multi-Query Crawl Scheduler
+Runs a list of search definitions (per portal, state, occupation, visa subclass...)
+concurrently under one global request budget, with a shared dedupe index so a
+job found by several searches is fetched only once
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from crawl_logging import get_logger
+from portals import CRAWLERS, MAX_PAGES, create_crawler
+from frontier import Deadline
+from parse_pool import ParsePool
+from network_trace import NetworkTracer
+
+
+log = get_logger()
+
+QUERY_KEYS = {'portal', 'name', 'query', 'location', 'search_url', 'max_pages'}
+
+
+class RateLimiter:
+    """Thread-safe token bucket shared by every crawler in a run"""
+
+    def __init__(self, requests_per_minute, burst=1):
+        self.interval = 60.0 / requests_per_minute
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may be made"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) / self.interval)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) * self.interval
+            time.sleep(wait)
+
+
+class DedupeIndex:
+    """Thread-safe set of canonical job IDs claimed during a run"""
+
+    def __init__(self, job_ids=()):
+        self.job_ids = set(job_ids)
+        self.lock = threading.Lock()
+        self.duplicates = 0
+
+    def claim(self, job_id):
+        """Return True if job_id was not claimed yet (and claim it)"""
+        if job_id is None:
+            return True
+        with self.lock:
+            if job_id in self.job_ids:
+                self.duplicates += 1
+                return False
+            self.job_ids.add(job_id)
+            return True
+
+    def release(self, job_id):
+        """Forget a claim, e.g. after the fetch failed for good"""
+        with self.lock:
+            self.job_ids.discard(job_id)
+
+    def __len__(self):
+        return len(self.job_ids)
+
+
+def load_queries(path):
+    """
+    Load a scheduler config file:
+
+        {
+          "max_concurrency": 2,
+          "requests_per_minute": 40,
+          "queries": [
+            {"portal": "Jora", "name": "482 NSW", "query": "482 visa", "location": "NSW", "max_pages": 5},
+            {"portal": "Seek", "search_url": "https://www.seek.com.au/sponsorship-available-jobs"}
+          ]
+        }
+    """
+    with open(path, encoding='utf-8') as f:
+        config = json.load(f)
+    queries = config.get('queries')
+    if not queries:
+        raise ValueError(f"{path}: no queries defined")
+    for i, query in enumerate(queries, 1):
+        unknown = set(query) - QUERY_KEYS
+        if unknown:
+            raise ValueError(f"{path}: query {i} has unknown keys: {', '.join(sorted(unknown))}")
+        if query.get('portal') not in CRAWLERS:
+            raise ValueError(f"{path}: query {i} has unknown portal {query.get('portal')!r}")
+    return config
+
+
+def default_queries(portals):
+    """The classic one-search-per-portal crawl"""
+    return [{'portal': portal} for portal in portals]
+
+
+class CrawlScheduler:
+    """Run several search queries concurrently, sharing one rate budget and one dedupe index"""
+
+    def __init__(self, queries, max_concurrency=1, requests_per_minute=None, dedupe=None,
+                 time_budget=None, seen_job_ids=(), promoted='normal', listing_only=False, describe=None,
+                 fingerprints=None, unchanged_pages_stop=3, pipeline_window=1, parse_workers=None,
+                 use_extraction_script=True, selector_stats=None, trace_network=False, trace_dir=None,
+                 page_load_timeout=None, recycle_after_pages=None, max_session_rss_mb=None, archive=None,
+                 bounded_memory=False, sink=None, memory_profiler=None):
+        self.queries = queries
+        self.max_concurrency = max(1, max_concurrency)
+        self.rate_limiter = RateLimiter(requests_per_minute) if requests_per_minute else None
+        self.dedupe = dedupe if dedupe is not None else DedupeIndex()
+        # Deadline mode: every query shares one wall-clock budget (seconds)
+        self.time_budget = time_budget
+        self.seen_job_ids = seen_job_ids
+        self.promoted = promoted
+        self.deadline = None
+        # Listing-only mode: rows from listing cards, detail pages only where describe(row) asks
+        self.listing_only = listing_only
+        self.describe = describe
+        # Delta crawl: skip result pages unchanged since the previous run
+        self.fingerprints = fingerprints
+        self.unchanged_pages_stop = unchanged_pages_stop
+        # Tabs per browser loading detail pages ahead of extraction
+        self.pipeline_window = pipeline_window
+        # Worker processes parsing detail page HTML (None = parse in the crawler thread)
+        self.parse_workers = parse_workers
+        self.use_extraction_script = use_extraction_script
+        self.parse_pool = None
+        # Shared SelectorStats, so fallback chains learn across queries and runs
+        self.selector_stats = selector_stats
+        # CDP network tracing per crawler, slowest pages dumped to trace_dir
+        self.trace_network = trace_network
+        self.trace_dir = trace_dir
+        # Browser session limits (None keeps the crawler defaults)
+        self.page_load_timeout = page_load_timeout
+        self.recycle_after_pages = recycle_after_pages
+        self.max_session_rss_mb = max_session_rss_mb
+        # Shared PageArchive of raw detail pages
+        self.archive = archive
+        # Bounded-memory mode: rows streamed to a shared sink instead of returned
+        self.bounded_memory = bounded_memory
+        self.sink = sink
+        # Shared MemoryProfiler (tracemalloc is process-wide)
+        self.memory_profiler = memory_profiler
+
+    @classmethod
+    def from_config(cls, config, **overrides):
+        settings = {
+            'max_concurrency': config.get('max_concurrency', 1),
+            'requests_per_minute': config.get('requests_per_minute'),
+        }
+        settings.update({key: value for key, value in overrides.items() if value is not None})
+        return cls(config['queries'], **settings)
+
+    def query_name(self, index, query):
+        return query.get('name') or f"{query['portal']}#{index}"
+
+    def build_crawler(self, index, query):
+        kwargs = {key: query[key] for key in ('search_url', 'query', 'location') if query.get(key)}
+        crawler = create_crawler(query['portal'], worker_id=self.query_name(index, query), **kwargs)
+        crawler.rate_limiter = self.rate_limiter
+        crawler.dedupe = self.dedupe
+        crawler.fingerprints = self.fingerprints
+        crawler.unchanged_pages_stop = self.unchanged_pages_stop
+        crawler.pipeline_window = self.pipeline_window
+        crawler.parse_pool = self.parse_pool
+        crawler.use_extraction_script = self.use_extraction_script
+        crawler.archive = self.archive
+        crawler.bounded_memory = self.bounded_memory
+        crawler.sink = self.sink
+        crawler.memory_profiler = self.memory_profiler
+        if self.selector_stats is not None:
+            crawler.selector_stats = self.selector_stats
+        for setting in ('page_load_timeout', 'recycle_after_pages', 'max_session_rss_mb'):
+            if getattr(self, setting) is not None:
+                setattr(crawler, setting, getattr(self, setting))
+        if self.trace_network:
+            crawler.tracer = NetworkTracer(crawler.portal_name)
+            crawler.trace_dir = self.trace_dir
+        return crawler
+
+    def run_query(self, index, query):
+        crawler = self.build_crawler(index, query)
+        max_pages = query.get('max_pages', MAX_PAGES[crawler.portal_name])
+        if self.listing_only:
+            return crawler.scrape_listings(max_pages=max_pages, describe=self.describe, deadline=self.deadline)
+        if self.deadline is not None:
+            return crawler.scrape_jobs_by_priority(
+                self.deadline, max_pages=max_pages,
+                seen_job_ids=self.seen_job_ids, promoted=self.promoted
+            )
+        return crawler.scrape_jobs(max_pages=max_pages)
+
+    def run(self):
+        """Run every query and return the combined, deduplicated records (none with a sink)"""
+        all_jobs_data = []
+        if self.time_budget:
+            self.deadline = Deadline(self.time_budget)
+            log.info("⏱ Time budget: %.0f minutes", self.time_budget / 60)
+        log.info(
+            "Scheduling %d queries (concurrency %d, rate budget %s)",
+            len(self.queries), self.max_concurrency,
+            f"{60.0 / self.rate_limiter.interval:.0f} req/min" if self.rate_limiter else "unlimited"
+        )
+        if self.parse_workers:
+            self.parse_pool = ParsePool(self.parse_workers)
+            log.info("Parsing detail pages in %d worker processes", self.parse_workers)
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                futures = {
+                    executor.submit(self.run_query, index, query): self.query_name(index, query)
+                    for index, query in enumerate(self.queries, 1)
+                }
+                for future in as_completed(futures):
+                    name = futures[future]
+                    try:
+                        jobs = future.result()
+                    except Exception as e:
+                        log.error("✗ Query %s failed: %s", name, e)
+                        continue
+                    if jobs:
+                        all_jobs_data.extend(jobs)
+                        log.info("✓ Query %s completed. Jobs collected: %d", name, len(jobs))
+                    elif self.sink is not None:
+                        log.info("✓ Query %s completed", name)
+                    else:
+                        log.warning("⚠ Query %s returned no new jobs", name)
+        finally:
+            if self.parse_pool is not None:
+                self.parse_pool.shutdown()
+                self.parse_pool = None
+            if self.selector_stats is not None:
+                self.selector_stats.save()
+                for chain, selector, tries in self.selector_stats.dead_selectors():
+                    log.warning("⚠ Selector never matched in %d tries: %s %s", tries, chain, selector)
+        log.info("✓ %d unique jobs, %d duplicate listings skipped", len(self.dedupe), self.dedupe.duplicates)
+        return all_jobs_data
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Long-Running Crawl Daemon
+Keeps one warm browser session per query and recrawls by tier: the first few
+result pages, where new postings appear, every few minutes; deep pages and
+re-validation of stored jobs much less often. Results go to the SQLite job store.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from datetime import datetime, timedelta
+from crawl_logging import get_logger
+from portals import MAX_PAGES, create_crawler
+from resilience import CircuitBreaker, CircuitOpenError
+from job_ids import canonical_job_id
+from job_store import record_job_id
+
+
+log = get_logger()
+
+
+class RefreshTier:
+    """A range of result pages recrawled every `interval` seconds (last_page=None: the portal's max)"""
+
+    def __init__(self, name, first_page, last_page, interval):
+        self.name = name
+        self.first_page = first_page
+        self.last_page = last_page
+        self.interval = interval
+
+
+def default_tiers(head_pages=3, head_interval=5 * 60, deep_interval=6 * 3600):
+    return [
+        RefreshTier('head', 1, head_pages, head_interval),
+        RefreshTier('deep', head_pages + 1, None, deep_interval),
+    ]
+
+
+class CrawlDaemon:
+    """
+    Tiered recrawl loop over a list of queries (see crawl_scheduler.load_queries).
+
+    Every (query, tier) pair and every query's re-validation is a task with its
+    own next-due time; the loop always runs the most overdue task. Listed jobs
+    already in the store only get their last_seen refreshed; new ones have their
+    detail page fetched. Re-validation reloads the detail pages of stored jobs
+    that no listing has shown for `revalidate_after` seconds and only records
+    the outcome: last_checked, and expired once the page failed every retry.
+    """
+
+    def __init__(self, queries, store, tiers=None, revalidate_interval=24 * 3600,
+                 revalidate_after=3 * 86400, revalidate_batch=50):
+        self.queries = queries
+        self.store = store
+        self.tiers = tiers or default_tiers()
+        self.revalidate_interval = revalidate_interval
+        self.revalidate_after = revalidate_after
+        self.revalidate_batch = revalidate_batch
+        self.crawlers = []
+        self.stop_event = threading.Event()
+        self._tasks = []
+        self._counter = itertools.count()
+        # {crawler: {job_id: job_url}} re-validations whose outcome is not known yet
+        self.revalidating = {}
+
+    def stop(self):
+        """Ask the loop to finish the current task and exit"""
+        self.stop_event.set()
+
+    def build_crawlers(self):
+        for index, query in enumerate(self.queries, 1):
+            kwargs = {key: query[key] for key in ('search_url', 'query', 'location') if query.get(key)}
+            crawler = create_crawler(query['portal'], worker_id=query.get('name') or f"{query['portal']}#{index}", **kwargs)
+            crawler.max_pages = query.get('max_pages', MAX_PAGES[crawler.portal_name])
+            self.crawlers.append(crawler)
+
+    def schedule(self, due, crawler, task, tier=None):
+        heapq.heappush(self._tasks, (due, next(self._counter), crawler, task, tier))
+
+    def run(self):
+        """Run until stop() is called (or SIGTERM/Ctrl-C in main.py)"""
+        self.build_crawlers()
+        now = time.monotonic()
+        for crawler in self.crawlers:
+            for tier in self.tiers:
+                self.schedule(now, crawler, 'refresh', tier)
+            self.schedule(now + self.revalidate_interval, crawler, 'revalidate')
+        log.info("Daemon started: %d queries, tiers %s", len(self.crawlers), ", ".join(
+            f"{tier.name} every {tier.interval / 60:.0f} min" for tier in self.tiers
+        ))
+        try:
+            while not self.stop_event.is_set():
+                due, _, crawler, task, tier = heapq.heappop(self._tasks)
+                if self.stop_event.wait(max(0.0, due - time.monotonic())):
+                    break
+                interval = self.run_task(crawler, task, tier)
+                self.schedule(time.monotonic() + interval, crawler, task, tier)
+        finally:
+            for crawler in self.crawlers:
+                crawler.close_session()
+            log.info("Daemon stopped")
+
+    def run_task(self, crawler, task, tier):
+        """Run one task with a warm session; returns the delay until it is due again"""
+        from selenium.common.exceptions import WebDriverException
+        
+        interval = tier.interval if tier else self.revalidate_interval
+        try:
+            if crawler.driver is None:
+                crawler.start_session()
+            if task == 'refresh':
+                self.refresh(crawler, tier)
+            else:
+                self.revalidate(crawler)
+            crawler.process_retries()
+        except CircuitOpenError as e:
+            # Back off for a full interval, then start with a fresh breaker
+            crawler.log.error("✗ %s keeps failing, pausing %s: %s", crawler.portal_name, task, e)
+            crawler.circuit_breaker = CircuitBreaker()
+        except WebDriverException as e:
+            # A dead or wedged browser: replace it on the next task
+            crawler.log.error("✗ Browser session failed, restarting it: %s", e)
+            crawler.close_session()
+            interval = min(interval, 60)
+        except Exception as e:
+            crawler.log.exception("✗ Daemon task %s failed: %s", task, e)
+        finally:
+            self.flush(crawler)
+        return interval
+
+    def refresh(self, crawler, tier):
+        last_page = min(tier.last_page or crawler.max_pages, crawler.max_pages)
+        new_jobs = 0
+        for page_number in range(tier.first_page, last_page + 1):
+            if self.stop_event.is_set():
+                return
+            job_cards = crawler.load_listing_page(page_number)
+            if not job_cards:
+                break
+            job_urls = {}
+            for card in job_cards:
+                job_url = crawler.extract_job_url(card)
+                job_id = canonical_job_id(job_url, crawler.portal_name)
+                if job_id:
+                    job_urls[job_id] = job_url
+            known = self.store.known_job_ids(job_urls)
+            self.store.touch(known)
+            new_urls = [job_url for job_id, job_url in job_urls.items() if job_id not in known]
+            if crawler.pipeline_window > 1:
+                crawler.process_jobs_pipelined(new_urls)
+            else:
+                for job_url in new_urls:
+                    crawler.process_job(job_url)
+            new_jobs += len(new_urls)
+            self.flush(crawler)
+        crawler.log.info("✓ %s refresh: %d new jobs", tier.name, new_jobs)
+
+    def revalidate(self, crawler):
+        seen_before = datetime.now() - timedelta(seconds=self.revalidate_after)
+        stale = self.store.stale_jobs(crawler.portal_name, seen_before, self.revalidate_batch)
+        pending = self.revalidating.setdefault(crawler, {})
+        for row in stale:
+            if self.stop_event.is_set():
+                return
+            # A failed load is retried through the retry queue; flush records the outcome
+            pending[row['job_id']] = row['job_url']
+            crawler.process_job(row['job_url'])
+        crawler.log.info("✓ Re-checked %d stored jobs", len(stale))
+
+    def flush(self, crawler):
+        """Move the crawler's collected records into the store and record re-validation outcomes"""
+        records, crawler.all_jobs_data = crawler.all_jobs_data, []
+        pending = self.revalidating.get(crawler)
+        if pending:
+            # A re-validated job was not listed: confirm it without touching last_seen
+            job_ids = [record_job_id(record) for record in records]
+            found = {job_id for job_id in job_ids if job_id in pending}
+            records = [record for record, job_id in zip(records, job_ids) if job_id not in found]
+            gone = {
+                job_id for job_id in (canonical_job_id(job_url, crawler.portal_name)
+                                      for job_url, _ in crawler.retry_queue.exhausted)
+                if job_id in pending and job_id not in found
+            }
+            for job_id in found | gone:
+                del pending[job_id]
+            self.store.record_revalidation(found, expired=False)
+            self.store.record_revalidation(gone, expired=True)
+            if found or gone:
+                crawler.log.info("✓ Re-validated %d stored jobs, %d gone", len(found) + len(gone), len(gone))
+        if records:
+            self.store.upsert(records)
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+In-Browser DOM Scripts
+JavaScript run through driver.execute_script, so that only the needed values
+travel over WebDriver instead of the whole serialized page
+"""
+
+
+# Helpers shared by all extraction scripts:
+#   text(el)      - like BeautifulSoup's el.get_text(strip=True): every text node
+#                   stripped and concatenated, skipping <script>/<style> contents
+#   first(sels)   - first element matching the selectors, tried in order
+DOM_TEXT_HELPERS = r"""
+function text(el) {
+    if (!el) { return null; }
+    var parts = [];
+    var walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT, {
+        acceptNode: function (node) {
+            var parent = node.parentNode && node.parentNode.nodeName;
+            return (parent === 'SCRIPT' || parent === 'STYLE')
+                ? NodeFilter.FILTER_REJECT : NodeFilter.FILTER_ACCEPT;
+        }
+    });
+    while (walker.nextNode()) {
+        var value = walker.currentNode.nodeValue.trim();
+        if (value) { parts.push(value); }
+    }
+    return parts.join('');
+}
+function first(selectors) {
+    for (var i = 0; i < selectors.length; i++) {
+        var el = document.querySelector(selectors[i]);
+        if (el) { return el; }
+    }
+    return null;
+}
+"""
+
+
+def build_extraction_script(body):
+    """
+    Wrap a portal's extraction code with the shared helpers. The body must
+    `return` a plain object of field name -> string (or null for "not found").
+    """
+    return DOM_TEXT_HELPERS + body
+
+
+# Resolve many candidate selectors in one round-trip.
+#   arguments[0] - list of CSS selectors
+#   arguments[1] - attribute names to read from each match
+#   arguments[2] - optional lowercase text; <a> elements whose text contains it
+#                  are returned under "text_matches"
+#   arguments[3] - maximum matches returned per selector
+# Each match carries the element itself (returned to Python as a WebElement),
+# the requested attributes, its stripped text, and displayed/enabled flags.
+PROBE_SELECTORS_SCRIPT = r"""
+var selectors = arguments[0], attributes = arguments[1], linkText = arguments[2], limit = arguments[3];
+function describe(el) {
+    var attrs = {};
+    for (var i = 0; i < attributes.length; i++) {
+        attrs[attributes[i]] = el.getAttribute(attributes[i]);
+    }
+    if (attrs.hasOwnProperty('href')) { attrs.href = el.href || attrs.href; }
+    return {
+        element: el,
+        attributes: attrs,
+        text: (el.innerText || el.textContent || '').trim(),
+        displayed: el.getClientRects().length > 0,
+        enabled: !el.disabled && el.getAttribute('aria-disabled') !== 'true'
+    };
+}
+var result = {selectors: {}, text_matches: []};
+for (var s = 0; s < selectors.length; s++) {
+    var matches = [];
+    try {
+        var found = document.querySelectorAll(selectors[s]);
+        for (var j = 0; j < found.length && j < limit; j++) { matches.push(describe(found[j])); }
+    } catch (e) {
+        matches = null;  // invalid selector
+    }
+    result.selectors[selectors[s]] = matches;
+}
+if (linkText) {
+    var links = document.getElementsByTagName('a');
+    for (var k = 0; k < links.length && result.text_matches.length < limit; k++) {
+        var linkLabel = (links[k].innerText || links[k].textContent || '').toLowerCase();
+        if (linkLabel.indexOf(linkText) !== -1) { result.text_matches.push(describe(links[k])); }
+    }
+}
+return result;
+"""
+
+
+# Start navigating the current tab without waiting for the page to load (unlike
+# driver.get). The marker disappears once the new document has replaced the old one.
+START_NAVIGATION_SCRIPT = r"""
+window.__crawlerNavigationPending = true;
+window.location.href = arguments[0];
+"""
+
+# True once the navigation started by START_NAVIGATION_SCRIPT has loaded
+NAVIGATION_DONE_SCRIPT = r"""
+return window.__crawlerNavigationPending === undefined && document.readyState === 'complete';
+"""
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Description Enrichment
+Scans each job description once with a single precompiled multi-pattern regex
+and turns the facts consumers filter on into typed columns: visa subclasses,
+years of experience, employment type and weekday availability
+"""
+
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+
+DAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+# One case-insensitive alternation with a named group per fact; finditer walks
+# the text once and m.lastgroup says which fact matched. Inner groups are named
+# too, so every group name is unique across the pattern.
+#
+# Matches may only start at the beginning of a word, or where Jora's stripped
+# text glues words together: a lowercase letter followed by a capital or a
+# digit ("AfternoonTuesday: Morning", "MorningMore than", "Afternoon2-3 years").
+# Matches must also start on a character some branch can start with. That one
+# cheap check lets the engine skip almost every position instead of trying all
+# branches.
+MATCH_START = r"(?:(?<![a-z\d])|(?-i:(?<=[a-z])(?=[A-Z\d])))(?=[\dacdfmopstvw])"
+
+# Requirements name the work the years are for ("3 years of experience",
+# "2+ years as a chef"); "for over 20 years" is company history
+EXPERIENCE_CONTEXT = r"['’]?\s*(?:of\s+|in\s+)?(?:[\w/-]+\s+){0,4}?(?:experience|exp\b|work|as\b)"
+
+# Larger figures are company history ("40 years' experience in the marketplace")
+MAX_REQUIRED_YEARS = 15
+
+# Text just before a match that negates it ("no sponsorship available", "not a
+# casual role", "without visa sponsorship", "no weekends")
+NEGATION = re.compile(
+    r"\b(?:no|not|non|never|without)[\s-]+(?:(?:a|an|the|any|offer(?:ing)?|provid(?:e|ing)|visa)\s+)?$",
+    re.IGNORECASE
+)
+NEGATION_WINDOW = 30
+NEGATABLE = {'sponsorship', 'employment', 'weekend', 'flexible'}
+
+ENRICHMENT_PATTERN = re.compile(MATCH_START + r"""(?:
+    (?P<subclass>subclass\s*\(?\s*(?P<subclass_number>\d{3})\b)
+  | (?P<numbered_visa>(?P<visa_number>482|494|186|187|189|190|191|407|408|491)\s*(?:\([^)]{0,40}\)\s*)?visa)
+  | (?P<dama>dama\b|designated\s+area\s+migration\s+agreement)
+  | (?P<tss>tss\b|temporary\s+skill\s+shortage|skills\s+in\s+demand)
+  | (?P<sponsorship>visa\s+sponsorship(?!\s+(?:is\s+)?not\b)|sponsorship\s+(?:is\s+)?available
+        |will\s+sponsor|visa\s+will\s+be\s+provided)
+  | (?P<experience_range>(?P<range_min>\d{1,2})\s*(?:-|–|to)\s*(?P<range_max>\d{1,2})\+?\s*years?)
+  | (?P<experience_min>(?:more\s+than|at\s+least|minimum(?:\s+of)?|over)\s+(?P<min_years>\d{1,2})\s*\+?\s*years?""" + EXPERIENCE_CONTEXT + r""")
+  | (?P<experience_plus>(?P<plus_years>\d{1,2})\+\s*years?""" + EXPERIENCE_CONTEXT + r""")
+  | (?P<experience_years>(?P<years>\d{1,2})\s*years?(?:'|’)?\s+(?:of\s+)?(?:[\w-]+\s+){0,3}?experience)
+  | (?P<employment>(?P<employment_kind>full[\s-]?time|part[\s-]?time|casual|contract|fixed[\s-]?term
+        |temporary(?!\s+(?:work\s+)?visa)|permanent(?!\s+(?:resid|visa)))\b)
+  | (?P<day>(?P<day_name>monday|tuesday|wednesday|thursday|friday|saturday|sunday)\s*:\s*(?:morning|afternoon|evening))
+  | (?P<weekend>weekends?\b)
+  | (?P<flexible>flexible\s+hours)
+)""", re.VERBOSE | re.IGNORECASE)
+
+EMPLOYMENT_TYPES = {
+    'fulltime': 'full_time',
+    'parttime': 'part_time',
+    'casual': 'casual',
+    'contract': 'contract',
+    'temporary': 'temporary',
+    'permanent': 'permanent',
+    'fixedterm': 'contract',
+}
+
+ENRICHED_COLUMNS = (
+    'visa_subclasses', 'sponsorship', 'experience_min_years', 'experience_max_years',
+    'employment_type', 'available_days', 'works_weekends', 'flexible_hours',
+)
+
+
+def enrich_description(description):
+    """Typed facts from one description (a dict with the ENRICHED_COLUMNS keys)"""
+    visas = []
+    employment = []
+    days = []
+    sponsorship = works_weekends = flexible = False
+    experience = None
+    for match in ENRICHMENT_PATTERN.finditer(description or ""):
+        kind = match.lastgroup
+        if kind in NEGATABLE and NEGATION.search(description, max(0, match.start() - NEGATION_WINDOW), match.start()):
+            continue
+        if kind == 'subclass':
+            visas.append(match.group('subclass_number'))
+        elif kind == 'numbered_visa':
+            visas.append(match.group('visa_number'))
+        elif kind == 'dama':
+            visas.append('DAMA')
+        elif kind == 'tss':
+            visas.append('482')
+        elif kind == 'sponsorship':
+            sponsorship = True
+        elif kind == 'employment':
+            employment.append(EMPLOYMENT_TYPES[re.sub(r'[\s-]', '', match.group('employment_kind')).lower()])
+        elif kind == 'day':
+            days.append(match.group('day_name').capitalize())
+        elif kind == 'weekend':
+            works_weekends = True
+        elif kind == 'flexible':
+            flexible = True
+        elif experience is not None:
+            # Only the first experience requirement counts (e.g. Jora's "Job summary")
+            continue
+        elif kind == 'experience_range':
+            experience = (int(match.group('range_min')), int(match.group('range_max')))
+        elif kind == 'experience_min':
+            experience = (int(match.group('min_years')), None)
+        elif kind == 'experience_plus':
+            experience = (int(match.group('plus_years')), None)
+        elif kind == 'experience_years':
+            years = int(match.group('years'))
+            experience = (years, years)
+        if experience and experience[0] > MAX_REQUIRED_YEARS:
+            # Company history, not a requirement: keep looking
+            experience = None
+
+    if days:
+        works_weekends = works_weekends or 'Saturday' in days or 'Sunday' in days
+    return {
+        'visa_subclasses': ";".join(sorted(set(visas))),
+        'sponsorship': sponsorship or bool(visas),
+        'experience_min_years': experience[0] if experience else None,
+        'experience_max_years': experience[1] if experience else None,
+        'employment_type': ";".join(dict.fromkeys(employment)),
+        'available_days': ",".join(day[:3] for day in DAYS if day in days),
+        'works_weekends': works_weekends,
+        'flexible_hours': flexible,
+    }
+
+
+def enrich_records(records, workers=None, chunksize=64):
+    """
+    Add the enriched columns to every record (in place) and return the records.
+    With workers, descriptions are scanned in that many processes; only the
+    description strings and the small result dicts cross process boundaries.
+    """
+    descriptions = [record.get('description') for record in records]
+    if workers and workers > 1 and len(records) > chunksize:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(enrich_description, descriptions, chunksize=chunksize)
+            for record, facts in zip(records, results):
+                record.update(facts)
+    else:
+        for record, description in zip(records, descriptions):
+            record.update(enrich_description(description))
+    return records
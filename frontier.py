@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Crawl Frontier and Time Budget
+Orders discovered job URLs by how useful they are to fetch first, so a crawl
+with a fixed deadline spends its time on the freshest, not-yet-seen jobs
+"""
+
+import csv
+import heapq
+import itertools
+import os
+import time
+from job_ids import canonical_job_id
+
+
+PROMOTED_CHOICES = ('first', 'last', 'normal')
+
+
+class Deadline:
+    """A wall-clock crawl budget"""
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self):
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self):
+        return self.remaining() <= 0
+
+    def fits(self, estimate):
+        """True if a step expected to take `estimate` seconds can finish in time"""
+        return self.remaining() > estimate
+
+
+def load_seen_job_ids(*csv_paths):
+    """Canonical IDs of every job in earlier output files (missing files are ignored)"""
+    seen = set()
+    for path in csv_paths:
+        if not path or not os.path.exists(path):
+            continue
+        with open(path, newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                job_id = canonical_job_id(row.get('job_url'), row.get('source'))
+                if job_id:
+                    seen.add(job_id)
+    return seen
+
+
+class Frontier:
+    """
+    Priority queue of job URLs waiting to be fetched.
+
+    Ordering, most useful first:
+      1. jobs not seen in earlier runs before already-known ones
+      2. promoted/sponsored cards first or last, if asked for
+      3. earlier listing pages (newest postings) before deep pages
+      4. position on the listing page
+    """
+
+    def __init__(self, seen_job_ids=(), promoted='normal'):
+        if promoted not in PROMOTED_CHOICES:
+            raise ValueError(f"promoted must be one of {PROMOTED_CHOICES}")
+        self.seen_job_ids = seen_job_ids
+        self.promoted = promoted
+        self._heap = []
+        self._queued = set()
+        self._counter = itertools.count()
+
+    def __len__(self):
+        return len(self._heap)
+
+    def priority(self, job_id, page_number, position, promoted):
+        seen = 1 if job_id in self.seen_job_ids else 0
+        if self.promoted == 'first':
+            promoted_rank = 0 if promoted else 1
+        elif self.promoted == 'last':
+            promoted_rank = 1 if promoted else 0
+        else:
+            promoted_rank = 0
+        return (seen, promoted_rank, page_number, position)
+
+    def push(self, job_url, job_id, page_number, position, promoted=False):
+        """Queue a job URL; returns False if the same job is already queued"""
+        key = job_id or job_url
+        if key in self._queued:
+            return False
+        self._queued.add(key)
+        entry = {
+            'job_url': job_url,
+            'job_id': job_id,
+            'page_number': page_number,
+            'position': position,
+            'promoted': promoted,
+            'seen': job_id in self.seen_job_ids,
+        }
+        heapq.heappush(self._heap, (self.priority(job_id, page_number, position, promoted), next(self._counter), entry))
+        return True
+
+    def pop(self):
+        """Return the highest-priority entry, or None when empty"""
+        if not self._heap:
+            return None
+        return heapq.heappop(self._heap)[2]
+
+    def unseen_count(self):
+        return sum(1 for _, _, entry in self._heap if not entry['seen'])
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Canonical Job IDs
+Job URLs carry per-search tracking parameters (sol_key, tk, sr, ...), so the
+same posting gets a different URL on every run. These helpers reduce a URL to
+a stable portal-qualified ID that can be used for dedupe and merging.
+"""
+
+import re
+from urllib.parse import urlsplit
+
+
+# Seek: https://www.seek.com.au/job/86068025?type=standard&ref=...
+SEEK_JOB_ID = re.compile(r'/job/(\d+)')
+# Jora: https://au.jora.com/job/Motor-Mechanic-338b687bfb202c30ae08c9481bfe4a72?...
+JORA_JOB_ID = re.compile(r'/job/(?:[^/?#]*-)?([0-9a-f]{32})(?:[/?#]|$)')
+
+
+def portal_from_url(job_url):
+    """Guess the portal name from a job URL"""
+    host = urlsplit(job_url).netloc.lower()
+    if 'seek.com' in host:
+        return "Seek"
+    if 'jora.com' in host:
+        return "Jora"
+    return None
+
+
+def canonical_job_id(job_url, source=None):
+    """
+    Return a stable ID such as 'seek:86068025' or 'jora:338b687b...'.
+    Unknown URLs fall back to '<source>:<host+path>' with query and fragment removed.
+    Returns None for missing URLs.
+    """
+    if not job_url or job_url == "N/A":
+        return None
+    portal = portal_from_url(job_url) or source or "unknown"
+
+    if portal == "Seek":
+        match = SEEK_JOB_ID.search(job_url)
+        if match:
+            return f"seek:{match.group(1)}"
+    elif portal == "Jora":
+        match = JORA_JOB_ID.search(job_url)
+        if match:
+            return f"jora:{match.group(1)}"
+
+    parts = urlsplit(job_url)
+    return f"{portal.lower()}:{parts.netloc}{parts.path}"
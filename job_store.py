@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+"""
+SQLite Job Store
+Upserts scraped records into an indexed SQLite database keyed by canonical job
+ID. Summary tables (jobs per portal, per state, per day) are kept up to date by
+triggers as rows arrive, so dashboards never have to rescan the jobs table or
+reparse job_lists.csv. An FTS5 index over title, company and description is
+maintained the same way for ranked full-text search.
+"""
+
+import hashlib
+import sqlite3
+from datetime import datetime
+from job_ids import canonical_job_id
+from locations import normalize_location
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    title TEXT,
+    company TEXT,
+    location TEXT,
+    suburb TEXT,
+    region TEXT,
+    state TEXT NOT NULL,
+    postcode TEXT,
+    salary TEXT,
+    description TEXT,
+    job_url TEXT,
+    scrape_date TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    last_changed TEXT,
+    last_checked TEXT,
+    expired INTEGER,
+    cluster_id TEXT,
+    visa_subclasses TEXT,
+    sponsorship INTEGER,
+    experience_min_years INTEGER,
+    experience_max_years INTEGER,
+    employment_type TEXT,
+    available_days TEXT,
+    works_weekends INTEGER,
+    flexible_hours INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_source ON jobs (source);
+CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs (company);
+CREATE INDEX IF NOT EXISTS idx_jobs_location ON jobs (location);
+CREATE INDEX IF NOT EXISTS idx_jobs_scrape_date ON jobs (scrape_date);
+
+CREATE TABLE IF NOT EXISTS jobs_per_source (source TEXT PRIMARY KEY, jobs INTEGER NOT NULL DEFAULT 0);
+CREATE TABLE IF NOT EXISTS jobs_per_state (state TEXT PRIMARY KEY, jobs INTEGER NOT NULL DEFAULT 0);
+-- New jobs per day (by the date a job was first seen)
+CREATE TABLE IF NOT EXISTS jobs_per_day (day TEXT PRIMARY KEY, jobs INTEGER NOT NULL DEFAULT 0);
+
+CREATE TRIGGER IF NOT EXISTS jobs_summary_insert AFTER INSERT ON jobs BEGIN
+    INSERT INTO jobs_per_source (source, jobs) VALUES (new.source, 1)
+        ON CONFLICT (source) DO UPDATE SET jobs = jobs + 1;
+    INSERT INTO jobs_per_state (state, jobs) VALUES (new.state, 1)
+        ON CONFLICT (state) DO UPDATE SET jobs = jobs + 1;
+    INSERT INTO jobs_per_day (day, jobs) VALUES (substr(new.first_seen, 1, 10), 1)
+        ON CONFLICT (day) DO UPDATE SET jobs = jobs + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS jobs_summary_delete AFTER DELETE ON jobs BEGIN
+    UPDATE jobs_per_source SET jobs = jobs - 1 WHERE source = old.source;
+    UPDATE jobs_per_state SET jobs = jobs - 1 WHERE state = old.state;
+    UPDATE jobs_per_day SET jobs = jobs - 1 WHERE day = substr(old.first_seen, 1, 10);
+END;
+
+CREATE TRIGGER IF NOT EXISTS jobs_summary_first_seen AFTER UPDATE OF first_seen ON jobs
+WHEN substr(old.first_seen, 1, 10) IS NOT substr(new.first_seen, 1, 10) BEGIN
+    UPDATE jobs_per_day SET jobs = jobs - 1 WHERE day = substr(old.first_seen, 1, 10);
+    INSERT INTO jobs_per_day (day, jobs) VALUES (substr(new.first_seen, 1, 10), 1)
+        ON CONFLICT (day) DO UPDATE SET jobs = jobs + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS jobs_summary_state AFTER UPDATE OF state ON jobs
+WHEN old.state IS NOT new.state BEGIN
+    UPDATE jobs_per_state SET jobs = jobs - 1 WHERE state = old.state;
+    INSERT INTO jobs_per_state (state, jobs) VALUES (new.state, 1)
+        ON CONFLICT (state) DO UPDATE SET jobs = jobs + 1;
+END;
+"""
+
+# The columns of enrichment.enrich_description, stored for runs with --enrich
+ENRICHED_COLUMN_TYPES = {
+    'visa_subclasses': 'TEXT',
+    'sponsorship': 'INTEGER',
+    'experience_min_years': 'INTEGER',
+    'experience_max_years': 'INTEGER',
+    'employment_type': 'TEXT',
+    'available_days': 'TEXT',
+    'works_weekends': 'INTEGER',
+    'flexible_hours': 'INTEGER',
+}
+
+# Location, last_changed, revalidation, cluster and enrichment columns were added after the
+# first release: older databases get them (ALTER TABLE in JobStore.__init__)
+# and these indexes when opened
+LOCATION_SCHEMA = """
+CREATE INDEX IF NOT EXISTS idx_jobs_state ON jobs (state);
+CREATE INDEX IF NOT EXISTS idx_jobs_region ON jobs (region);
+CREATE INDEX IF NOT EXISTS idx_jobs_postcode ON jobs (postcode);
+CREATE INDEX IF NOT EXISTS idx_jobs_cluster ON jobs (cluster_id);
+"""
+ADDED_COLUMNS = (
+    ('suburb', 'TEXT'), ('region', 'TEXT'), ('postcode', 'TEXT'), ('last_changed', 'TEXT'),
+    ('last_checked', 'TEXT'), ('expired', 'INTEGER'), ('cluster_id', 'TEXT'),
+) + tuple(ENRICHED_COLUMN_TYPES.items())
+
+# Full-text index over title, company and description. It is an external
+# content table (the text lives only in `jobs`), kept in step by triggers, so
+# every upsert updates it incrementally. Updates that don't change the
+# indexed text (e.g. a refreshed last_seen) leave it alone.
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+    title, company, description,
+    content='jobs', content_rowid='rowid', tokenize='porter unicode61 remove_diacritics 2'
+);
+
+CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN
+    INSERT INTO jobs_fts (rowid, title, company, description)
+        VALUES (new.rowid, new.title, new.company, new.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN
+    INSERT INTO jobs_fts (jobs_fts, rowid, title, company, description)
+        VALUES ('delete', old.rowid, old.title, old.company, old.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS jobs_fts_update AFTER UPDATE OF title, company, description ON jobs
+WHEN old.title IS NOT new.title OR old.company IS NOT new.company OR old.description IS NOT new.description
+BEGIN
+    INSERT INTO jobs_fts (jobs_fts, rowid, title, company, description)
+        VALUES ('delete', old.rowid, old.title, old.company, old.description);
+    INSERT INTO jobs_fts (rowid, title, company, description)
+        VALUES (new.rowid, new.title, new.company, new.description);
+END;
+"""
+
+# MinHash signatures and LSH band buckets of stored jobs (near_duplicates.py),
+# so new postings are matched against the whole history, not just their run
+CLUSTER_SCHEMA = """
+CREATE TABLE IF NOT EXISTS job_signatures (job_id TEXT PRIMARY KEY, signature BLOB NOT NULL);
+CREATE TABLE IF NOT EXISTS lsh_buckets (
+    band INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,
+    job_id TEXT NOT NULL,
+    PRIMARY KEY (band, bucket, job_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_lsh_buckets_job ON lsh_buckets (job_id);
+"""
+
+# Title matches weigh most, then company, then description
+SEARCH = """
+SELECT jobs.job_id, jobs.source, jobs.title, jobs.company, jobs.location, jobs.scrape_date, jobs.job_url,
+       bm25(jobs_fts, 10.0, 5.0, 1.0) AS rank,
+       snippet(jobs_fts, 2, '[', ']', '…', 12) AS snippet
+FROM jobs_fts JOIN jobs ON jobs.rowid = jobs_fts.rowid
+WHERE jobs_fts MATCH :query
+  AND (:source IS NULL OR jobs.source = :source COLLATE NOCASE)
+  AND (:since IS NULL OR jobs.scrape_date >= :since)
+  AND (:until IS NULL OR jobs.scrape_date <= :until)
+ORDER BY rank
+LIMIT :limit
+"""
+
+# Rows at least as recent as the stored job refresh it; values the record
+# lacks (None: 'N/A' or empty) keep what is stored, and last_changed moves
+# only when a field really changed. Older rows (importing an earlier file)
+# only move first_seen back, with WIDEN_FIRST_SEEN. Enriched columns are
+# replaced by an enriched record's, and cleared when an unenriched record
+# brings a new description they no longer describe.
+UPSERT = """
+INSERT INTO jobs (job_id, source, title, company, location, suburb, region, state, postcode,
+                  salary, description, job_url, scrape_date, first_seen, last_seen, last_changed,
+                  cluster_id, {enriched_columns})
+VALUES (:job_id, :source, COALESCE(:title, 'N/A'), COALESCE(:company, 'N/A'), COALESCE(:location, 'N/A'),
+        :suburb, :region, :state, :postcode, COALESCE(:salary, 'N/A'), COALESCE(:description, 'N/A'),
+        :job_url, :scrape_date, :seen, :seen, :seen, :cluster_id, {enriched_values})
+ON CONFLICT (job_id) DO UPDATE SET
+    cluster_id = COALESCE(:cluster_id, cluster_id),
+    {enriched_updates},
+    title = COALESCE(:title, title),
+    company = COALESCE(:company, company),
+    location = COALESCE(:location, location),
+    suburb = CASE WHEN :location IS NULL THEN suburb ELSE excluded.suburb END,
+    region = CASE WHEN :location IS NULL THEN region ELSE excluded.region END,
+    state = CASE WHEN :location IS NULL THEN state ELSE excluded.state END,
+    postcode = CASE WHEN :location IS NULL THEN postcode ELSE excluded.postcode END,
+    salary = COALESCE(:salary, salary),
+    description = COALESCE(:description, description),
+    job_url = COALESCE(excluded.job_url, job_url),
+    last_changed = CASE
+        WHEN title IS NOT COALESCE(:title, title)
+          OR company IS NOT COALESCE(:company, company)
+          OR location IS NOT COALESCE(:location, location)
+          OR salary IS NOT COALESCE(:salary, salary)
+          OR description IS NOT COALESCE(:description, description)
+        THEN excluded.last_seen ELSE last_changed END,
+    scrape_date = excluded.scrape_date,
+    last_seen = excluded.last_seen,
+    expired = NULL
+WHERE excluded.last_seen >= jobs.last_seen
+""".format(
+    enriched_columns=", ".join(ENRICHED_COLUMN_TYPES),
+    enriched_values=", ".join(f":{column}" for column in ENRICHED_COLUMN_TYPES),
+    enriched_updates=",\n    ".join(
+        f"{column} = CASE WHEN :enriched THEN excluded.{column} "
+        f"WHEN :description IS NOT NULL AND :description IS NOT description THEN NULL ELSE {column} END"
+        for column in ENRICHED_COLUMN_TYPES
+    ),
+)
+
+WIDEN_FIRST_SEEN = "UPDATE jobs SET first_seen = :seen WHERE job_id = :job_id AND first_seen > :seen"
+
+FIELDS = ('title', 'company', 'location', 'salary', 'description')
+
+
+def missing_to_none(value):
+    """None for the placeholders scrapers write when a field is missing ('N/A', '', NaN)"""
+    if value is None or value != value or str(value).strip() in ("", "N/A"):
+        return None
+    return value
+
+
+def enriched_value(value, kind):
+    """An enriched column as stored: flags and year counts as integers (also from CSV text), text as is"""
+    if value is None or value != value or value == "":
+        return None
+    if kind == 'TEXT':
+        return str(value)
+    if isinstance(value, str):
+        if value.lower() in ('true', 'false'):
+            return int(value.lower() == 'true')
+        value = float(value)
+    return int(value)
+
+
+def record_job_id(record):
+    """Canonical job ID, or a content hash for rows without a usable job URL"""
+    source = record.get('source') or 'N/A'
+    job_id = canonical_job_id(record.get('job_url'), source)
+    if job_id:
+        return job_id
+    key = "|".join(str(record.get(field) or "") for field in ('title', 'company', 'location'))
+    return f"{source.lower()}:sha1:{hashlib.sha1(key.encode('utf-8')).hexdigest()}"
+
+
+class JobStore:
+    """Indexed SQLite output backend with incrementally maintained summaries"""
+
+    def __init__(self, path="jobs.db"):
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        columns = {row['name'] for row in self.conn.execute("PRAGMA table_info(jobs)")}
+        for column, kind in ADDED_COLUMNS:
+            if column not in columns:
+                self.conn.execute(f"ALTER TABLE jobs ADD COLUMN {column} {kind}")
+        if 'last_changed' not in columns:
+            with self.conn:
+                self.conn.execute("UPDATE jobs SET last_changed = first_seen")
+        self.conn.executescript(LOCATION_SCHEMA)
+        self.conn.executescript(CLUSTER_SCHEMA)
+        has_fts = self.conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'jobs_fts'").fetchone()
+        self.conn.executescript(FTS_SCHEMA)
+        if not has_fts:
+            # Index the jobs stored before the full-text index existed
+            with self.conn:
+                self.conn.execute("INSERT INTO jobs_fts (jobs_fts) VALUES ('rebuild')")
+
+    def close(self):
+        self.conn.close()
+
+    def upsert(self, records, scraped_at=None):
+        """
+        Merge records seen at scraped_at (default: now) into the store in one
+        transaction; returns (inserted, updated). Known jobs keep their
+        first_seen; see UPSERT for how fields are refreshed. Records with the
+        enrich_description columns (and a description) store them too, and a
+        cluster_id from near_duplicates.assign_clusters is kept.
+        """
+        seen = (scraped_at or datetime.now()).isoformat(timespec='seconds')
+        rows = []
+        for record in records:
+            row = {field: missing_to_none(record.get(field)) for field in FIELDS}
+            suburb, region, state, postcode = normalize_location(row['location'])
+            row.update(
+                job_id=record_job_id(record),
+                source=record.get('source') or 'N/A',
+                suburb=suburb,
+                region=region,
+                state=state or 'Unknown',
+                postcode=postcode,
+                job_url=missing_to_none(record.get('job_url')),
+                scrape_date=seen[:10],
+                seen=seen,
+                cluster_id=missing_to_none(record.get('cluster_id')),
+            )
+            # Enrichment of a missing description (listing-only rows) says nothing
+            row['enriched'] = row['description'] is not None and all(
+                column in record for column in ENRICHED_COLUMN_TYPES
+            )
+            for column, kind in ENRICHED_COLUMN_TYPES.items():
+                row[column] = enriched_value(record.get(column), kind) if row['enriched'] else None
+            rows.append(row)
+        with self.conn:
+            before = self.count()
+            self.conn.executemany(UPSERT, rows)
+            self.conn.executemany(WIDEN_FIRST_SEEN, rows)
+            inserted = self.count() - before
+        return inserted, len(rows) - inserted
+
+    def known_job_ids(self, job_ids):
+        """The subset of job_ids already stored"""
+        job_ids = list(job_ids)
+        known = set()
+        for start in range(0, len(job_ids), 500):
+            chunk = job_ids[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            known.update(row[0] for row in self.conn.execute(
+                f"SELECT job_id FROM jobs WHERE job_id IN ({placeholders})", chunk
+            ))
+        return known
+
+    def touch(self, job_ids, seen_at=None):
+        """Mark stored jobs as still listed without rewriting their fields"""
+        seen = (seen_at or datetime.now()).isoformat(timespec='seconds')
+        with self.conn:
+            self.conn.executemany(
+                "UPDATE jobs SET last_seen = ?, scrape_date = ?, expired = NULL WHERE job_id = ?",
+                [(seen, seen[:10], job_id) for job_id in job_ids]
+            )
+
+    def stale_jobs(self, source, seen_before, limit=50):
+        """
+        (job_id, job_url) of a portal's jobs neither seen nor re-validated since
+        seen_before, oldest first. Jobs a re-validation found gone are left out
+        until seen again.
+        """
+        seen_before = seen_before.isoformat(timespec='seconds')
+        return self.conn.execute(
+            "SELECT job_id, job_url FROM jobs WHERE source = ? AND last_seen < ? AND expired IS NULL "
+            "AND (last_checked IS NULL OR last_checked < ?) AND job_url LIKE 'http%' "
+            "ORDER BY last_seen LIMIT ?",
+            (source, seen_before, seen_before, limit)
+        ).fetchall()
+
+    def record_revalidation(self, job_ids, expired, checked_at=None):
+        """
+        Set last_checked on re-validated jobs, and mark them expired when
+        their detail page failed every retry (or clear expired when it loaded).
+        A job that is listed or fetched again later (touch, upsert) is no
+        longer expired.
+        """
+        checked = (checked_at or datetime.now()).isoformat(timespec='seconds')
+        with self.conn:
+            self.conn.executemany(
+                "UPDATE jobs SET last_checked = ?, expired = ? WHERE job_id = ?",
+                [(checked, 1 if expired else None, job_id) for job_id in job_ids]
+            )
+
+    def search(self, query, source=None, since=None, until=None, limit=20):
+        """
+        Jobs matching an FTS5 query, best bm25 match first, optionally limited
+        to one source and a scrape_date range (YYYY-MM-DD, inclusive). Plain
+        text that isn't valid FTS5 syntax ("full-time", "C++") is searched
+        as quoted terms instead.
+        """
+        params = {'query': query, 'source': source, 'since': since, 'until': until, 'limit': limit}
+        try:
+            return self.conn.execute(SEARCH, params).fetchall()
+        except sqlite3.OperationalError:
+            params['query'] = " ".join('"' + term.replace('"', '""') + '"' for term in query.split())
+            return self.conn.execute(SEARCH, params).fetchall()
+
+    def save_signatures(self, entries):
+        """Store (job_id, signature bytes, [(band, bucket), ...]) entries, replacing a job's earlier ones"""
+        with self.conn:
+            for job_id, signature, buckets in entries:
+                self.conn.execute("DELETE FROM lsh_buckets WHERE job_id = ?", (job_id,))
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO job_signatures (job_id, signature) VALUES (?, ?)", (job_id, signature)
+                )
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO lsh_buckets (band, bucket, job_id) VALUES (?, ?, ?)",
+                    [(band, bucket, job_id) for band, bucket in buckets]
+                )
+
+    def bucket_members(self, band, bucket, limit=50):
+        """
+        Job IDs sharing an LSH band bucket, earliest first_seen first. At most
+        limit: a crowded bucket is one big cluster anyway, and its earliest
+        jobs are the ones whose cluster ID a near duplicate takes.
+        """
+        return [row[0] for row in self.conn.execute(
+            "SELECT b.job_id FROM lsh_buckets b JOIN jobs j ON j.job_id = b.job_id "
+            "WHERE b.band = ? AND b.bucket = ? ORDER BY j.first_seen, b.job_id LIMIT ?",
+            (band, bucket, limit)
+        )]
+
+    def stored_signatures(self, job_ids):
+        """{job_id: (signature bytes, cluster_id, first_seen)} for stored jobs that have a signature"""
+        job_ids = list(job_ids)
+        found = {}
+        for start in range(0, len(job_ids), 500):
+            chunk = job_ids[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for row in self.conn.execute(
+                "SELECT s.job_id, s.signature, COALESCE(j.cluster_id, j.job_id), j.first_seen "
+                f"FROM job_signatures s JOIN jobs j ON j.job_id = s.job_id WHERE s.job_id IN ({placeholders})",
+                chunk
+            ):
+                found[row[0]] = (row[1], row[2], row[3])
+        return found
+
+    def iter_jobs(self, source=None, since=None):
+        """Stored jobs in job_id order, optionally one source and last seen on/after since (YYYY-MM-DD)"""
+        return self.conn.execute(
+            "SELECT * FROM jobs WHERE (:source IS NULL OR source = :source COLLATE NOCASE) "
+            "AND (:since IS NULL OR scrape_date >= :since) ORDER BY job_id",
+            {'source': source, 'since': since}
+        )
+
+    def count(self):
+        """Total jobs stored, read from the summary table rather than counting rows"""
+        return self.conn.execute("SELECT COALESCE(SUM(jobs), 0) FROM jobs_per_source").fetchone()[0]
+
+    def summary(self):
+        """{'source': {...}, 'state': {...}, 'day': {...}} read from the summary tables"""
+        return {
+            'source': dict(self.conn.execute("SELECT source, jobs FROM jobs_per_source WHERE jobs > 0 ORDER BY jobs DESC")),
+            'state': dict(self.conn.execute("SELECT state, jobs FROM jobs_per_state WHERE jobs > 0 ORDER BY jobs DESC")),
+            'day': dict(self.conn.execute("SELECT day, jobs FROM jobs_per_day WHERE jobs > 0 ORDER BY day")),
+        }
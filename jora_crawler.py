@@ -5,10 +5,9 @@ Inherits from BaseCrawler and implements Jora-specific scraping logic
 """
 
 from base_crawler import BaseCrawler
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from dom_scripts import build_extraction_script
 from bs4 import BeautifulSoup
+from urllib.parse import urlencode
 import re
 import time
 import random
@@ -17,38 +16,58 @@ import random
 class JoraCrawler(BaseCrawler):
     """Jora.com specific crawler implementation"""
     
-    def __init__(self):
+    page_param = "p"
+    
+    # Same fields and fallbacks as extract_job_details, evaluated in the browser
+    extraction_script = build_extraction_script(r"""
+        var salary = null;
+        var badges = document.querySelectorAll('div.badge .content');
+        for (var i = 0; i < badges.length; i++) {
+            var badgeText = text(badges[i]);
+            var lower = badgeText.toLowerCase();
+            if (badgeText.indexOf('$') !== -1 || lower.indexOf('salary') !== -1 || lower.indexOf('pay') !== -1) {
+                salary = badgeText;
+                break;
+            }
+        }
+        return {
+            title: text(first(['h1.job-title'])),
+            company: text(first(['span.company'])),
+            location: text(first(['span.location'])),
+            salary: salary,
+            description: text(first(['#job-description-container']))
+        };
+    """)
+    
+    def __init__(self, search_url=None, query="sponsorship available", location="Australia", worker_id=None):
         super().__init__(
             portal_name="Jora",
-            search_url="https://au.jora.com/j?q=sponsorship+available&l=Australia"
+            search_url=search_url or self.build_search_url(query, location),
+            worker_id=worker_id
         )
     
+    @staticmethod
+    def build_search_url(query, location="Australia"):
+        """Jora search URL for a keyword query and location"""
+        return "https://au.jora.com/j?" + urlencode({'q': query, 'l': location})
+    
     def wait_for_job_cards(self):
         """Wait for Jora job cards to load"""
         try:
-            # Wait for job cards to load
-            WebDriverWait(self.driver, 20).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "div.job-card.result"))
-            )
-        except Exception as e:
-            # Try alternative selector
-            try:
-                WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "article.job-card"))
-                )
-            except:
-                raise Exception("No job cards found on Jora")
+            # Wait for either card layout in a single wait, with the adaptive timeout
+            self.timed_wait(self.driver, "div.job-card.result, article.job-card", 'cards')
+        except Exception:
+            raise Exception("No job cards found on Jora")
     
     def get_job_cards(self, soup):
         """Get job cards from Jora page"""
-        # Try multiple selectors for job cards based on HTML analysis
-        job_cards = soup.select('div.job-card.result')
-        if not job_cards:
-            job_cards = soup.select('article.job-card')
-        if not job_cards:
-            job_cards = soup.select('[data-job-card="true"]')
-        
-        return job_cards
+        # Try multiple selectors for job cards based on HTML analysis,
+        # the layout seen most often first
+        return self.select_all_first(soup, 'cards', [
+            'div.job-card.result',
+            'article.job-card',
+            '[data-job-card="true"]',
+        ])
     
     def extract_job_url(self, card):
         """Extract job URL from Jora job card"""
@@ -58,6 +77,36 @@ class JoraCrawler(BaseCrawler):
             return "https://au.jora.com" + href if href.startswith('/') else href
         return "N/A"
     
+    def extract_card_details(self, card):
+        """
+        Extract the job fields shown on a Jora job card. The company/location
+        selectors are not checked against a saved results page: a card where
+        they find nothing keeps "N/A", so needs_details() loads its detail page,
+        and the selector stats report them if they never match.
+        """
+        title_elem = card.select_one('h2.job-title')
+        company_elem = self.select_first(card, 'card_company', ['.job-company', 'span.company'])
+        location_elem = self.select_first(card, 'card_location', ['.job-location', 'span.location'])
+        
+        # Salary is shown as a badge when the advertiser provides one
+        salary = "N/A"
+        for badge in card.select('.job-salary, div.badge .content'):
+            badge_text = badge.get_text(strip=True)
+            if '$' in badge_text:
+                salary = badge_text
+                break
+        
+        return {
+            'title': (title_elem.get_text(strip=True) if title_elem else "") or "N/A",
+            'company': (company_elem.get_text(strip=True) if company_elem else "") or "N/A",
+            'location': (location_elem.get_text(strip=True) if location_elem else "") or "N/A",
+            'salary': salary,
+        }
+    
+    def is_promoted(self, card, job_url):
+        """Jora marks sponsored listings in the job URL (sponsored=true)"""
+        return 'sponsored=true' in job_url
+    
     def extract_job_details(self, soup, job_url):
         """Extract job details from Jora job page"""
         details = {}
@@ -108,66 +157,75 @@ class JoraCrawler(BaseCrawler):
     
     def navigate_to_next_page(self, driver, page_number):
         """Navigate to next page on Jora"""
-        print(f"\nLooking for next page on Jora...")
+        self.log.debug("Looking for next page on Jora...")
+        self.throttle()
         
-        # First, go back to the search results page if we're on a job detail page
+        # First, go back to the current results page if we're on a job detail page
         current_url = driver.current_url
         if '/job/' in current_url:
-            print("Currently on job detail page, returning to search results...")
-            driver.get(self.search_url)
+            self.log.debug("Currently on job detail page, returning to search results...")
+            self.load_page(driver, self.page_url(page_number))
             time.sleep(random.uniform(2, 3))
             
             # Wait for job cards to load
-            WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "div.job-card.result"))
-            )
+            self.timed_wait(driver, "div.job-card.result", 'pagination')
         
         # Try to find the next button using the correct selectors from analysis
         next_button = None
         
-        # Primary selectors based on the HTML analysis
-        next_selectors = [
+        # Primary selectors based on the HTML analysis, in the order that found
+        # the button most often ({next_page} is filled in)
+        next_selectors = self.ordered_selectors('pagination', [
             'a.rounded-button.-primary.-size-lg.-w-full',  # Mobile next button
             'a.next-page-button',  # Desktop next page button
             'a.pagination-page',  # Any pagination page link
-            'a[href*="&p=' + str(page_number + 1) + '"]'  # Direct URL with next page number
-        ]
+            'a[href*="&p={next_page}"]'  # Direct URL with next page number
+        ], page_number)
         
-        for selector in next_selectors:
-            try:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements:
-                    # For pagination-page, find the one with the next page number
-                    if 'pagination-page' in selector:
-                        for elem in elements:
-                            href = elem.get_attribute('href')
-                            if href and f'&p={page_number + 1}' in href:
-                                next_button = elem
-                                print(f"Found next page button with selector: {selector}")
-                                break
-                    else:
-                        next_button = elements[0]
-                        print(f"Found next button with selector: {selector}")
-                        break
-            except Exception as e:
-                print(f"Error with selector {selector}: {e}")
+        # Resolve every candidate (and the "next" text fallback) in one browser call
+        try:
+            probe = self.probe_selectors(
+                driver, [selector for _, selector in next_selectors], attributes=['href'], link_text='next'
+            )
+        except Exception as e:
+            self.log.debug("Error probing pagination selectors: %s", e)
+            probe = {'selectors': {}, 'text_matches': []}
+        
+        tried = []
+        for template, selector in next_selectors:
+            tried.append(template)
+            matches = probe['selectors'].get(selector)
+            if not matches:
                 continue
+            # For pagination-page, find the one with the next page number
+            if 'pagination-page' in selector:
+                for match in matches:
+                    href = match['attributes'].get('href')
+                    if href and f'&p={page_number + 1}' in href:
+                        next_button = match
+                        self.log.debug("Found next page button with selector: %s", selector)
+                        break
+                if next_button:
+                    break
+            else:
+                next_button = matches[0]
+                self.log.debug("Found next button with selector: %s", selector)
+                break
+        self.record_selector_hit('pagination', tried, template if next_button else None)
         
         # Alternative: Look for next button by text content
         if not next_button:
-            try:
-                all_links = driver.find_elements(By.TAG_NAME, 'a')
-                for link in all_links:
-                    if 'next' in link.text.lower() and link.is_enabled():
-                        next_button = link
-                        print("Found next button by text content")
-                        break
-            except:
-                pass
+            for match in probe['text_matches']:
+                if match['enabled']:
+                    next_button = match
+                    self.log.debug("Found next button by text content")
+                    break
         
-        if next_button and next_button.is_enabled():
+        if next_button and next_button['enabled']:
+            next_href = next_button['attributes'].get('href')
+            next_button = next_button['element']
             try:
-                print(f"Clicking next button to go to page {page_number + 1}")
+                self.log.debug("Clicking next button to go to page %d", page_number + 1)
                 
                 # Try multiple click methods
                 try:
@@ -179,45 +237,38 @@ class JoraCrawler(BaseCrawler):
                         next_button.click()
                     except:
                         # Method 3: Get href and navigate
-                        href = next_button.get_attribute('href')
-                        if href:
-                            driver.get(href)
+                        if next_href:
+                            self.load_page(driver, next_href)
                         else:
                             raise Exception("No href found on next button")
                 
                 time.sleep(random.uniform(2, 4))  # Wait for page to load
                 
                 # Wait for new job cards to load
-                WebDriverWait(driver, 15).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "div.job-card.result"))
-                )
-                print(f"✓ Successfully navigated to page {page_number + 1}")
+                self.timed_wait(driver, "div.job-card.result", 'pagination')
+                self.log.info("✓ Successfully navigated to page %d", page_number + 1)
                 return True
                 
             except Exception as e:
-                print(f"Error clicking next button: {e}")
+                self.log.warning("Error clicking next button: %s", e)
                 # Try URL-based pagination as fallback
-                print("Trying URL-based pagination...")
+                self.log.info("Trying URL-based pagination...")
                 try:
-                    # Use the original search URL as base for pagination
-                    base_search_url = "https://au.jora.com/j?q=sponsorship+available&l=Australia"
-                    new_url = f"{base_search_url}&p={page_number + 1}"
+                    new_url = self.page_url(page_number + 1)
                     
-                    print(f"Navigating to: {new_url}")
-                    driver.get(new_url)
+                    self.log.debug("Navigating to: %s", new_url)
+                    self.load_page(driver, new_url)
                     time.sleep(random.uniform(2, 4))
                     
                     # Wait for new job cards to load
-                    WebDriverWait(driver, 15).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "div.job-card.result"))
-                    )
-                    print(f"✓ Successfully navigated to page {page_number + 1} via URL")
+                    self.timed_wait(driver, "div.job-card.result", 'pagination')
+                    self.log.info("✓ Successfully navigated to page %d via URL", page_number + 1)
                     return True
                     
                 except Exception as url_error:
-                    print(f"Error with URL-based pagination: {url_error}")
-                    print(f"Stopping at page {page_number}")
+                    self.log.error("Error with URL-based pagination: %s", url_error)
+                    self.log.info("Stopping at page %d", page_number)
                     return False
         else:
-            print(f"No next button found or it's disabled. Stopping at page {page_number}")
+            self.log.info("No next button found or it's disabled. Stopping at page %d", page_number)
             return False
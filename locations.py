@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Location Normalization
+Maps the raw location strings the portals show ("Arundel, Gold Coast QLD",
+"Sydney NSW(Hybrid)", "Ballarat Central VIC") to suburb, region, state and
+postcode using the bundled Australian gazetteer (data/au_gazetteer.csv), built
+from the GeoNames postal code list with build_gazetteer
+"""
+
+import csv
+import os
+import re
+from collections import Counter
+from functools import lru_cache
+
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+GAZETTEER_PATH = os.path.join(DATA_DIR, "au_gazetteer.csv")
+# Postcode ranges of the portal regions (state, first_postcode, last_postcode, region)
+REGIONS_PATH = os.path.join(DATA_DIR, "au_regions.csv")
+
+STATES = {
+    'NSW': 'New South Wales',
+    'VIC': 'Victoria',
+    'QLD': 'Queensland',
+    'WA': 'Western Australia',
+    'SA': 'South Australia',
+    'TAS': 'Tasmania',
+    'ACT': 'Australian Capital Territory',
+    'NT': 'Northern Territory',
+}
+
+LOCATION_COLUMNS = ('suburb', 'region', 'state', 'postcode')
+
+_STATE_PATTERN = re.compile(
+    r"\b(" + "|".join(list(STATES) + [re.escape(name) for name in STATES.values()]) + r")\b",
+    re.IGNORECASE
+)
+_STATE_BY_NAME = {name.lower(): code for code, name in STATES.items()}
+_STATE_BY_NAME.update({code.lower(): code for code in STATES})
+
+# Work-arrangement tags the portals glue onto locations: "Sydney NSW(Hybrid)"
+_QUALIFIERS = re.compile(r"\([^)]*\)|\b(?:hybrid|remote|work from home|wfh)\b", re.IGNORECASE)
+# A postcode written into the location: "Sydney NSW 2000"
+_POSTCODE = re.compile(r"(?<![\w-])(\d{4})(?![\w-])")
+# Portal spellings of a suburb that the gazetteer lists under its plain name
+_SUBURB_SUFFIXES = re.compile(r"\s+(?:CBD|City|Central)$", re.IGNORECASE)
+_ALIASES = {'saint ': 'st ', 'mt ': 'mount '}
+# Everyday names of portal regions
+_REGION_ALIASES = {'hunter valley': 'newcastle, maitland & hunter'}
+
+# Post office box, delivery centre and large-user postcodes: a place keeps its street postcode
+BOX_POSTCODES = {
+    'NSW': ('1000', '1999'), 'ACT': ('0200', '0299'), 'VIC': ('8000', '8999'), 'QLD': ('9000', '9999'),
+    'SA': ('5800', '5999'), 'WA': ('6800', '6999'), 'TAS': ('7800', '7999'), 'NT': ('0900', '0999'),
+}
+# GeoNames entries that are mail facilities rather than places
+_FACILITIES = re.compile(r"\s(?:Dc|Bc|Po|Lpo|Mc|Mail Centre|Delivery Centre|GPO(?: Boxes)?)$")
+# Places whose main postcode build_gazetteer does not pick from GeoNames (Derrimut
+# is listed under its postcode before the change to 3026)
+POSTCODE_CORRECTIONS = {('Derrimut', 'VIC'): '3026', ('Melbourne', 'VIC'): '3000', ('Mount Gambier', 'SA'): '5290'}
+
+_gazetteer = None
+
+
+def load_gazetteer(path=GAZETTEER_PATH):
+    """{(suburb, state): row} plus {(region, state): row} for regions named like a place"""
+    by_suburb, by_region = {}, {}
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            row['region'] = row['region'] or None
+            by_suburb[(row['suburb'].lower(), row['state'])] = row
+            if row['region']:
+                by_region.setdefault((row['region'].lower(), row['state']), row)
+    return by_suburb, by_region
+
+
+def build_gazetteer(source, path=GAZETTEER_PATH, regions_path=REGIONS_PATH):
+    """
+    Write the gazetteer from the GeoNames Australian postal codes (AU.txt in
+    https://download.geonames.org/export/zip/AU.zip, tab-separated). Mail
+    facilities are dropped. A place listed under several postcodes keeps the
+    lowest street postcode it shares with other places (a postcode of its
+    own is usually a post office box or delivery area), and the region comes
+    from the postcode ranges in regions_path. Returns the number of rows written.
+    """
+    with open(regions_path, newline='', encoding='utf-8') as f:
+        ranges = [(row['state'], row['first_postcode'], row['last_postcode'], row['region'])
+                  for row in csv.DictReader(f)]
+
+    def region_of(state, postcode):
+        for code, first, last, region in ranges:
+            if code == state and first <= postcode <= last:
+                return region
+        return ''
+
+    places = {}
+    postcode_places = Counter()
+    with open(source, newline='', encoding='utf-8') as f:
+        for fields in csv.reader(f, delimiter='\t'):
+            postcode, name, state = fields[1], fields[2].strip(), fields[4]
+            if state not in STATES or not name or _FACILITIES.search(name):
+                continue
+            # "Mcmahons Point" -> "McMahons Point"
+            name = re.sub(r"\bMc([a-z])", lambda m: "Mc" + m.group(1).upper(), name)
+            places.setdefault((name.lower(), state), (name, state, set()))[2].add(postcode)
+            postcode_places[(postcode, state)] += 1
+
+    def preference(postcode, state):
+        first, last = BOX_POSTCODES[state]
+        return (first <= postcode <= last, postcode_places[(postcode, state)] == 1, postcode)
+
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(LOCATION_COLUMNS)
+        for name, state, postcodes in sorted(places.values(), key=lambda place: (place[1], place[0])):
+            postcode = POSTCODE_CORRECTIONS.get((name, state)) or min(
+                postcodes, key=lambda postcode: preference(postcode, state)
+            )
+            writer.writerow((name, region_of(state, postcode), state, postcode))
+    return len(places)
+
+
+def gazetteer():
+    global _gazetteer
+    if _gazetteer is None:
+        _gazetteer = load_gazetteer()
+    return _gazetteer
+
+
+def state_code(location):
+    """Australian state/territory code mentioned in a location string, or None"""
+    match = _STATE_PATTERN.search(location or "")
+    return _STATE_BY_NAME[match.group(1).lower()] if match else None
+
+
+def _spellings(name):
+    """The name as written, then with 'Saint'/'Mt' aliases and CBD/City/Central dropped"""
+    name = name.lower()
+    yield name
+    for alias, canonical in _ALIASES.items():
+        if name.startswith(alias):
+            yield canonical + name[len(alias):]
+    stripped = _SUBURB_SUFFIXES.sub("", name)
+    if stripped != name:
+        yield stripped
+
+
+def lookup(name, state):
+    """Gazetteer row for a suburb, trying the state given first (or every state), or None"""
+    by_suburb, _ = gazetteer()
+    states = [state] if state else list(STATES)
+    for spelling in _spellings(name):
+        for code in states:
+            row = by_suburb.get((spelling, code))
+            if row:
+                return row
+    return None
+
+
+@lru_cache(maxsize=65536)
+def normalize_location(location):
+    """
+    (suburb, region, state, postcode) for a raw location string; parts the
+    string does not give and the gazetteer does not know are None; a postcode
+    in the string ("Sydney NSW 2000") wins over the gazetteer's. Memoized:
+    a crawl sees a few hundred distinct strings over many thousands of rows.
+    """
+    text = _QUALIFIERS.sub(" ", location or "")
+    given = _POSTCODE.search(text)
+    text = re.sub(r"\s+", " ", _POSTCODE.sub(" ", text)).strip(" ,")
+    match = re.search(r"\s+(NSW|VIC|QLD|WA|SA|TAS|ACT|NT)$", text, re.IGNORECASE)
+    if match:
+        state = match.group(1).upper()
+        text = text[:match.start()]
+    else:
+        state = state_code(text)
+        if state:
+            text = _STATE_PATTERN.sub("", text)
+    postcode = given.group(1) if given else None
+    parts = [part.strip() for part in re.sub(r"\s+", " ", text).split(",") if part.strip()]
+    if not parts or parts == ['N/A']:
+        return (None, None, state, postcode)
+
+    place, region = parts[0], ", ".join(parts[1:]) or None
+    row = lookup(place, state)
+    if row:
+        return (row['suburb'], region or row['region'], row['state'], postcode or row['postcode'])
+    # A bare region ("Gold Coast QLD") or a suburb the gazetteer lacks
+    _, by_region = gazetteer()
+    name = _REGION_ALIASES.get(place.lower(), place.lower())
+    for code in ([state] if state else list(STATES)):
+        if (name, code) in by_region:
+            return (None, by_region[(name, code)]['region'], code, postcode)
+    return (place, region, state, postcode)
+
+
+def normalize_records(records):
+    """Add suburb/region/state/postcode to every record (in place) and return the records"""
+    for record in records:
+        record.update(zip(LOCATION_COLUMNS, normalize_location(record.get('location'))))
+    return records
+
+
+def add_location_columns(df, column='location'):
+    """
+    Add suburb/region/state/postcode columns to a DataFrame. Each distinct
+    location is normalized once and the results are spread back over the
+    frame by code, as categoricals, so filters like df[df.state == 'NSW']
+    compare small integer codes instead of strings.
+    """
+    import pandas as pd
+
+    codes, uniques = pd.factorize(df[column].fillna(""))
+    normalized = [normalize_location(value) for value in uniques]
+    for index, name in enumerate(LOCATION_COLUMNS):
+        values = pd.Series([parts[index] for parts in normalized], dtype=object)
+        df[name] = pd.Categorical(values.take(codes).to_numpy())
+    return df
@@ -4,98 +4,402 @@ Main Entry Point for Job Portal Scraping
 Combines data from both Jora and Seek portals into a single CSV file
 """
 
-import pandas as pd
+import argparse
+import logging
 from datetime import datetime
 import os
-from jora_crawler import JoraCrawler
-from seek_crawler import SeekCrawler
+import re
+import signal
+from crawl_logging import setup_logging, get_logger
+from portals import CRAWLERS, MAX_PAGES
+from crawl_scheduler import CrawlScheduler, load_queries, default_queries
+from work_queue import WorkQueue, default_worker_id
+from frontier import load_seen_job_ids, PROMOTED_CHOICES
+from page_fingerprints import PageFingerprintStore
+from selector_stats import SelectorStats
+from job_store import JobStore
+from page_archive import PageArchive
+from enrichment import enrich_records
+from locations import add_location_columns
+from near_duplicates import assign_clusters
+from output_files import CsvSink, read_chunks
+from memory_profile import MemoryProfiler
+from daemon import CrawlDaemon, default_tiers
 
 
-def main():
-    """Main function to run both crawlers and combine results"""
-    print("Job Portal Scraper - Combined Edition")
-    print("=" * 60)
-    print("This will scrape both Jora and Seek portals for sponsorship available jobs")
-    print("All data will be combined into a single job_lists.csv file")
-    print("=" * 60)
+log = get_logger()
+
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Scrape Jora and Seek for sponsorship available jobs")
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument('-v', '--verbose', action='store_true',
+                           help="Log every job and pagination step (DEBUG level)")
+    verbosity.add_argument('-q', '--quiet', action='store_true',
+                           help="Only show periodic progress/throughput lines and warnings")
+    parser.add_argument('--log-file', help="Also write the full log to this file")
+    parser.add_argument('--mode', choices=['local', 'coordinator', 'worker', 'collect', 'daemon'], default='local',
+                        help="local: crawl and save in this process (default); "
+                             "coordinator: publish job URLs to the work queue; "
+                             "worker: fetch jobs from the work queue; "
+                             "collect: save the work queue's results to job_lists.csv; "
+                             "daemon: keep browsers warm and recrawl by tier into the SQLite store")
+    parser.add_argument('--queue', default="work_queue.db",
+                        help="Path of the shared SQLite work queue (default: work_queue.db)")
+    parser.add_argument('--portal', action='append', choices=sorted(CRAWLERS),
+                        help="Only run this portal (repeatable; default: all)")
+    parser.add_argument('--worker-id', help="Worker name in logs and claims (default: hostname:pid)")
+    parser.add_argument('--queries',
+                        help="JSON file with the search queries to run (default: one sponsorship search per portal)")
+    parser.add_argument('--concurrency', type=int,
+                        help="Number of queries crawled at the same time (default: 1, or the config's max_concurrency)")
+    parser.add_argument('--requests-per-minute', type=float,
+                        help="Global page request budget shared by all queries (default: unlimited)")
+    parser.add_argument('--time-budget', type=float, metavar='MINUTES',
+                        help="Deadline mode: fetch the most useful jobs first and stop after this many minutes")
+    parser.add_argument('--promoted', choices=PROMOTED_CHOICES, default='normal',
+                        help="Deadline mode: fetch promoted/sponsored cards first, last, or by position (default)")
+    parser.add_argument('--listing-only', action='store_true',
+                        help="Fast mode: build rows from the listing cards and skip detail pages")
+    parser.add_argument('--bounded-memory', action='store_true',
+                        help="Keep only job URLs from listing pages and stream rows to job_lists.csv as they are scraped")
+    parser.add_argument('--memory-report', action='store_true',
+                        help="Report tracemalloc peak/retained memory per stage and memory in use after each page")
+    parser.add_argument('--describe', metavar='REGEX',
+                        help="Listing-only mode: still fetch descriptions for jobs whose title or company matches")
+    parser.add_argument('--pipeline', type=int, default=1, metavar='TABS',
+                        help="Load up to TABS detail pages ahead in background tabs while the current one is parsed (default: 1 = off)")
+    parser.add_argument('--parse-workers', type=int, metavar='N',
+                        help="Parse detail page HTML in N worker processes instead of the crawler threads")
+    parser.add_argument('--no-extraction-script', action='store_true',
+                        help="Always parse the full page source instead of extracting fields in the browser")
+    parser.add_argument('--skip-unchanged', action='store_true',
+                        help="Delta crawl: skip result pages whose jobs are unchanged since the last run")
+    parser.add_argument('--unchanged-pages-stop', type=int, default=3, metavar='N',
+                        help="With --skip-unchanged, stop paginating after N consecutive unchanged pages (default: 3)")
+    parser.add_argument('--fingerprints', default="page_fingerprints.json",
+                        help="Where listing page fingerprints are kept between runs")
+    parser.add_argument('--selector-stats', default="selector_stats.json",
+                        help="Where fallback selector hit counts are kept between runs")
+    parser.add_argument('--selector-report', action='store_true',
+                        help="Print the fallback selector hit counts, flagging dead selectors, and exit")
+    parser.add_argument('--trace-network', action='store_true',
+                        help="Record bytes, requests, TTFB and slowest resources of every page load via CDP")
+    parser.add_argument('--trace-dir', default="network_traces",
+                        help="With --trace-network, where HAR-like dumps of the slowest pages are written")
+    parser.add_argument('--page-load-timeout', type=int, metavar='SECONDS',
+                        help="Hard page load deadline; a session still hung 30s later is killed and replaced (default: 60)")
+    parser.add_argument('--recycle-after-pages', type=int, metavar='N',
+                        help="Replace each browser session after N page loads (default: 300, 0 = never)")
+    parser.add_argument('--max-session-rss', type=int, metavar='MB',
+                        help="Replace a browser session whose processes use more than MB resident memory (default: 1500, 0 = off)")
+    parser.add_argument('--archive', metavar='DIR',
+                        help="Keep the HTML of every detail page in DIR for offline replay (cli.py replay)")
+    parser.add_argument('--enrich', action='store_true',
+                        help="Add visa subclass, experience, employment type and availability columns parsed from descriptions")
+    parser.add_argument('--enrich-workers', type=int, metavar='N',
+                        help="With --enrich, scan descriptions in N processes")
+    parser.add_argument('--dedupe', action='store_true',
+                        help="Add a cluster_id linking near-duplicate postings (e.g. the same job on Jora and Seek)")
+    parser.add_argument('--dedupe-threshold', type=float, default=0.7, metavar='SIMILARITY',
+                        help="With --dedupe, minimum estimated description similarity to link two jobs (default: 0.7)")
+    parser.add_argument('--normalize-locations', action='store_true',
+                        help="Add suburb, region, state and postcode columns resolved from each location")
+    parser.add_argument('--sqlite', metavar='PATH',
+                        help="Also upsert the collected jobs into this indexed SQLite database")
+    parser.add_argument('--merge', action='store_true',
+                        help="Merge the jobs into the SQLite master dataset (--sqlite, default jobs.db) "
+                             "instead of overwriting job_lists.csv")
+    parser.add_argument('--head-pages', type=int, default=3,
+                        help="Daemon mode: result pages refreshed often, where new jobs appear (default: 3)")
+    parser.add_argument('--head-interval', type=float, default=5, metavar='MINUTES',
+                        help="Daemon mode: minutes between refreshes of the head pages (default: 5)")
+    parser.add_argument('--deep-interval', type=float, default=360, metavar='MINUTES',
+                        help="Daemon mode: minutes between refreshes of the deeper pages (default: 360)")
+    parser.add_argument('--revalidate-interval', type=float, default=1440, metavar='MINUTES',
+                        help="Daemon mode: minutes between re-validations of jobs no longer listed (default: 1440)")
+    parser.add_argument('--visibility-timeout', type=int, default=300,
+                        help="Seconds before a claimed job from a silent worker is handed out again")
+    parser.add_argument('--idle-timeout', type=int, default=300, metavar='SECONDS',
+                        help="Worker mode: give up after this long with nothing to claim while the coordinator is still publishing")
+    return parser.parse_args(argv)
+
+
+def save_jobs(all_jobs_data, output_filename="job_lists.csv", normalize_locations=False):
+    """Combine scraped records into a DataFrame, save it as CSV and log a summary"""
+    import pandas as pd
     
-    # Initialize crawlers
-    jora_crawler = JoraCrawler()
-    seek_crawler = SeekCrawler()
+    log.info("COMBINING AND SAVING DATA")
     
-    all_jobs_data = []
+    # Create DataFrame
+    df = pd.DataFrame(all_jobs_data)
     
-    # Scrape Jora
-    print("\n" + "=" * 60)
-    print("STARTING JORA SCRAPING")
-    print("=" * 60)
-    try:
-        jora_jobs = jora_crawler.scrape_jobs(max_pages=34)
-        if jora_jobs:
-            all_jobs_data.extend(jora_jobs)
-            print(f"✓ Jora scraping completed successfully. Jobs collected: {len(jora_jobs)}")
-        else:
-            print("✗ Jora scraping failed or returned no data")
-    except Exception as e:
-        print(f"✗ Error during Jora scraping: {e}")
+    # Ensure all required columns exist
+    required_columns = ['title', 'company', 'location', 'salary', 'description', 'job_url', 'source']
+    for col in required_columns:
+        if col not in df.columns:
+            df[col] = 'N/A'
     
-    # Scrape Seek
-    print("\n" + "=" * 60)
-    print("STARTING SEEK SCRAPING")
-    print("=" * 60)
+    # Reorder columns to put source first
+    column_order = ['source'] + [col for col in df.columns if col != 'source']
+    df = df[column_order]
+    
+    # Suburb/region/state/postcode, resolved once per distinct location
+    if normalize_locations:
+        df = add_location_columns(df)
+    
+    # Save to CSV
+    df.to_csv(output_filename, index=False, encoding='utf-8')
+    
+    # Print summary
+    log.info("✓ Combined data saved to: %s", output_filename)
+    log.info("✓ Total jobs collected: %d", len(df))
+    log.info("✓ File size: %.1f KB", os.path.getsize(output_filename) / 1024)
+    
+    # Print breakdown by source
+    source_counts = df['source'].value_counts()
+    log.info("Jobs by source:")
+    for source, count in source_counts.items():
+        log.info("  - %s: %d jobs", source, count)
+    return df
+
+
+def export_sqlite(all_jobs_data, path):
+    """Upsert the records into the SQLite job store and log its running totals"""
+    store = JobStore(path)
+    try:
+        inserted, updated = store.upsert(all_jobs_data)
+        log.info("✓ SQLite store %s: %d new jobs, %d updated", path, inserted, updated)
+        for source, count in store.summary()['source'].items():
+            log.info("  - %s: %d jobs stored", source, count)
+    finally:
+        store.close()
+
+
+def dedupe_jobs(args, all_jobs_data):
+    """Link near-duplicate postings within the run, and with the SQLite store's history when one is used"""
+    path = args.sqlite or ("jobs.db" if args.merge else None)
+    store = JobStore(path) if path else None
+    try:
+        duplicates = assign_clusters(all_jobs_data, threshold=args.dedupe_threshold, store=store)
+    finally:
+        if store is not None:
+            store.close()
+    log.info("✓ Near-duplicate detection: %d of %d jobs repeat an earlier posting", duplicates, len(all_jobs_data))
+
+
+def output_jobs(args, all_jobs_data):
+    """Run the optional output stages, then save the CSV (and/or merge into the SQLite store)"""
+    if args.enrich:
+        enrich_records(all_jobs_data, workers=args.enrich_workers)
+    if args.dedupe:
+        dedupe_jobs(args, all_jobs_data)
+    if args.merge:
+        # The store is the master dataset; job_lists.csv is left as it was
+        export_sqlite(all_jobs_data, args.sqlite or "jobs.db")
+        return
+    save_jobs(all_jobs_data, normalize_locations=args.normalize_locations)
+    if args.sqlite:
+        export_sqlite(all_jobs_data, args.sqlite)
+
+
+def finish_streamed_output(args, sink):
+    """Bounded-memory mode: the rows are already in sink.path; merge them into the store chunk by chunk"""
+    log.info("✓ %d jobs streamed to %s", sink.rows, sink.path)
+    skipped = [flag for flag, on in (('--enrich', args.enrich), ('--dedupe', args.dedupe),
+                                     ('--normalize-locations', args.normalize_locations)) if on]
+    if skipped:
+        # With --merge the scratch file is removed below, so point at a dump of the store instead
+        target = "a `cli.py dump` of the store" if args.merge else sink.path
+        log.warning("⚠ Skipped %s (needs all rows in memory); run `cli.py enrich` on %s instead",
+                    ", ".join(skipped), target)
+    if not (args.sqlite or args.merge):
+        return
+    path = args.sqlite or "jobs.db"
+    store = JobStore(path)
+    inserted = updated = 0
+    try:
+        for chunk in read_chunks(chunksize=500, files=[sink.path], with_description=True):
+            new, known = store.upsert(chunk)
+            inserted += new
+            updated += known
+    finally:
+        store.close()
+    log.info("✓ SQLite store %s: %d new jobs, %d updated", path, inserted, updated)
+    if args.merge:
+        os.remove(sink.path)
+
+
+def run_daemon(args, portals):
+    """Recrawl by tier with warm browser sessions until SIGTERM or Ctrl-C"""
+    if args.queries:
+        queries = [query for query in load_queries(args.queries)['queries'] if query['portal'] in portals]
+    else:
+        queries = default_queries(portals)
+    store = JobStore(args.sqlite or "jobs.db")
+    daemon = CrawlDaemon(
+        queries, store,
+        tiers=default_tiers(args.head_pages, args.head_interval * 60, args.deep_interval * 60),
+        revalidate_interval=args.revalidate_interval * 60
+    )
+    signal.signal(signal.SIGTERM, lambda signum, frame: daemon.stop())
     try:
-        seek_jobs = seek_crawler.scrape_jobs(max_pages=25)
-        if seek_jobs:
-            all_jobs_data.extend(seek_jobs)
-            print(f"✓ Seek scraping completed successfully. Jobs collected: {len(seek_jobs)}")
-        else:
-            print("✗ Seek scraping failed or returned no data")
-    except Exception as e:
-        print(f"✗ Error during Seek scraping: {e}")
+        daemon.run()
+    except KeyboardInterrupt:
+        daemon.stop()
+    finally:
+        store.close()
+
+
+def run_coordinator(args, portals):
+    """Publish the job URLs of every listing page to the shared work queue"""
+    work_queue = WorkQueue(args.queue, visibility_timeout=args.visibility_timeout)
+    try:
+        for portal in portals:
+            log.info("PUBLISHING %s JOBS", portal.upper())
+            published = CRAWLERS[portal]().publish_jobs(work_queue, max_pages=MAX_PAGES[portal])
+            log.info("✓ %s: %d new jobs queued", portal, published)
+        log.info("Queue status: %s", work_queue.counts())
+    finally:
+        work_queue.close()
+
+
+def run_worker(args, portals):
+    """Claim, fetch and ack jobs from the shared work queue until it runs dry"""
+    worker_id = args.worker_id or default_worker_id()
+    work_queue = WorkQueue(args.queue, visibility_timeout=args.visibility_timeout)
+    try:
+        for portal in portals:
+            completed = CRAWLERS[portal](worker_id=worker_id).run_worker(work_queue, idle_timeout=args.idle_timeout)
+            log.info("✓ %s: worker %s completed %d jobs", portal, worker_id, completed)
+    finally:
+        work_queue.close()
+
+
+def run_collect(args, portals):
+    """Save the records fetched by all workers to job_lists.csv"""
+    work_queue = WorkQueue(args.queue)
+    try:
+        all_jobs_data = [record for portal in portals for record in work_queue.results(portal)]
+        if work_queue.has_open_work():
+            log.warning("⚠ Work queue still has pending jobs: %s", work_queue.counts())
+    finally:
+        work_queue.close()
+    if all_jobs_data:
+        output_jobs(args, all_jobs_data)
+    else:
+        log.error("✗ The work queue has no completed jobs yet.")
+
+
+def main(argv=None):
+    """Main function to run both crawlers and combine results"""
+    args = parse_args(argv)
+    setup_logging(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        quiet=args.quiet,
+        log_file=args.log_file
+    )
+
+    if args.selector_report:
+        print(SelectorStats(args.selector_stats).report() or "No selector statistics recorded yet")
+        return
+
+    portals = args.portal or list(CRAWLERS)
+    if args.mode == 'coordinator':
+        return run_coordinator(args, portals)
+    if args.mode == 'worker':
+        return run_worker(args, portals)
+    if args.mode == 'collect':
+        return run_collect(args, portals)
+    if args.mode == 'daemon':
+        return run_daemon(args, portals)
+
+    log.info("Job Portal Scraper - Combined Edition")
+    log.info("This will scrape %s for sponsorship available jobs", " and ".join(portals))
+    log.info("All data will be combined into a single job_lists.csv file")
+
+    if args.queries:
+        config = load_queries(args.queries)
+        config['queries'] = [query for query in config['queries'] if query['portal'] in portals]
+    else:
+        config = {'queries': default_queries(portals)}
+    scheduler = CrawlScheduler.from_config(
+        config,
+        max_concurrency=args.concurrency,
+        requests_per_minute=args.requests_per_minute
+    )
+    scheduler.pipeline_window = max(1, args.pipeline)
+    scheduler.parse_workers = args.parse_workers
+    scheduler.use_extraction_script = not args.no_extraction_script
+    scheduler.selector_stats = SelectorStats(args.selector_stats)
+    scheduler.page_load_timeout = args.page_load_timeout
+    if args.archive:
+        scheduler.archive = PageArchive(args.archive)
+    scheduler.recycle_after_pages = args.recycle_after_pages
+    scheduler.max_session_rss_mb = args.max_session_rss
+    if args.trace_network:
+        scheduler.trace_network = True
+        scheduler.trace_dir = args.trace_dir
+    if args.skip_unchanged:
+        if not args.merge:
+            # The run only holds the changed pages; written to job_lists.csv it would drop the rest
+            log.error("✗ --skip-unchanged needs --merge: a delta crawl must be merged into the store")
+            return
+        scheduler.fingerprints = PageFingerprintStore(args.fingerprints)
+        scheduler.unchanged_pages_stop = args.unchanged_pages_stop
+    if args.listing_only:
+        scheduler.listing_only = True
+        if args.describe:
+            pattern = re.compile(args.describe, re.IGNORECASE)
+            scheduler.describe = lambda row: bool(pattern.search(f"{row.get('title', '')} {row.get('company', '')}"))
+    if args.time_budget:
+        scheduler.time_budget = args.time_budget * 60
+        if not args.listing_only:
+            # Jobs already in the previous output are fetched last
+            scheduler.seen_job_ids = load_seen_job_ids("job_lists.csv")
+            scheduler.promoted = args.promoted
+    if args.bounded_memory:
+        if args.listing_only:
+            log.error("✗ --bounded-memory streams detail page rows; it does not apply to --listing-only")
+            return
+        scheduler.bounded_memory = True
+        # With --merge the rows only pass through a scratch file on their way to the store
+        scheduler.sink = CsvSink("job_lists.merge.csv" if args.merge else "job_lists.csv")
+    if args.memory_report:
+        scheduler.memory_profiler = MemoryProfiler()
+        scheduler.memory_profiler.start()
+    try:
+        all_jobs_data = scheduler.run()
+    except BaseException:
+        # Ctrl-C or a crash: do not replace the previous output with a partial one
+        if scheduler.sink is not None:
+            scheduler.sink.abort()
+            log.warning("⚠ Run interrupted; %d rows kept in %s", scheduler.sink.rows, scheduler.sink.partial_path)
+        raise
+    else:
+        if scheduler.sink is not None:
+            scheduler.sink.commit()
+    finally:
+        if scheduler.memory_profiler is not None:
+            for line in scheduler.memory_profiler.report():
+                log.info(line)
+            scheduler.memory_profiler.stop()
     
+    if scheduler.sink is not None:
+        finish_streamed_output(args, scheduler.sink)
+        log.info("SCRAPING COMPLETED SUCCESSFULLY!")
+        return
+
     # Combine and save data
     if all_jobs_data:
-        print("\n" + "=" * 60)
-        print("COMBINING AND SAVING DATA")
-        print("=" * 60)
-        
-        # Create DataFrame
-        df = pd.DataFrame(all_jobs_data)
-        
-        # Ensure all required columns exist
-        required_columns = ['title', 'company', 'location', 'salary', 'description', 'job_url', 'source']
-        for col in required_columns:
-            if col not in df.columns:
-                df[col] = 'N/A'
-        
-        # Reorder columns to put source first
-        column_order = ['source'] + [col for col in df.columns if col != 'source']
-        df = df[column_order]
-        
-        # Save to CSV
-        output_filename = "job_lists.csv"
-        df.to_csv(output_filename, index=False, encoding='utf-8')
-        
-        # Print summary
-        print(f"✓ Combined data saved to: {output_filename}")
-        print(f"✓ Total jobs collected: {len(all_jobs_data)}")
-        print(f"✓ File size: {os.path.getsize(output_filename) / 1024:.1f} KB")
-        
-        # Print breakdown by source
-        source_counts = df['source'].value_counts()
-        print("\nJobs by source:")
-        for source, count in source_counts.items():
-            print(f"  - {source}: {count} jobs")
-        
-
-        
-        print("\n" + "=" * 60)
-        print("SCRAPING COMPLETED SUCCESSFULLY!")
-        print("=" * 60)
-        
+        output_jobs(args, all_jobs_data)
+
+        log.info("SCRAPING COMPLETED SUCCESSFULLY!")
+
     else:
-        print("\n✗ No job data was collected from either portal.")
-        print("Please check the individual scraper outputs above for errors.")
+        log.error("✗ No job data was collected from any portal.")
+        log.error("Please check the individual scraper outputs above for errors.")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Memory Profiling
+tracemalloc-based peak and retained memory per crawl stage (listing pages,
+detail pages, retries) and memory in use after every result page, to check
+that a crawl's memory stays flat as max_pages grows
+"""
+
+import gc
+import threading
+import tracemalloc
+from contextlib import contextmanager
+
+
+MB = 1024 * 1024
+
+
+class MemoryProfiler:
+    """
+    Per-stage memory statistics from tracemalloc.
+
+    stage(name) measures a block: its peak above the memory in use when it
+    started, and what it left allocated (retained). page_done() samples the
+    memory in use after each result page (after a GC pass, so the samples
+    show what is really kept). Stages must not nest. tracemalloc
+    sees the whole process, so with several crawler threads the stages
+    overlap; profile with --concurrency 1 for per-stage numbers.
+    """
+
+    def __init__(self, frames=1):
+        self.frames = frames
+        self.lock = threading.Lock()
+        self.stages = {}
+        self.pages = []
+        self.baseline = 0
+        self._started_here = False
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_here = True
+        self.baseline = tracemalloc.get_traced_memory()[0]
+
+    def stop(self):
+        if self._started_here:
+            tracemalloc.stop()
+            self._started_here = False
+
+    @contextmanager
+    def stage(self, name):
+        before = tracemalloc.get_traced_memory()[0]
+        # Python < 3.9 has no reset_peak; peaks are then since tracing started
+        if hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            with self.lock:
+                stats = self.stages.setdefault(name, {'calls': 0, 'peak': 0, 'retained': 0})
+                stats['calls'] += 1
+                stats['peak'] = max(stats['peak'], peak - before)
+                stats['retained'] += current - before
+
+    def page_done(self, portal_name, page_number):
+        # Collect first so the sample is live memory, not parse-tree cycles
+        # that the next automatic GC pass would have freed anyway
+        gc.collect()
+        with self.lock:
+            self.pages.append((portal_name, page_number, tracemalloc.get_traced_memory()[0] - self.baseline))
+
+    def growth_per_page(self):
+        """Average change in memory in use from one page to the next (bytes), or None"""
+        with self.lock:
+            samples = [in_use for _, _, in_use in self.pages]
+        if len(samples) < 2:
+            return None
+        return (samples[-1] - samples[0]) / (len(samples) - 1)
+
+    def report(self):
+        """Lines summarizing every stage and the per-page memory in use"""
+        lines = ["Memory by stage (tracemalloc):"]
+        with self.lock:
+            for name, stats in self.stages.items():
+                lines.append(
+                    f"  - {name}: {stats['calls']} calls, peak {stats['peak'] / MB:.1f} MB, "
+                    f"retained {stats['retained'] / MB:+.2f} MB ({stats['retained'] / stats['calls'] / 1024:+.1f} KB per call)"
+                )
+            pages = list(self.pages)
+        if pages:
+            lines.append("In use after each page: " + ", ".join(
+                f"{portal} p{number} {in_use / MB:.1f} MB" for portal, number, in_use in pages
+            ))
+        growth = self.growth_per_page()
+        if growth is not None:
+            lines.append(f"Growth per page: {growth / 1024:+.1f} KB")
+        return lines
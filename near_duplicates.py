@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Detection
+Links postings whose descriptions are nearly identical (the same role posted
+on both Jora and Seek, or reposted with small edits) under one cluster ID,
+using MinHash signatures and locality-sensitive hashing (LSH) banding so the
+cost grows with the number of postings rather than the number of pairs. With a
+JobStore, signatures and band buckets are kept in the store and every new
+posting is also matched against the stored history.
+"""
+
+import hashlib
+import re
+import zlib
+from collections import defaultdict
+from itertools import combinations
+from job_store import record_job_id
+
+
+_WORDS = re.compile(r"[a-z0-9]+")
+
+
+def shingles(text, size=3):
+    """32-bit hashes of the word `size`-grams of a description (lowercased, punctuation dropped)"""
+    words = _WORDS.findall((text or "").lower())
+    return {
+        zlib.crc32(" ".join(words[i:i + size]).encode('utf-8'))
+        for i in range(max(len(words) - size + 1, 0))
+    }
+
+
+class UnionFind:
+    """Disjoint sets over 0..n-1 with path halving and union by size"""
+
+    def __init__(self, n):
+        self.parent = list(range(n))
+        self.size = [1] * n
+
+    def find(self, item):
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a, b):
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+
+
+class MinHashLSH:
+    """
+    MinHash signatures of `bands * rows` hash functions, bucketed band by band.
+
+    Two descriptions with Jaccard similarity s share at least one band bucket
+    with probability 1 - (1 - s**rows)**bands; with the defaults (20 bands of
+    6 rows) that is ~0.6 at s = 0.6, ~0.9 at s = 0.7 and above 0.99 at s = 0.8. Candidate pairs
+    from the buckets are then kept only if their signatures agree on at least
+    `threshold` of the hash functions.
+    """
+
+    def __init__(self, bands=20, rows=6, threshold=0.7, shingle_size=3, min_shingles=10, seed=1, max_bucket=50):
+        import numpy as np
+
+        self.bands = bands
+        self.rows = rows
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.min_shingles = min_shingles
+        self.max_bucket = max_bucket
+        generator = np.random.default_rng(seed)
+        num_perm = bands * rows
+        # Multiply-shift hash functions h(x) = (a * x + b) >> 32 over uint64 (odd a);
+        # no modulo, which is the slow part of the textbook (a * x + b) mod p
+        self.a = generator.integers(0, 1 << 63, size=num_perm, dtype=np.uint64)[:, None] * np.uint64(2) + np.uint64(1)
+        self.b = generator.integers(0, 1 << 63, size=num_perm, dtype=np.uint64)[:, None]
+        self.shift = np.uint64(32)
+
+    def signature(self, text):
+        """MinHash signature of a description, or None if it is too short to compare"""
+        import numpy as np
+
+        hashes = shingles(text, self.shingle_size)
+        if len(hashes) < self.min_shingles:
+            return None
+        values = np.fromiter(hashes, dtype=np.uint64, count=len(hashes))
+        return ((self.a * values + self.b) >> self.shift).min(axis=1)
+
+    def candidate_pairs(self, signatures):
+        """Index pairs sharing at least one band bucket (None signatures are skipped)"""
+        pairs = set()
+        for band in range(self.bands):
+            start = band * self.rows
+            buckets = defaultdict(list)
+            for index, signature in enumerate(signatures):
+                if signature is not None:
+                    buckets[signature[start:start + self.rows].tobytes()].append(index)
+            for members in buckets.values():
+                # Every pair within the bucket: chaining neighbours would miss a~c
+                # when b is similar to neither. Members past max_bucket (a crowded
+                # bucket is one big cluster anyway) are compared with the first only
+                pairs.update(combinations(members[:self.max_bucket], 2))
+                pairs.update((members[0], member) for member in members[self.max_bucket:])
+        return pairs
+
+    def similarity(self, first, second):
+        """Estimated Jaccard similarity: the share of hash functions whose minimums agree"""
+        if len(first) != len(second):
+            # Stored with other bands/rows settings: not comparable
+            return 0.0
+        return float((first == second).mean())
+
+    def band_keys(self, signature):
+        """(band, bucket) pairs of a signature, as stored in the job store's lsh_buckets table"""
+        keys = []
+        for band in range(self.bands):
+            digest = hashlib.blake2b(signature[band * self.rows:(band + 1) * self.rows].tobytes(), digest_size=8)
+            keys.append((band, int.from_bytes(digest.digest(), 'big', signed=True)))
+        return keys
+
+    def stored_matches(self, store, signatures):
+        """
+        {index: (cluster_id, first_seen)} of the earliest stored job each
+        signature is a near duplicate of (None signatures are skipped)
+        """
+        import numpy as np
+
+        candidates = {}
+        for index, signature in enumerate(signatures):
+            if signature is not None:
+                candidates[index] = {
+                    job_id for band, bucket in self.band_keys(signature)
+                    for job_id in store.bucket_members(band, bucket, self.max_bucket)
+                }
+        stored = store.stored_signatures(set().union(*candidates.values()) if candidates else ())
+        matches = {}
+        for index, job_ids in candidates.items():
+            for job_id in job_ids:
+                if job_id not in stored:
+                    continue
+                blob, cluster_id, first_seen = stored[job_id]
+                if self.similarity(signatures[index], np.frombuffer(blob, dtype=np.uint64)) < self.threshold:
+                    continue
+                if index not in matches or first_seen < matches[index][1]:
+                    matches[index] = (cluster_id, first_seen)
+        return matches
+
+    def clusters(self, texts):
+        """Cluster root index for every text; texts with no near duplicate are their own root"""
+        return self.cluster_signatures([self.signature(text) for text in texts])
+
+    def cluster_signatures(self, signatures):
+        """clusters() for signatures computed already"""
+        groups = UnionFind(len(signatures))
+        for first, second in self.candidate_pairs(signatures):
+            if self.similarity(signatures[first], signatures[second]) >= self.threshold:
+                groups.union(first, second)
+        return [groups.find(index) for index in range(len(signatures))]
+
+
+def assign_clusters(records, threshold=0.7, bands=20, rows=6, store=None, save_signatures=True):
+    """
+    Add a `cluster_id` to every record (in place): the job ID of the cluster's
+    first record, so a posting and all its near duplicates share one ID and
+    unique postings keep their own. With a JobStore, a cluster that includes
+    a near duplicate of a stored job takes the cluster ID of the earliest such
+    job, and the records' signatures are saved for later runs (unless
+    save_signatures is off, for records that won't be stored). Returns the
+    number of records that were linked to an earlier (or stored) posting.
+    """
+    lsh = MinHashLSH(bands=bands, rows=rows, threshold=threshold)
+    signatures = [
+        lsh.signature(f"{record.get('title') or ''} {record.get('description') or ''}") for record in records
+    ]
+    roots = lsh.cluster_signatures(signatures)
+    job_ids = [record_job_id(record) for record in records]
+
+    stored = {}
+    if store is not None:
+        for index, (cluster_id, first_seen) in lsh.stored_matches(store, signatures).items():
+            root = roots[index]
+            if root not in stored or first_seen < stored[root][1]:
+                stored[root] = (cluster_id, first_seen)
+
+    cluster_ids = {root: cluster_id for root, (cluster_id, _) in stored.items()}
+    duplicates = 0
+    for index, (record, root) in enumerate(zip(records, roots)):
+        if root in cluster_ids and cluster_ids[root] != job_ids[index]:
+            duplicates += 1
+        else:
+            cluster_ids.setdefault(root, job_ids[index])
+        record['cluster_id'] = cluster_ids[root]
+
+    if store is not None and save_signatures:
+        store.save_signatures(
+            (job_id, signature.tobytes(), lsh.band_keys(signature))
+            for job_id, signature in zip(job_ids, signatures) if signature is not None
+        )
+    return duplicates
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Network Tracing Through Chrome DevTools
+Reads the Chrome DevTools Protocol (CDP) Network events that chromedriver
+records in its performance log. For each traced page load it measures bytes,
+request count, time to first byte and the slowest resources, and keeps
+HAR-like records of the slowest pages
+"""
+
+import heapq
+import itertools
+import json
+import os
+import re
+import threading
+from collections import defaultdict
+from datetime import datetime
+from urllib.parse import urlsplit
+
+
+def enable_performance_logging(options):
+    """Ask chromedriver to record CDP Network events (read back with driver.get_log('performance'))"""
+    options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    options.add_experimental_option('perfLoggingPrefs', {'enableNetwork': True, 'enablePage': False})
+
+
+class PageTrace:
+    """Network activity of one page load, built from CDP Network.* events"""
+
+    def __init__(self, page_url, kind, events):
+        self.page_url = page_url
+        self.kind = kind
+        self.started_at = datetime.now().isoformat(timespec='seconds')
+        self.ttfb = None
+        self.resources = {}
+        for method, params in events:
+            self.add_event(method, params)
+        finished = [r['end'] for r in self.resources.values() if r.get('end') is not None]
+        starts = [r['start'] for r in self.resources.values() if r.get('start') is not None]
+        self.duration = (max(finished) - min(starts)) if finished and starts else 0.0
+        self.requests = len(self.resources)
+        self.bytes = sum(r.get('bytes', 0) for r in self.resources.values())
+
+    def add_event(self, method, params):
+        resource = self.resources.setdefault(params.get('requestId'), {})
+        if method == 'Network.requestWillBeSent':
+            resource.update(
+                url=params['request']['url'],
+                method=params['request'].get('method', 'GET'),
+                type=params.get('type', 'Other'),
+                start=params['timestamp'],
+            )
+        elif method == 'Network.responseReceived':
+            response = params['response']
+            resource.update(status=response.get('status'), mime_type=response.get('mimeType'))
+            timing = response.get('timing')
+            if timing:
+                resource['ttfb'] = (timing['receiveHeadersEnd'] - timing['sendStart']) / 1000
+                if params.get('type') == 'Document' and self.ttfb is None:
+                    self.ttfb = resource['ttfb']
+        elif method == 'Network.loadingFinished':
+            resource.update(bytes=params.get('encodedDataLength', 0), end=params['timestamp'])
+        elif method == 'Network.loadingFailed':
+            resource.update(failed=params.get('errorText', 'failed'), end=params['timestamp'])
+
+    def slowest(self, count=5):
+        timed = [r for r in self.resources.values() if r.get('start') is not None and r.get('end') is not None]
+        return sorted(timed, key=lambda r: r['end'] - r['start'], reverse=True)[:count]
+
+    def bytes_by_host(self):
+        hosts = defaultdict(int)
+        for resource in self.resources.values():
+            if resource.get('url'):
+                hosts[urlsplit(resource['url']).hostname or '?'] += resource.get('bytes', 0)
+        return hosts
+
+    def to_har(self):
+        """A HAR-like dict (log.pages/log.entries) with the fields CDP gives us"""
+        entries = []
+        for resource in sorted(self.resources.values(), key=lambda r: r.get('start') or 0):
+            if not resource.get('url'):
+                continue
+            elapsed = resource['end'] - resource['start'] if resource.get('end') and resource.get('start') else None
+            entries.append({
+                'pageref': self.page_url,
+                'time': round(elapsed * 1000, 1) if elapsed is not None else None,
+                'request': {'method': resource.get('method', 'GET'), 'url': resource['url']},
+                'response': {
+                    'status': resource.get('status'),
+                    'content': {'mimeType': resource.get('mime_type'), 'size': resource.get('bytes', 0)},
+                    '_error': resource.get('failed'),
+                },
+                'timings': {'wait': round(resource['ttfb'] * 1000, 1) if resource.get('ttfb') is not None else None},
+                '_resourceType': resource.get('type'),
+            })
+        return {'log': {
+            'version': '1.2',
+            'creator': {'name': 'jobscraper network_trace', 'version': '1'},
+            'pages': [{
+                'id': self.page_url,
+                'title': self.page_url,
+                'startedDateTime': self.started_at,
+                'pageTimings': {'onLoad': round(self.duration * 1000, 1)},
+                '_kind': self.kind,
+                '_bytes': self.bytes,
+                '_requests': self.requests,
+                '_ttfb': self.ttfb,
+            }],
+            'entries': entries,
+        }}
+
+
+class NetworkTracer:
+    """
+    Per-portal network statistics over every traced page load.
+
+    start(driver) drops whatever the performance log buffered so far, and
+    finish(driver, url, kind) turns the events since then into a PageTrace.
+    The `keep_slowest` slowest page loads are kept for dump_slowest().
+    """
+
+    def __init__(self, portal_name, keep_slowest=5):
+        self.portal_name = portal_name
+        self.keep_slowest = keep_slowest
+        self.lock = threading.Lock()
+        self.totals = defaultdict(lambda: {'pages': 0, 'requests': 0, 'bytes': 0, 'ttfb': [], 'seconds': 0.0})
+        self.host_bytes = defaultdict(int)
+        self._slowest = []
+        self._counter = itertools.count()
+
+    @staticmethod
+    def read_events(driver):
+        events = []
+        for entry in driver.get_log('performance'):
+            message = json.loads(entry['message'])['message']
+            if message['method'].startswith('Network.'):
+                events.append((message['method'], message['params']))
+        return events
+
+    def start(self, driver):
+        self.read_events(driver)
+
+    def finish(self, driver, page_url, kind):
+        trace = PageTrace(page_url, kind, self.read_events(driver))
+        with self.lock:
+            totals = self.totals[kind]
+            totals['pages'] += 1
+            totals['requests'] += trace.requests
+            totals['bytes'] += trace.bytes
+            totals['seconds'] += trace.duration
+            if trace.ttfb is not None:
+                totals['ttfb'].append(trace.ttfb)
+            for host, size in trace.bytes_by_host().items():
+                self.host_bytes[host] += size
+            item = (trace.duration, next(self._counter), trace)
+            if len(self._slowest) < self.keep_slowest:
+                heapq.heappush(self._slowest, item)
+            else:
+                heapq.heappushpop(self._slowest, item)
+        return trace
+
+    def summary(self):
+        """{kind: {pages, avg_requests, avg_kb, p50_ttfb, avg_seconds}}"""
+        summary = {}
+        with self.lock:
+            for kind, totals in self.totals.items():
+                pages = totals['pages'] or 1
+                ttfb = sorted(totals['ttfb'])
+                summary[kind] = {
+                    'pages': totals['pages'],
+                    'avg_requests': totals['requests'] / pages,
+                    'avg_kb': totals['bytes'] / pages / 1024,
+                    'p50_ttfb': ttfb[len(ttfb) // 2] if ttfb else None,
+                    'avg_seconds': totals['seconds'] / pages,
+                }
+        return summary
+
+    def top_hosts(self, count=5):
+        with self.lock:
+            return sorted(self.host_bytes.items(), key=lambda item: item[1], reverse=True)[:count]
+
+    def slowest_pages(self):
+        with self.lock:
+            return [trace for _, _, trace in sorted(self._slowest, reverse=True)]
+
+    def dump_slowest(self, directory):
+        """Write the slowest page loads as <portal>-<rank>.har.json files; returns their paths"""
+        os.makedirs(directory, exist_ok=True)
+        paths = []
+        for rank, trace in enumerate(self.slowest_pages(), 1):
+            name = re.sub(r'[^A-Za-z0-9_.-]', '_', f"{self.portal_name}-{rank}.har.json")
+            path = os.path.join(directory, name)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(trace.to_har(), f, indent=1)
+            paths.append(path)
+        return paths
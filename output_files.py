@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Scrape Output Files
+Recognizes the CSVs earlier runs left behind: job_lists.csv from main.py and
+the timestamped files of the legacy single-portal scripts
+(jora_jobs_detailed_YYYYMMDD_HHMMSS.csv, seek_jobs_detailed_...), whose name
+gives their portal and scrape time. read_chunks() streams records out of all
+of them in bounded memory, for analysis scripts:
+
+    from output_files import read_chunks, read_frames
+    for chunk in read_chunks(columns=['title', 'company'], source='Seek', since='2025-08-01'):
+        ...
+    for df in read_frames(with_description=True):   # the same, as DataFrames
+        ...
+"""
+
+import csv
+import glob
+import itertools
+import os
+import re
+import sys
+import threading
+from datetime import date, datetime
+
+
+OUTPUT_COLUMNS = ['source', 'title', 'company', 'location', 'salary', 'description', 'job_url']
+
+LEGACY_OUTPUT = re.compile(r'(?P<portal>jora|seek)_jobs_detailed_(?P<stamp>\d{8}_\d{6})\.csv$', re.IGNORECASE)
+
+
+def output_file_info(path):
+    """
+    {'path', 'source', 'scraped_at'} for an output CSV. Legacy files get their
+    portal and time from the name; other files have source None (each row
+    carries it) and the file's modification time.
+    """
+    match = LEGACY_OUTPUT.search(os.path.basename(path))
+    if match:
+        return {
+            'path': path,
+            'source': match.group('portal').capitalize(),
+            'scraped_at': datetime.strptime(match.group('stamp'), "%Y%m%d_%H%M%S"),
+        }
+    return {'path': path, 'source': None, 'scraped_at': datetime.fromtimestamp(os.path.getmtime(path))}
+
+
+def find_output_files(directory="."):
+    """Legacy timestamped outputs in a directory, oldest first"""
+    paths = glob.glob(os.path.join(directory, "*_jobs_detailed_*.csv"))
+    infos = [output_file_info(path) for path in paths if LEGACY_OUTPUT.search(os.path.basename(path))]
+    return sorted(infos, key=lambda info: info['scraped_at'])
+
+
+def default_output_files(directory="."):
+    """Legacy outputs plus job_lists.csv (if present) in a directory, oldest first"""
+    files = find_output_files(directory)
+    combined = os.path.join(directory, "job_lists.csv")
+    if os.path.exists(combined):
+        files.append(output_file_info(combined))
+    return sorted(files, key=lambda info: info['scraped_at'])
+
+
+def _as_date(value):
+    if value is None or isinstance(value, date) and not isinstance(value, datetime):
+        return value
+    if isinstance(value, datetime):
+        return value.date()
+    return date.fromisoformat(value)
+
+
+def _file_may_match(info, source, since, until):
+    """Filters that can be decided from the file name/time alone, before opening it"""
+    day = info['scraped_at'].date()
+    if since and day < since or until and day > until:
+        return False
+    return not (source and info['source'] and info['source'].lower() != source)
+
+
+def _iter_file(info, columns, with_description, source):
+    csv.field_size_limit(sys.maxsize)
+    with open(info['path'], newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
+            return
+        wanted = [
+            (index, name) for index, name in enumerate(header)
+            if (columns is None or name in columns) and (name != 'description' or with_description)
+        ]
+        source_index = header.index('source') if 'source' in header else None
+        scraped_at = info['scraped_at'].isoformat(timespec='seconds')
+        for row in reader:
+            row_source = row[source_index] if source_index is not None and source_index < len(row) else info['source']
+            if source and (row_source or "").lower() != source:
+                continue
+            record = {name: row[index] for index, name in wanted if index < len(row)}
+            if columns is None or 'source' in columns:
+                record['source'] = row_source
+            if columns is None or 'scraped_at' in columns:
+                record['scraped_at'] = scraped_at
+            yield record
+
+
+def read_records(files=None, directory=".", columns=None, with_description=False,
+                 source=None, since=None, until=None):
+    """
+    Records from every output file, one at a time, oldest file first.
+
+    files: paths (default: default_output_files(directory)). columns: only
+    keep these (plus the virtual 'source' and 'scraped_at' columns when
+    listed); description is dropped unless with_description is set, as it is
+    most of each row. source/since/until (portal name, date or 'YYYY-MM-DD',
+    inclusive) skip whole legacy files by their name before they are opened;
+    rows of job_lists.csv are filtered on their source column, and every
+    file is dated by its scrape time.
+    """
+    infos = default_output_files(directory) if files is None else [output_file_info(path) for path in files]
+    columns = set(columns) if columns is not None else None
+    if columns is not None and 'description' in columns:
+        with_description = True
+    source = source.lower() if source else None
+    since, until = _as_date(since), _as_date(until)
+    for info in infos:
+        if _file_may_match(info, source, since, until):
+            yield from _iter_file(info, columns, with_description, source)
+
+
+def read_chunks(chunksize=1000, **filters):
+    """Lists of up to chunksize records (see read_records for the filters); only one chunk is held at a time"""
+    records = read_records(**filters)
+    while True:
+        chunk = list(itertools.islice(records, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def read_frames(chunksize=10000, **filters):
+    """read_chunks() as pandas DataFrames"""
+    import pandas as pd
+    for chunk in read_chunks(chunksize, **filters):
+        yield pd.DataFrame.from_records(chunk)
+
+
+class CsvSink:
+    """
+    Streams rows to a CSV as they are scraped (bounded-memory mode), shared by
+    all crawler threads. Rows go to <path>.partial: commit() renames it over
+    path once the run has finished, abort() only closes it, so an interrupted
+    run leaves the previous output in place and its rows in the .partial file.
+    """
+
+    def __init__(self, path="job_lists.csv", columns=OUTPUT_COLUMNS, flush_every=50):
+        self.path = path
+        self.partial_path = path + ".partial"
+        self.flush_every = flush_every
+        self.lock = threading.Lock()
+        self.rows = 0
+        self.file = open(self.partial_path, 'w', newline='', encoding='utf-8')
+        self.writer = csv.DictWriter(self.file, fieldnames=columns, restval='N/A', extrasaction='ignore')
+        self.writer.writeheader()
+
+    def write(self, record):
+        with self.lock:
+            self.writer.writerow(record)
+            self.rows += 1
+            if self.rows % self.flush_every == 0:
+                self.file.flush()
+
+    def commit(self):
+        """Finish a successful run: replace path with the streamed rows"""
+        with self.lock:
+            if self.file.closed:
+                raise ValueError(f"{self.partial_path} was already committed or aborted")
+            self.file.close()
+            os.replace(self.partial_path, self.path)
+
+    def abort(self):
+        """Finish an interrupted run: keep path as it was and the rows in partial_path"""
+        with self.lock:
+            if not self.file.closed:
+                self.file.close()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Raw Page Archive
+Keeps the HTML of fetched job detail pages, so extraction can be re-run
+offline (cli.py replay) after selectors change, without touching the portals
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+
+
+class PageArchive:
+    """
+    Directory of gzipped pages plus an index.jsonl with one line per saved page:
+    {"portal", "job_url", "path", "fetched_at"}. Re-fetching a job overwrites
+    its page; replay then uses the newest copy.
+    """
+
+    def __init__(self, directory="page_archive"):
+        self.directory = directory
+        self.index_path = os.path.join(directory, "index.jsonl")
+        self.lock = threading.Lock()
+
+    def save(self, portal, job_url, html):
+        name = hashlib.sha1(job_url.encode('utf-8')).hexdigest() + ".html.gz"
+        relative_path = os.path.join(portal, name)
+        path = os.path.join(self.directory, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            f.write(html)
+        entry = {
+            'portal': portal,
+            'job_url': job_url,
+            'path': relative_path,
+            'fetched_at': datetime.now().isoformat(timespec='seconds'),
+        }
+        with self.lock:
+            with open(self.index_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + "\n")
+        return path
+
+    def entries(self, portal=None):
+        """Index entries, newest copy of each page only, in first-archived order"""
+        if not os.path.exists(self.index_path):
+            return []
+        latest = {}
+        with open(self.index_path, encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                if portal is None or entry['portal'] == portal:
+                    latest[entry['path']] = entry
+        return list(latest.values())
+
+    def load(self, entry):
+        with gzip.open(os.path.join(self.directory, entry['path']), 'rt', encoding='utf-8') as f:
+            return f.read()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Listing Page Change Detection
+Fingerprints the ordered job IDs of every search result page and keeps them
+between runs, so result pages that have not changed since the last crawl can
+be skipped
+"""
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+
+
+class PageFingerprintStore:
+    """
+    JSON file of {search key: {page number: fingerprint}}.
+
+    A search key identifies one search (portal + search URL), so several queries
+    can share one store. Writes go to a temporary file that replaces the store,
+    so an interrupted run never leaves a truncated file behind.
+    """
+
+    def __init__(self, path="page_fingerprints.json"):
+        self.path = path
+        self.lock = threading.Lock()
+        self.pages = {}
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                self.pages = json.load(f)
+
+    @staticmethod
+    def fingerprint(job_ids):
+        """Hash of the ordered job IDs on a page"""
+        return hashlib.sha1("\n".join(job_id or "" for job_id in job_ids).encode('utf-8')).hexdigest()
+
+    def is_unchanged(self, key, page_number, fingerprint):
+        with self.lock:
+            previous = self.pages.get(key, {}).get(str(page_number))
+        return previous is not None and previous['fingerprint'] == fingerprint
+
+    def update(self, key, page_number, fingerprint, job_count):
+        with self.lock:
+            self.pages.setdefault(key, {})[str(page_number)] = {
+                'fingerprint': fingerprint,
+                'jobs': job_count,
+                'updated_at': datetime.now().isoformat(timespec='seconds'),
+            }
+
+    def save(self):
+        with self.lock:
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.pages, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.path)
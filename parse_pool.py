@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Process-Pool HTML Parsing
+Runs BeautifulSoup parsing and the portal's extract_job_details in worker
+processes, so CPU-bound parsing of large pages scales across cores instead
+of being serialized by the GIL on the threads driving the browsers
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from bs4 import BeautifulSoup
+from selector_stats import SelectorStats
+
+
+# One crawler instance per portal in each worker process, reused across pages
+_crawlers = {}
+
+
+def _crawler_for(portal_name):
+    crawler = _crawlers.get(portal_name)
+    if crawler is None:
+        # Imported here so the parent only pays for it when a pool is used
+        from portals import create_crawler
+        crawler = _crawlers[portal_name] = create_crawler(portal_name)
+    return crawler
+
+
+def parse_job_html(portal_name, html, job_url):
+    """Parse one detail page and return the plain record (runs in a worker process)"""
+    soup = BeautifulSoup(html, 'html.parser')
+    try:
+        details = _crawler_for(portal_name).extract_job_details(soup, job_url)
+    finally:
+        soup.decompose()
+    details['source'] = portal_name
+    details['job_url'] = job_url
+    return details
+
+
+def parse_job_html_with_stats(portal_name, html, job_url, chains=None):
+    """
+    parse_job_html with the parent's selector statistics (a SelectorStats.snapshot)
+    deciding the fallback order. Returns (record, lookups): the selector lookups
+    made while parsing, for the parent to replay into its own statistics.
+    """
+    stats = SelectorStats(path=None)
+    stats.chains = chains or {}
+    stats.lookups = []
+    _crawler_for(portal_name).selector_stats = stats
+    return parse_job_html(portal_name, html, job_url), stats.lookups
+
+
+def _parse_job_page(args):
+    return parse_job_html(*args)
+
+
+class ParsePool:
+    """A shared ProcessPoolExecutor for job page parsing"""
+
+    def __init__(self, max_workers=None):
+        self.executor = ProcessPoolExecutor(max_workers=max_workers)
+
+    def submit(self, portal_name, html, job_url, chains=None):
+        """
+        Queue a page for parsing; returns a Future of (record, selector lookups),
+        see parse_job_html_with_stats
+        """
+        return self.executor.submit(parse_job_html_with_stats, portal_name, html, job_url, chains)
+
+    def parse(self, portal_name, html, job_url):
+        """Parse a page in a worker process and wait for the record"""
+        record, _ = self.submit(portal_name, html, job_url).result()
+        return record
+
+    def parse_many(self, portal_name, pages, chunksize=8):
+        """Parse an iterable of (html, job_url) pairs; yields records in input order"""
+        tasks = ((portal_name, html, job_url) for html, job_url in pages)
+        return self.executor.map(_parse_job_page, tasks, chunksize=chunksize)
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+Portal Registry
+Maps portal names to their crawler classes and default crawl settings
+"""
+
+from jora_crawler import JoraCrawler
+from seek_crawler import SeekCrawler
+
+
+# Crawler class and page limit for each portal
+CRAWLERS = {
+    'Jora': JoraCrawler,
+    'Seek': SeekCrawler,
+}
+MAX_PAGES = {
+    'Jora': 34,
+    'Seek': 25,
+}
+
+
+def create_crawler(portal, **kwargs):
+    """Instantiate the crawler for a portal name (case-insensitive)"""
+    for name, crawler_class in CRAWLERS.items():
+        if name.lower() == portal.lower():
+            return crawler_class(**kwargs)
+    raise ValueError(f"Unknown portal '{portal}'. Known portals: {', '.join(CRAWLERS)}")
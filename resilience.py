@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Retry and Circuit Breaker Helpers for Job Portal Crawlers
+Failed job pages are retried with exponential backoff, and a portal is paused
+after a run of consecutive failures instead of timing out on every remaining job
+"""
+
+import heapq
+import random
+import time
+
+
+class CircuitOpenError(Exception):
+    """Raised when a portal keeps failing after repeated cool-downs"""
+    pass
+
+
+class RetryQueue:
+    """Queue of failed job URLs, each released again after an exponential backoff"""
+
+    def __init__(self, max_attempts=3, base_delay=5, max_delay=120, jitter=0.25):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.attempts = {}
+        self.exhausted = []
+        self._heap = []
+
+    def __len__(self):
+        return len(self._heap)
+
+    def backoff(self, attempt):
+        """Delay before retry number `attempt` (1-based)"""
+        delay = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def push(self, job_url, error=None):
+        """
+        Record a failed attempt for job_url and schedule a retry.
+        Returns False once the retry limit is reached and the URL is given up on.
+        """
+        attempt = self.attempts.get(job_url, 0) + 1
+        self.attempts[job_url] = attempt
+        if attempt >= self.max_attempts:
+            self.exhausted.append((job_url, str(error) if error else None))
+            return False
+        ready_at = time.monotonic() + self.backoff(attempt)
+        heapq.heappush(self._heap, (ready_at, job_url))
+        return True
+
+    def pop_ready(self):
+        """Return all URLs whose backoff has elapsed"""
+        now = time.monotonic()
+        ready = []
+        while self._heap and self._heap[0][0] <= now:
+            ready.append(heapq.heappop(self._heap)[1])
+        return ready
+
+    def queued_urls(self):
+        """URLs still waiting for a retry"""
+        return {job_url for _, job_url in self._heap}
+
+    def seconds_until_ready(self):
+        """Seconds until the next URL is due, or None if the queue is empty"""
+        if not self._heap:
+            return None
+        return max(0.0, self._heap[0][0] - time.monotonic())
+
+
+class CircuitBreaker:
+    """
+    Per-portal circuit breaker.
+
+    After `failure_threshold` consecutive failures the circuit opens and the
+    portal is paused for a cool-down. The next request is a trial (half-open):
+    success closes the circuit, failure re-opens it with a doubled cool-down.
+    After `max_trips` openings without recovery the portal is abandoned.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold=5, cooldown=60, max_cooldown=600, max_trips=3):
+        self.failure_threshold = failure_threshold
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.max_trips = max_trips
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.trips = 0
+        self.opened_at = None
+        self.cooldown = cooldown
+
+    def record_success(self):
+        self.consecutive_failures = 0
+        self.trips = 0
+        self.cooldown = self.base_cooldown
+        self.state = self.CLOSED
+
+    def record_failure(self):
+        """Count a failure; returns True if this failure opened the circuit"""
+        self.consecutive_failures += 1
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state == self.HALF_OPEN:
+                self.cooldown = min(self.max_cooldown, self.cooldown * 2)
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+            self.trips += 1
+            return True
+        return False
+
+    def remaining_cooldown(self):
+        if self.state != self.OPEN:
+            return 0.0
+        return max(0.0, self.opened_at + self.cooldown - time.monotonic())
+
+    def before_request(self, sleep=time.sleep):
+        """
+        Block until a request may be made. Sleeps out an open circuit's cool-down,
+        then lets one trial request through. Raises CircuitOpenError when the
+        portal has tripped too many times in a row.
+        """
+        if self.state != self.OPEN:
+            return
+        if self.trips >= self.max_trips:
+            raise CircuitOpenError(
+                f"circuit opened {self.trips} times without recovering"
+            )
+        remaining = self.remaining_cooldown()
+        if remaining > 0:
+            sleep(remaining)
+        self.state = self.HALF_OPEN
@@ -5,31 +5,78 @@ Inherits from BaseCrawler and implements Seek-specific scraping logic
 """
 
 from base_crawler import BaseCrawler
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from dom_scripts import build_extraction_script
 from bs4 import BeautifulSoup
+from urllib.parse import urlencode
 import re
 import time
 import random
+import logging
 
 
 class SeekCrawler(BaseCrawler):
     """Seek.com.au specific crawler implementation"""
     
-    def __init__(self):
+    page_param = "page"
+    
+    # Same fields and fallbacks as extract_job_details, evaluated in the browser
+    extraction_script = build_extraction_script(r"""
+        var salary = text(first(['[data-automation="job-detail-salary"]']));
+        if (salary === null) {
+            var containers = document.querySelectorAll('[aria-label*="Salary"]');
+            for (var i = 0; i < containers.length; i++) {
+                var label = containers[i].getAttribute('aria-label') || '';
+                if (label.indexOf('Salary:') !== -1) {
+                    salary = label.replace('Salary:', '').trim();
+                    break;
+                }
+            }
+        }
+        if (salary === null) {
+            var match = text(document.documentElement).match(/\$[\d,]+(?:\.\d{2})?(?:\s*-\s*\$[\d,]+(?:\.\d{2})?)?/);
+            if (match) { salary = match[0]; }
+        }
+        return {
+            title: text(first(['[data-automation="job-detail-title"]', 'h1'])),
+            company: text(first(['[data-automation="advertiser-name"]', '[data-automation="jobCompany"]'])),
+            location: text(first(['[data-automation="job-detail-location"]', '[data-automation="jobLocation"]'])),
+            salary: salary,
+            description: text(first([
+                '[data-automation="job-detail-description"]',
+                '.sye2ly0',
+                '[data-automation="jobDescription"]',
+                '.job-description'
+            ]))
+        };
+    """)
+    
+    def __init__(self, search_url=None, query=None, location=None, worker_id=None):
         super().__init__(
             portal_name="Seek",
-            search_url="https://www.seek.com.au/sponsorship-available-jobs"
+            search_url=search_url or self.build_search_url(query, location),
+            worker_id=worker_id
         )
+        # Seek's result cards used to get a 15s wait rather than Jora's 20s
+        self.timeouts.defaults['cards'] = 15
+    
+    @staticmethod
+    def build_search_url(query=None, location=None):
+        """Seek search URL for a keyword query and location (default: the sponsorship search)"""
+        if not query and not location:
+            return "https://www.seek.com.au/sponsorship-available-jobs"
+        params = {}
+        if query:
+            params['keywords'] = query
+        if location:
+            params['where'] = location
+        return "https://www.seek.com.au/jobs?" + urlencode(params)
     
     def wait_for_job_cards(self):
         """Wait for Seek job cards to load"""
+        from selenium.common.exceptions import TimeoutException
+        
         try:
-            WebDriverWait(self.driver, 15).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='job-card']"))
-            )
+            self.timed_wait(self.driver, "[data-testid='job-card']", 'cards')
         except TimeoutException:
             raise Exception("No job cards found on Seek")
     
@@ -45,26 +92,47 @@ class SeekCrawler(BaseCrawler):
             return "https://www.seek.com.au" + job_link.get('href')
         return "N/A"
     
+    def extract_card_details(self, card):
+        """Extract the job fields shown on a Seek job card"""
+        title_elem = card.select_one('[data-testid="job-card-title"]')
+        company_elem = card.select_one('[data-automation="jobCompany"]')
+        location_elem = card.select_one('[data-automation="jobLocation"]')
+        salary_elem = card.select_one('[data-automation="jobSalary"]')
+        
+        return {
+            'title': title_elem.get_text(strip=True) if title_elem else "N/A",
+            'company': company_elem.get_text(strip=True) if company_elem else "N/A",
+            'location': location_elem.get_text(strip=True) if location_elem else "N/A",
+            'salary': salary_elem.get_text(strip=True) if salary_elem else "N/A",
+        }
+    
+    def is_promoted(self, card, job_url):
+        """Seek marks promoted listings in the job URL (type=promoted)"""
+        return 'type=promoted' in job_url
+    
     def extract_job_details(self, soup, job_url):
         """Extract job details from Seek job page"""
         details = {}
         
-        # Extract title - using the correct selector from job page
+        # Extract title - using the correct selector from job page. Fixed order:
+        # the generic h1 fallback would also match pages that have the real one
         title_elem = soup.select_one('[data-automation="job-detail-title"]')
         if not title_elem:
             title_elem = soup.select_one('h1')
         details['title'] = title_elem.get_text(strip=True) if title_elem else "N/A"
         
         # Extract company - using the correct selector from job page
-        company_elem = soup.select_one('[data-automation="advertiser-name"]')
-        if not company_elem:
-            company_elem = soup.select_one('[data-automation="jobCompany"]')
+        company_elem = self.select_first(soup, 'company', [
+            '[data-automation="advertiser-name"]',
+            '[data-automation="jobCompany"]',
+        ])
         details['company'] = company_elem.get_text(strip=True) if company_elem else "N/A"
         
         # Extract location - using the correct selector from job page
-        location_elem = soup.select_one('[data-automation="job-detail-location"]')
-        if not location_elem:
-            location_elem = soup.select_one('[data-automation="jobLocation"]')
+        location_elem = self.select_first(soup, 'location', [
+            '[data-automation="job-detail-location"]',
+            '[data-automation="jobLocation"]',
+        ])
         details['location'] = location_elem.get_text(strip=True) if location_elem else "N/A"
         
         # Extract salary - this job doesn't have specific salary info, so we'll use N/A
@@ -92,89 +160,98 @@ class SeekCrawler(BaseCrawler):
         details['salary'] = salary
         
         # Extract description - using the correct selector from job page
-        desc_elem = soup.select_one('[data-automation="job-detail-description"]')
-        if not desc_elem:
-            # Try to find description in the job content area
-            desc_elem = soup.select_one('.sye2ly0')  # Based on the HTML structure
-        if not desc_elem:
-            desc_elem = soup.select_one('[data-automation="jobDescription"]')
-        if not desc_elem:
-            desc_elem = soup.select_one('.job-description')
+        desc_elem = self.select_first(soup, 'description', [
+            '[data-automation="job-detail-description"]',
+            '.sye2ly0',  # Job content area, based on the HTML structure
+            '[data-automation="jobDescription"]',
+            '.job-description',
+        ])
         details['description'] = desc_elem.get_text(strip=True) if desc_elem else "N/A"
         
         return details
     
     def navigate_to_next_page(self, driver, page_number):
         """Navigate to next page on Seek"""
-        print(f"\nLooking for next page on Seek...")
+        from selenium.common.exceptions import TimeoutException
+        
+        self.log.debug("Looking for next page on Seek...")
+        self.throttle()
         
-        # Always return to search results page before looking for pagination
-        print(f"Returning to search results page to find next button...")
-        driver.get(self.search_url)
+        # Always return to the current results page before looking for pagination
+        self.log.debug("Returning to search results page to find next button...")
+        self.load_page(driver, self.page_url(page_number))
         time.sleep(random.uniform(2, 3))
         
         # Wait for job cards to load again
         try:
-            WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='job-card']"))
-            )
-            print("✓ Returned to search results page successfully")
+            self.timed_wait(driver, "[data-testid='job-card']", 'pagination')
+            self.log.debug("✓ Returned to search results page successfully")
         except TimeoutException:
-            print("✗ Timeout waiting for job cards after returning to search page")
+            self.log.warning("✗ Timeout waiting for job cards after returning to search page")
             return False
         
         try:
-            # Try multiple selectors for next button based on HTML analysis
-            next_selectors = [
-                'a[data-automation="page-' + str(page_number + 1) + '"][aria-label="Next"]',  # Exact match from HTML
+            # Try multiple selectors for next button based on HTML analysis,
+            # in the order that found it most often ({next_page} is filled in)
+            next_selectors = self.ordered_selectors('pagination', [
+                'a[data-automation="page-{next_page}"][aria-label="Next"]',  # Exact match from HTML
                 'a[aria-label="Next"]',  # Primary selector based on HTML analysis
-                'a[data-automation="page-' + str(page_number + 1) + '"]',  # Dynamic page selector
+                'a[data-automation="page-{next_page}"]',  # Dynamic page selector
                 'a[rel="next"]',
                 '[data-automation="page-next"]',
                 'a[aria-label="next"]',
                 'button[aria-label="Next"]',
                 '.pagination a:last-child',
                 '[data-testid="next-page"]',
-                'a[href*="page=' + str(page_number + 1) + '"]'
-            ]
+                'a[href*="page={next_page}"]'
+            ], page_number)
             
+            # Resolve every candidate selector, the "next" text fallback and the
+            # aria-label fallback in one browser call instead of a round-trip each
+            probe_selectors = [selector for _, selector in next_selectors]
+            probe_selectors += ['a[aria-label*="Next"]', 'a[data-automation*="page-"]']
+            probe = self.probe_selectors(
+                driver, probe_selectors,
+                attributes=['href', 'aria-label', 'data-automation'], link_text='next'
+            )
+            
+            # First displayed match wins; otherwise keep the last match found
             next_button = None
-            for selector in next_selectors:
-                try:
-                    next_button = driver.find_element(By.CSS_SELECTOR, selector)
-                    if next_button and next_button.is_displayed():
-                        print(f"  ✓ Found next button with selector: {selector}")
+            tried = []
+            hit = None
+            for template, selector in next_selectors:
+                tried.append(template)
+                matches = probe['selectors'].get(selector)
+                if matches:
+                    next_button = matches[0]
+                    hit = template
+                    if next_button['displayed']:
+                        self.log.debug("  ✓ Found next button with selector: %s", selector)
                         break
-                except:
-                    continue
+            self.record_selector_hit('pagination', tried, hit)
             
             # If no button found, try text-based search
             if not next_button:
-                try:
-                    next_links = driver.find_elements(By.TAG_NAME, 'a')
-                    for link in next_links:
-                        if link.text.strip().lower() == 'next':
-                            next_button = link
-                            break
-                except:
-                    pass
+                for match in probe['text_matches']:
+                    if match['text'].lower() == 'next':
+                        next_button = match
+                        break
             
             # Additional check: look for any link with "Next" in aria-label
             if not next_button:
-                try:
-                    next_links = driver.find_elements(By.CSS_SELECTOR, 'a[aria-label*="Next"]')
-                    for link in next_links:
-                        if 'Next' in link.get_attribute('aria-label'):
-                            next_button = link
-                            break
-                except:
-                    pass
+                for match in probe['selectors'].get('a[aria-label*="Next"]') or []:
+                    if 'Next' in (match['attributes'].get('aria-label') or ''):
+                        next_button = match
+                        break
             
             if next_button:
-                print(f"  ✓ Next button found: {next_button.get_attribute('aria-label')} - Enabled: {next_button.is_enabled()}")
-                if next_button.is_enabled():
+                enabled = next_button['enabled']
+                next_href = next_button['attributes'].get('href')
+                self.log.debug("  ✓ Next button found: %s - Enabled: %s", next_button['attributes'].get('aria-label'), enabled)
+                next_button = next_button['element']
+                if enabled:
                     try:
-                        print(f"Clicking next button to go to page {page_number + 1}")
+                        self.log.debug("Clicking next button to go to page %d", page_number + 1)
                         
                         # Try multiple click methods
                         try:
@@ -186,9 +263,8 @@ class SeekCrawler(BaseCrawler):
                                 next_button.click()
                             except:
                                 # Method 3: Get href and navigate
-                                href = next_button.get_attribute('href')
-                                if href:
-                                    driver.get(href)
+                                if next_href:
+                                    self.load_page(driver, next_href)
                                 else:
                                     raise Exception("No href found on next button")
                         
@@ -196,48 +272,42 @@ class SeekCrawler(BaseCrawler):
                         return True
                         
                     except Exception as e:
-                        print(f"Error clicking next button: {e}")
+                        self.log.warning("Error clicking next button: %s", e)
                         # Try URL-based pagination as fallback
                         try:
-                            print("Trying URL-based pagination...")
-                            base_search_url = "https://www.seek.com.au/sponsorship-available-jobs"
-                            new_url = f"{base_search_url}?page={page_number + 1}"
-                            driver.get(new_url)
+                            self.log.info("Trying URL-based pagination...")
+                            self.load_page(driver, self.page_url(page_number + 1))
                             time.sleep(random.uniform(2, 4))
-                            print(f"✓ Successfully navigated to page {page_number + 1}")
+                            self.log.info("✓ Successfully navigated to page %d", page_number + 1)
                             return True
                         except Exception as url_error:
-                            print(f"Error with URL-based pagination: {url_error}")
+                            self.log.error("Error with URL-based pagination: %s", url_error)
                             return False
                 else:
-                    print("  ✗ Next button is disabled")
-                    print("✓ No more pages available")
+                    self.log.debug("  ✗ Next button is disabled")
+                    self.log.info("✓ No more pages available")
                     return False
             else:
-                print("  ✗ No next button found")
-                # Debug: Show current URL and try to find any pagination elements
-                print(f"  Debug: Current URL: {driver.current_url}")
-                try:
-                    pagination_elements = driver.find_elements(By.CSS_SELECTOR, 'a[data-automation*="page-"]')
-                    print(f"  Debug: Found {len(pagination_elements)} pagination elements")
-                    for elem in pagination_elements:
-                        print(f"    - {elem.get_attribute('data-automation')} | {elem.get_attribute('aria-label')}")
-                except:
-                    pass
-                print("✓ No more pages available")
+                self.log.debug("  ✗ No next button found")
+                # Debug: Show current URL and the pagination elements found by the probe
+                if self.log.isEnabledFor(logging.DEBUG):
+                    self.log.debug("  Debug: Current URL: %s", driver.current_url)
+                    pagination_elements = probe['selectors'].get('a[data-automation*="page-"]') or []
+                    self.log.debug("  Debug: Found %d pagination elements", len(pagination_elements))
+                    for match in pagination_elements:
+                        self.log.debug("    - %s | %s", match['attributes'].get('data-automation'), match['attributes'].get('aria-label'))
+                self.log.info("✓ No more pages available")
                 return False
                 
         except Exception as e:
-            print(f"Error finding next button: {e}")
+            self.log.warning("Error finding next button: %s", e)
             # Try URL-based pagination as fallback
             try:
-                print("Trying URL-based pagination...")
-                base_search_url = "https://www.seek.com.au/sponsorship-available-jobs"
-                new_url = f"{base_search_url}?page={page_number + 1}"
-                driver.get(new_url)
+                self.log.info("Trying URL-based pagination...")
+                self.load_page(driver, self.page_url(page_number + 1))
                 time.sleep(random.uniform(2, 4))
-                print(f"✓ Successfully navigated to page {page_number + 1}")
+                self.log.info("✓ Successfully navigated to page %d", page_number + 1)
                 return True
             except Exception as url_error:
-                print(f"Error with URL-based pagination: {url_error}")
+                self.log.error("Error with URL-based pagination: %s", url_error)
                 return False
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Self-Tuning Selector Fallbacks
+Records which selector of each fallback chain actually matches, so chains are
+tried most-likely-first and selectors that never match can be reported
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+
+
+class SelectorStats:
+    """
+    Hit statistics per fallback chain: {chain: {selector: {tries, hits, last_hit}}}.
+
+    Chains are named "<Portal>.<field>". Selectors containing a page number are
+    stored as templates (e.g. 'a[href*="&p={next_page}"]') so their counts add up
+    across pages. Counts are halved once a selector reaches `window` tries, so a
+    chain re-adapts within a few hundred pages after the markup changes.
+    With path=None the stats live in memory only. With `lookups` set to a
+    list, every recorded lookup is also appended to it as (chain, tried, hit),
+    so lookups made in a parse worker process can be replayed in the parent.
+    """
+
+    def __init__(self, path="selector_stats.json", window=200):
+        self.path = path
+        self.window = window
+        self.lock = threading.Lock()
+        self.chains = {}
+        self.lookups = None
+        if path and os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                self.chains = json.load(f)
+
+    def hit_rate(self, chain, selector):
+        """Smoothed hit rate; selectors never tried rank as a coin flip"""
+        entry = self.chains.get(chain, {}).get(selector)
+        if not entry:
+            return 0.5
+        return (entry['hits'] + 1) / (entry['tries'] + 2)
+
+    def order(self, chain, selectors):
+        """The selectors, most likely hit first (ties keep the declared order)"""
+        with self.lock:
+            ranked = sorted(enumerate(selectors), key=lambda item: (-self.hit_rate(chain, item[1]), item[0]))
+        return [selector for _, selector in ranked]
+
+    def record(self, chain, tried, hit=None):
+        """Count one lookup: every selector in `tried` was evaluated, `hit` matched"""
+        with self.lock:
+            if self.lookups is not None:
+                self.lookups.append((chain, list(tried), hit))
+            stats = self.chains.setdefault(chain, {})
+            for selector in tried:
+                entry = stats.setdefault(selector, {'tries': 0, 'hits': 0, 'last_hit': None})
+                entry['tries'] += 1
+                if selector == hit:
+                    entry['hits'] += 1
+                    entry['last_hit'] = datetime.now().isoformat(timespec='seconds')
+                if entry['tries'] >= self.window:
+                    entry['tries'] //= 2
+                    entry['hits'] //= 2
+
+    def replay(self, lookups):
+        """Record lookups (chain, tried, hit) collected by another SelectorStats"""
+        for chain, tried, hit in lookups:
+            self.record(chain, tried, hit)
+
+    def snapshot(self, prefix=""):
+        """A copy of the chains whose names start with prefix (e.g. "Seek.")"""
+        with self.lock:
+            return {
+                chain: {selector: dict(entry) for selector, entry in stats.items()}
+                for chain, stats in self.chains.items() if chain.startswith(prefix)
+            }
+
+    def dead_selectors(self, min_tries=20):
+        """(chain, selector, tries) for selectors tried often without a single hit"""
+        with self.lock:
+            return [
+                (chain, selector, entry['tries'])
+                for chain, stats in sorted(self.chains.items())
+                for selector, entry in stats.items()
+                if entry['tries'] >= min_tries and entry['hits'] == 0
+            ]
+
+    def report(self, min_tries=20):
+        """Human-readable summary: each chain in its current order, dead selectors flagged"""
+        lines = []
+        for chain in sorted(self.chains):
+            lines.append(chain)
+            for selector in self.order(chain, list(self.chains[chain])):
+                entry = self.chains[chain][selector]
+                dead = entry['tries'] >= min_tries and entry['hits'] == 0
+                lines.append(
+                    f"  {'✗' if dead else '✓'} {entry['hits']:>4}/{entry['tries']:<4} {selector}"
+                    f"  (last hit: {entry['last_hit'] or 'never'})"
+                )
+        return "\n".join(lines)
+
+    def save(self):
+        if not self.path:
+            return
+        with self.lock:
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.chains, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.path)
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Browser Session Watchdog
+Enforces a hard deadline on page loads by killing a browser session whose
+driver.get() never returns, and measures the resident memory of a session's
+process tree (chromedriver + Chrome + renderers) for memory-based recycling
+"""
+
+import os
+import signal
+import threading
+import time
+from contextlib import contextmanager
+
+
+def _children(pid):
+    """Direct child PIDs, from /proc/<pid>/task/*/children"""
+    children = []
+    task_dir = f"/proc/{pid}/task"
+    try:
+        tasks = os.listdir(task_dir)
+    except OSError:
+        return children
+    for task in tasks:
+        try:
+            with open(f"{task_dir}/{task}/children") as f:
+                children.extend(int(child) for child in f.read().split())
+        except OSError:
+            continue
+    return children
+
+
+def process_tree(pid):
+    """pid and all of its descendants"""
+    pids = []
+    stack = [pid]
+    while stack:
+        current = stack.pop()
+        pids.append(current)
+        stack.extend(_children(current))
+    return pids
+
+
+def process_rss_mb(pid):
+    """Resident memory of one process in MB (VmRSS), 0 if it is gone"""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return 0.0
+
+
+def session_pid(driver):
+    """PID of the chromedriver process behind a Selenium driver, or None"""
+    try:
+        return driver.service.process.pid
+    except AttributeError:
+        return None
+
+
+def session_rss_mb(driver):
+    """Resident memory of a session's whole process tree in MB, or None where /proc is unavailable"""
+    pid = session_pid(driver)
+    if pid is None or not os.path.isdir(f"/proc/{pid}"):
+        return None
+    return sum(process_rss_mb(child) for child in process_tree(pid))
+
+
+def kill_session(driver):
+    """SIGKILL chromedriver and every browser process it started"""
+    pid = session_pid(driver)
+    if pid is None:
+        return
+    # Children first, so Chrome cannot outlive its driver
+    for child in reversed(process_tree(pid)):
+        try:
+            os.kill(child, signal.SIGKILL)
+        except OSError:
+            pass
+
+
+class Watchdog:
+    """
+    One monitor thread per crawler. `with watchdog.guard(seconds, driver):`
+    arms it around a blocking browser call; if the call is still running when
+    the deadline passes, on_timeout(driver) is called from the monitor thread.
+    """
+
+    def __init__(self, on_timeout, name="watchdog"):
+        self.on_timeout = on_timeout
+        self.name = name
+        self.condition = threading.Condition()
+        self.deadline = None
+        self.driver = None
+        self.fired = 0
+        self.thread = None
+
+    def _ensure_thread(self):
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self.thread.start()
+
+    @contextmanager
+    def guard(self, seconds, driver):
+        with self.condition:
+            self._ensure_thread()
+            self.deadline = time.monotonic() + seconds
+            self.driver = driver
+            self.condition.notify()
+        try:
+            yield
+        finally:
+            with self.condition:
+                self.deadline = None
+                self.driver = None
+                self.condition.notify()
+
+    def _run(self):
+        while True:
+            with self.condition:
+                while self.deadline is None:
+                    self.condition.wait()
+                remaining = self.deadline - time.monotonic()
+                if remaining > 0:
+                    self.condition.wait(remaining)
+                    continue
+                driver = self.driver
+                self.deadline = None
+                self.fired += 1
+            self.on_timeout(driver)
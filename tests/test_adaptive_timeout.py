@@ -0,0 +1,50 @@
+from adaptive_timeout import DEFAULT_TIMEOUTS, LatencyTracker
+
+
+def test_defaults_until_enough_samples():
+    tracker = LatencyTracker(min_samples=5)
+    for _ in range(4):
+        tracker.record('detail', 1.0)
+    assert tracker.timeout('detail') == DEFAULT_TIMEOUTS['detail']
+    assert tracker.timeout('unknown') == tracker.ceiling
+
+
+def test_timeout_is_percentile_times_margin():
+    tracker = LatencyTracker(percentile=95, margin=1.5, floor=1.0, ceiling=60.0)
+    for seconds in range(1, 21):
+        tracker.record('cards', float(seconds))
+    assert tracker.latency_percentile('cards') == 19.0
+    assert tracker.latency_percentile('cards', 50) == 10.0
+    assert tracker.timeout('cards') == 28.5
+
+
+def test_timeout_is_clamped():
+    fast = LatencyTracker(floor=3.0)
+    slow = LatencyTracker(ceiling=30.0)
+    for _ in range(10):
+        fast.record('detail', 0.1)
+        slow.record('detail', 50.0)
+    assert fast.timeout('detail') == 3.0
+    assert slow.timeout('detail') == 30.0
+
+
+def test_timeouts_push_the_timeout_up():
+    tracker = LatencyTracker(window=10, percentile=90, margin=1.0)
+    for _ in range(10):
+        tracker.record('detail', 4.0)
+    tracker.record_timeout('detail', 20.0)
+    # One outlier in ten is below the 90th percentile's rank
+    assert tracker.timeout('detail') == 4.0
+    for _ in range(3):
+        tracker.record_timeout('detail', 20.0)
+    assert tracker.timeout('detail') == 20.0
+
+
+def test_window_keeps_recent_samples():
+    tracker = LatencyTracker(window=5, margin=1.0)
+    for _ in range(5):
+        tracker.record('detail', 20.0)
+    for _ in range(5):
+        tracker.record('detail', 5.0)
+    assert tracker.timeout('detail') == 5.0
+    assert tracker.summary() == {'detail': {'samples': 5, 'p50': 5.0, 'p95': 5.0, 'timeout': 5.0}}
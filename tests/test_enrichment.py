@@ -0,0 +1,65 @@
+import pytest
+
+from enrichment import enrich_description
+
+
+@pytest.mark.parametrize('text', [
+    "Applicants must be Australian citizens or permanent residents.",
+    "Must hold a permanent resident visa or full working rights.",
+    "Holders of a temporary work visa are welcome to apply.",
+    "This is not a casual role.",
+])
+def test_visa_status_is_not_employment_type(text):
+    assert enrich_description(text)['employment_type'] == ""
+
+
+@pytest.mark.parametrize('text', [
+    "Unfortunately no visa sponsorship is offered for this role.",
+    "Visa sponsorship is not available.",
+    "No sponsorship available.",
+    "This role is not offering visa sponsorship.",
+])
+def test_declined_sponsorship(text):
+    assert enrich_description(text)['sponsorship'] is False
+
+
+@pytest.mark.parametrize('text, years', [
+    ("Family owned for over 40 years, we are hiring a cook with 2 years of experience.", (2, 2)),
+    ("Serving the community for 25+ years. Minimum 3 years experience as a chef.", (3, None)),
+])
+def test_company_history_is_not_experience(text, years):
+    facts = enrich_description(text)
+    assert (facts['experience_min_years'], facts['experience_max_years']) == years
+
+
+def test_years_without_experience_context():
+    facts = enrich_description("Our restaurant opened over 10 years ago and seats 80 guests.")
+    assert facts['experience_min_years'] is None
+
+
+def test_words_containing_day_names_and_keywords():
+    facts = enrich_description("Evening and morning shifts, closing at noon on public holidays.")
+    assert facts['available_days'] == ""
+    assert facts['employment_type'] == ""
+
+
+def test_positive_matches():
+    facts = enrich_description(
+        "Full-time permanent role. 482 visa sponsorship available for the right candidate. "
+        "Minimum 3 years of experience. Saturday: morning shifts, flexible hours."
+    )
+    assert facts['employment_type'] == "full_time;permanent"
+    assert facts['visa_subclasses'] == "482"
+    assert facts['sponsorship'] is True
+    assert (facts['experience_min_years'], facts['experience_max_years']) == (3, None)
+    assert facts['available_days'] == "Sat"
+    assert facts['works_weekends'] is True
+    assert facts['flexible_hours'] is True
+
+
+def test_negated_weekends():
+    assert enrich_description("Monday to Friday, no weekends.")['works_weekends'] is False
+
+
+def test_glued_words():
+    assert enrich_description("Commis chef for our kitchenFull-time")['employment_type'] == "full_time"
@@ -0,0 +1,71 @@
+import pytest
+
+import frontier
+from frontier import Deadline, Frontier, load_seen_job_ids
+
+
+def drain(queue):
+    entries = []
+    while True:
+        entry = queue.pop()
+        if entry is None:
+            return entries
+        entries.append(entry['job_id'])
+
+
+def test_unseen_jobs_come_first_then_earlier_pages():
+    queue = Frontier(seen_job_ids={'seek:1'})
+    queue.push("https://www.seek.com.au/job/1", 'seek:1', page_number=1, position=0)
+    queue.push("https://www.seek.com.au/job/3", 'seek:3', page_number=2, position=0)
+    queue.push("https://www.seek.com.au/job/2", 'seek:2', page_number=1, position=5)
+    assert queue.unseen_count() == 2
+    assert drain(queue) == ['seek:2', 'seek:3', 'seek:1']
+
+
+@pytest.mark.parametrize('promoted, expected', [
+    ('first', ['seek:2', 'seek:1']),
+    ('last', ['seek:1', 'seek:2']),
+    ('normal', ['seek:1', 'seek:2']),
+])
+def test_promoted_cards(promoted, expected):
+    queue = Frontier(promoted=promoted)
+    queue.push("https://www.seek.com.au/job/1", 'seek:1', page_number=1, position=0)
+    queue.push("https://www.seek.com.au/job/2", 'seek:2', page_number=1, position=1, promoted=True)
+    assert drain(queue) == expected
+
+
+def test_a_job_is_queued_once():
+    queue = Frontier()
+    assert queue.push("https://www.seek.com.au/job/1?type=standard", 'seek:1', 1, 0)
+    assert not queue.push("https://www.seek.com.au/job/1?type=promoted", 'seek:1', 2, 0)
+    assert len(queue) == 1
+
+
+def test_unknown_promoted_choice():
+    with pytest.raises(ValueError):
+        Frontier(promoted='middle')
+
+
+def test_load_seen_job_ids(tmp_path):
+    path = tmp_path / "job_lists.csv"
+    path.write_text(
+        "source,title,job_url\n"
+        "Seek,Chef,https://www.seek.com.au/job/81000001?type=standard\n"
+        "Jora,Cook,N/A\n",
+        encoding='utf-8'
+    )
+    assert load_seen_job_ids(str(path), str(tmp_path / "missing.csv"), None) == {'seek:81000001'}
+
+
+def test_deadline(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(frontier.time, 'monotonic', lambda: now[0])
+    deadline = Deadline(60)
+    assert deadline.fits(30)
+    now[0] += 45
+    assert deadline.remaining() == 15
+    assert not deadline.fits(15)
+    assert not deadline.expired()
+    now[0] += 20
+    assert deadline.remaining() == 0
+    assert deadline.expired()
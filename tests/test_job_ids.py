@@ -0,0 +1,36 @@
+import pytest
+
+from job_ids import canonical_job_id, portal_from_url
+
+
+@pytest.mark.parametrize('job_url, expected', [
+    ("https://www.seek.com.au/job/86068025?type=standard&ref=search-standalone", 'seek:86068025'),
+    ("https://www.seek.com.au/job/86068025", 'seek:86068025'),
+    ("https://au.jora.com/job/Motor-Mechanic-338b687bfb202c30ae08c9481bfe4a72?sol_key=abc&tk=xyz&sr=3",
+     'jora:338b687bfb202c30ae08c9481bfe4a72'),
+    ("https://au.jora.com/job/338b687bfb202c30ae08c9481bfe4a72", 'jora:338b687bfb202c30ae08c9481bfe4a72'),
+])
+def test_tracking_parameters_are_dropped(job_url, expected):
+    assert canonical_job_id(job_url) == expected
+
+
+def test_unknown_urls_keep_host_and_path():
+    assert canonical_job_id("https://jobs.example.com/listing/42?utm_source=x#apply", "Example") == \
+        'example:jobs.example.com/listing/42'
+    assert canonical_job_id("https://jobs.example.com/listing/42") == 'unknown:jobs.example.com/listing/42'
+
+
+def test_portal_url_without_an_id_falls_back_to_the_path():
+    assert canonical_job_id("https://www.seek.com.au/jobs-in-hospitality?page=2") == \
+        'seek:www.seek.com.au/jobs-in-hospitality'
+
+
+@pytest.mark.parametrize('job_url', [None, "", "N/A"])
+def test_missing_url(job_url):
+    assert canonical_job_id(job_url) is None
+
+
+def test_portal_from_url():
+    assert portal_from_url("https://www.seek.com.au/job/1") == "Seek"
+    assert portal_from_url("https://au.jora.com/job/x") == "Jora"
+    assert portal_from_url("https://example.com/job/1") is None
@@ -0,0 +1,106 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from job_store import JobStore
+
+
+URL = "https://www.seek.com.au/job/81000001"
+RUN_1 = datetime(2026, 1, 5, 9, 0)
+RUN_2 = datetime(2026, 1, 6, 9, 0)
+
+
+def job(**fields):
+    record = {'source': 'Seek', 'title': 'Chef', 'company': 'Harbour Bistro',
+              'location': 'Surry Hills, Sydney NSW', 'salary': '$70,000',
+              'description': 'Cook for a busy bistro', 'job_url': URL}
+    record.update(fields)
+    return record
+
+
+def stored(store):
+    return dict(store.conn.execute("SELECT * FROM jobs").fetchone())
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.db"))
+    yield store
+    store.close()
+
+
+def test_insert_then_update(store):
+    assert store.upsert([job()], scraped_at=RUN_1) == (1, 0)
+    assert store.upsert([job()], scraped_at=RUN_2) == (0, 1)
+    row = stored(store)
+    assert row['job_id'] == 'seek:81000001'
+    assert row['first_seen'] == '2026-01-05T09:00:00'
+    assert row['last_seen'] == '2026-01-06T09:00:00'
+    assert row['last_changed'] == '2026-01-05T09:00:00'
+    assert (row['suburb'], row['region'], row['state'], row['postcode']) == ('Surry Hills', 'Sydney', 'NSW', '2010')
+
+
+def test_missing_fields_keep_stored_values(store):
+    store.upsert([job()], scraped_at=RUN_1)
+    store.upsert([job(salary='N/A', description='N/A', location=None)], scraped_at=RUN_2)
+    row = stored(store)
+    assert row['salary'] == '$70,000'
+    assert row['description'] == 'Cook for a busy bistro'
+    assert row['suburb'] == 'Surry Hills'
+    assert row['last_changed'] == '2026-01-05T09:00:00'
+
+
+def test_changed_field_sets_last_changed(store):
+    store.upsert([job()], scraped_at=RUN_1)
+    store.upsert([job(salary='$75,000')], scraped_at=RUN_2)
+    row = stored(store)
+    assert row['salary'] == '$75,000'
+    assert row['last_changed'] == '2026-01-06T09:00:00'
+
+
+def test_older_record_only_widens_first_seen(store):
+    store.upsert([job()], scraped_at=RUN_2)
+    store.upsert([job(salary='$60,000')], scraped_at=RUN_1)
+    row = stored(store)
+    assert row['salary'] == '$70,000'
+    assert row['first_seen'] == '2026-01-05T09:00:00'
+    assert row['last_seen'] == '2026-01-06T09:00:00'
+
+
+def test_enriched_columns_and_cluster_id(store):
+    enriched = job(sponsorship='True', experience_min_years='2.0', experience_max_years=None,
+                   visa_subclasses='482', employment_type='full_time', available_days='',
+                   works_weekends=False, flexible_hours=False, cluster_id='seek:80000000')
+    store.upsert([enriched], scraped_at=RUN_1)
+    row = stored(store)
+    assert (row['sponsorship'], row['experience_min_years'], row['cluster_id']) == (1, 2, 'seek:80000000')
+
+    # An unenriched rerun with the same description keeps them
+    store.upsert([job()], scraped_at=RUN_2)
+    row = stored(store)
+    assert (row['sponsorship'], row['cluster_id']) == (1, 'seek:80000000')
+
+    # A new description clears what no longer describes it
+    store.upsert([job(description='Head chef for a new venue')], scraped_at=RUN_2 + timedelta(days=1))
+    row = stored(store)
+    assert row['sponsorship'] is None
+    assert row['cluster_id'] == 'seek:80000000'
+
+
+def test_stale_jobs_skip_expired(store):
+    store.upsert([job()], scraped_at=RUN_1)
+    assert [row['job_id'] for row in store.stale_jobs('Seek', RUN_2)] == ['seek:81000001']
+    store.record_revalidation(['seek:81000001'], expired=True, checked_at=RUN_1)
+    assert store.stale_jobs('Seek', RUN_2) == []
+
+    # Listed again: no longer expired
+    store.touch(['seek:81000001'], seen_at=RUN_1)
+    assert len(store.stale_jobs('Seek', RUN_2)) == 1
+
+
+def test_stale_jobs_skip_recently_checked(store):
+    store.upsert([job()], scraped_at=RUN_1)
+    store.record_revalidation(['seek:81000001'], expired=False, checked_at=RUN_2)
+    assert store.stale_jobs('Seek', RUN_2) == []
+    assert len(store.stale_jobs('Seek', RUN_2 + timedelta(days=1))) == 1
+    assert stored(store)['last_seen'] == '2026-01-05T09:00:00'
@@ -0,0 +1,54 @@
+import pytest
+
+from locations import normalize_location
+
+
+@pytest.mark.parametrize('location, expected', [
+    ("Arundel, Gold Coast QLD", ('Arundel', 'Gold Coast', 'QLD', '4214')),
+    ("Sydney NSW(Hybrid)", ('Sydney', 'Sydney', 'NSW', '2000')),
+    ("Sydney CBD NSW", ('Sydney', 'Sydney', 'NSW', '2000')),
+    ("Ballarat Central VIC", ('Ballarat Central', 'Ballarat & Central Highlands', 'VIC', '3350')),
+    ("Mt Druitt NSW", ('Mount Druitt', 'Sydney', 'NSW', '2770')),
+    ("Taree, Port Macquarie & Mid North Coast NSW",
+     ('Taree', 'Port Macquarie & Mid North Coast', 'NSW', '2430')),
+    ("Melbourne VIC", ('Melbourne', 'Melbourne', 'VIC', '3000')),
+    ("Hobart, Tasmania", ('Hobart', 'Hobart', 'TAS', '7000')),
+])
+def test_known_suburbs(location, expected):
+    assert normalize_location(location) == expected
+
+
+def test_bare_region():
+    assert normalize_location("Gold Coast QLD") == (None, 'Gold Coast', 'QLD', None)
+    assert normalize_location("Hunter Valley NSW") == (None, 'Newcastle, Maitland & Hunter', 'NSW', None)
+
+
+def test_suburb_outside_the_regions():
+    suburb, region, state, postcode = normalize_location("Port Augusta SA")
+    assert (suburb, region, state) == ('Port Augusta', None, 'SA')
+    assert postcode is not None
+
+
+@pytest.mark.parametrize('location', ["Sydney NSW 2000", "Sydney  NSW  2000", "Sydney 2000, NSW"])
+def test_postcode_in_the_string(location):
+    assert normalize_location(location) == ('Sydney', 'Sydney', 'NSW', '2000')
+
+
+def test_postcode_of_a_place_the_gazetteer_lacks():
+    assert normalize_location("Nowhereville WA 6999") == ('Nowhereville', None, 'WA', '6999')
+
+
+def test_unknown_place_keeps_what_the_string_gives():
+    assert normalize_location("Nowhereville, Outback WA") == ('Nowhereville', 'Outback', 'WA', None)
+
+
+@pytest.mark.parametrize('location', [None, "", "N/A"])
+def test_missing_location(location):
+    assert normalize_location(location) == (None, None, None, None)
+
+
+def test_memoized():
+    normalize_location.cache_clear()
+    normalize_location("Parramatta NSW")
+    normalize_location("Parramatta NSW")
+    assert normalize_location.cache_info().hits == 1
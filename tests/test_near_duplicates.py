@@ -0,0 +1,65 @@
+from datetime import datetime
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from job_store import JobStore  # noqa: E402
+from near_duplicates import MinHashLSH, UnionFind, assign_clusters  # noqa: E402
+
+
+CHEF = (
+    "We are looking for an experienced chef to join our busy restaurant team in the heart of the city. "
+    "You will prepare breakfast and lunch menus, manage stock and ordering, train junior kitchen staff "
+    "and keep the kitchen clean and compliant with food safety standards. Weekend availability is required."
+)
+MECHANIC = (
+    "Our workshop needs a qualified motor mechanic to service and repair light vehicles. You will diagnose "
+    "faults, carry out log book services, fit parts and talk customers through the work that was done. "
+    "A current driver licence and your own hand tools are essential for this full time position."
+)
+
+
+def record(job_id, description, title="Chef"):
+    return {'source': 'Seek', 'title': title, 'company': 'Cafe', 'location': 'Sydney NSW',
+            'description': description, 'job_url': f"https://www.seek.com.au/job/{job_id}"}
+
+
+def test_union_find():
+    groups = UnionFind(4)
+    groups.union(0, 1)
+    groups.union(2, 1)
+    assert groups.find(0) == groups.find(2) != groups.find(3)
+
+
+def test_every_pair_in_a_bucket_is_a_candidate():
+    lsh = MinHashLSH(bands=2, rows=2, max_bucket=3)
+    same = np.zeros(4, dtype=np.uint64)
+    pairs = lsh.candidate_pairs([same, same, None, same, same])
+    assert pairs == {(0, 1), (0, 3), (1, 3), (0, 4)}
+
+
+def test_reposts_share_a_cluster():
+    records = [
+        record(1, CHEF),
+        record(2, MECHANIC, title="Mechanic"),
+        record(3, CHEF.replace("busy restaurant", "busy cafe")),
+        record(4, "Chef wanted, apply now"),
+    ]
+    assert assign_clusters(records) == 1
+    assert [r['cluster_id'] for r in records] == ['seek:1', 'seek:2', 'seek:1', 'seek:4']
+
+
+def test_stored_jobs_give_their_cluster_id(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.db"))
+    try:
+        earlier = [record(1, CHEF)]
+        assign_clusters(earlier, store=store)
+        store.upsert(earlier, scraped_at=datetime(2025, 8, 1, 9))
+
+        later = [record(2, CHEF + " Apply today."), record(3, MECHANIC, title="Mechanic")]
+        assert assign_clusters(later, store=store, save_signatures=False) == 1
+        assert [r['cluster_id'] for r in later] == ['seek:1', 'seek:3']
+        assert store.stored_signatures(['seek:2', 'seek:3']) == {}
+    finally:
+        store.close()
@@ -0,0 +1,95 @@
+import csv
+import os
+from datetime import datetime
+
+import pytest
+
+from output_files import CsvSink, read_chunks, read_records
+
+
+def read_rows(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+def write_rows(path, rows, columns=('source', 'title', 'company', 'description', 'job_url')):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=[column for column in columns if column in rows[0]])
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+@pytest.fixture
+def outputs(tmp_path):
+    """Two legacy files (no source column) and a job_lists.csv dated 2025-08-10"""
+    write_rows(tmp_path / "jora_jobs_detailed_20250801_090000.csv",
+               [{'title': 'Cook', 'company': 'A', 'description': 'x' * 100}])
+    write_rows(tmp_path / "seek_jobs_detailed_20250805_090000.csv",
+               [{'title': 'Chef', 'company': 'B', 'description': 'y'}, {'title': 'Barista', 'company': 'C'}])
+    combined = tmp_path / "job_lists.csv"
+    write_rows(combined, [{'source': 'Seek', 'title': 'Baker', 'company': 'D'},
+                          {'source': 'Jora', 'title': 'Waiter', 'company': 'E'}])
+    stamp = datetime(2025, 8, 10, 9).timestamp()
+    os.utime(combined, (stamp, stamp))
+    return str(tmp_path)
+
+
+def test_commit_replaces_output(tmp_path):
+    path = tmp_path / "job_lists.csv"
+    path.write_text("old output\n", encoding='utf-8')
+    sink = CsvSink(str(path), flush_every=1)
+    sink.write({'title': 'Chef', 'source': 'Seek'})
+    sink.commit()
+
+    rows = read_rows(path)
+    assert [row['title'] for row in rows] == ['Chef']
+    assert rows[0]['company'] == 'N/A'
+    assert not (tmp_path / "job_lists.csv.partial").exists()
+
+
+def test_abort_keeps_previous_output(tmp_path):
+    path = tmp_path / "job_lists.csv"
+    path.write_text("old output\n", encoding='utf-8')
+    sink = CsvSink(str(path))
+    sink.write({'title': 'Chef', 'source': 'Seek'})
+    sink.abort()
+
+    assert path.read_text(encoding='utf-8') == "old output\n"
+    assert [row['title'] for row in read_rows(sink.partial_path)] == ['Chef']
+
+
+def test_commit_after_abort_fails(tmp_path):
+    sink = CsvSink(str(tmp_path / "job_lists.csv"))
+    sink.abort()
+    with pytest.raises(ValueError):
+        sink.commit()
+    assert not (tmp_path / "job_lists.csv").exists()
+
+
+def test_records_from_every_file_oldest_first(outputs):
+    records = list(read_records(directory=outputs))
+    assert [record['title'] for record in records] == ['Cook', 'Chef', 'Barista', 'Baker', 'Waiter']
+    assert [record['source'] for record in records] == ['Jora', 'Seek', 'Seek', 'Seek', 'Jora']
+    assert records[0]['scraped_at'] == '2025-08-01T09:00:00'
+    assert all('description' not in record for record in records)
+
+
+def test_columns_and_descriptions(outputs):
+    records = list(read_records(directory=outputs, columns=['title', 'description']))
+    assert records[0] == {'title': 'Cook', 'description': 'x' * 100}
+    assert records[3] == {'title': 'Baker'}
+
+
+@pytest.mark.parametrize('filters, titles', [
+    ({'source': 'seek'}, ['Chef', 'Barista', 'Baker']),
+    ({'source': 'Jora', 'until': '2025-08-04'}, ['Cook']),
+    ({'since': '2025-08-05', 'until': '2025-08-05'}, ['Chef', 'Barista']),
+])
+def test_filters(outputs, filters, titles):
+    assert [record['title'] for record in read_records(directory=outputs, **filters)] == titles
+
+
+def test_chunks(outputs):
+    chunks = list(read_chunks(chunksize=2, directory=outputs, columns=['title']))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert chunks[-1] == [{'title': 'Waiter'}]
@@ -0,0 +1,37 @@
+import json
+
+from page_fingerprints import PageFingerprintStore
+
+
+KEY = "Seek https://www.seek.com.au/jobs-in-hospitality"
+
+
+def test_fingerprint_depends_on_order():
+    fingerprint = PageFingerprintStore.fingerprint
+    assert fingerprint(['seek:1', 'seek:2']) == fingerprint(['seek:1', 'seek:2'])
+    assert fingerprint(['seek:1', 'seek:2']) != fingerprint(['seek:2', 'seek:1'])
+    assert fingerprint(['seek:1', None]) != fingerprint(['seek:1'])
+
+
+def test_unchanged_pages_survive_a_reload(tmp_path):
+    path = str(tmp_path / "page_fingerprints.json")
+    store = PageFingerprintStore(path)
+    fingerprint = store.fingerprint(['seek:1', 'seek:2'])
+    assert not store.is_unchanged(KEY, 1, fingerprint)
+    store.update(KEY, 1, fingerprint, job_count=2)
+    store.save()
+
+    reloaded = PageFingerprintStore(path)
+    assert reloaded.is_unchanged(KEY, 1, fingerprint)
+    assert not reloaded.is_unchanged(KEY, 2, fingerprint)
+    assert not reloaded.is_unchanged(KEY, 1, store.fingerprint(['seek:3', 'seek:1', 'seek:2']))
+    assert not reloaded.is_unchanged("Jora https://au.jora.com/j?q=chef", 1, fingerprint)
+
+
+def test_save_replaces_the_file(tmp_path):
+    path = tmp_path / "page_fingerprints.json"
+    store = PageFingerprintStore(str(path))
+    store.update(KEY, 1, store.fingerprint(['seek:1']), job_count=1)
+    store.save()
+    assert json.loads(path.read_text(encoding='utf-8'))[KEY]['1']['jobs'] == 1
+    assert not (tmp_path / "page_fingerprints.json.tmp").exists()
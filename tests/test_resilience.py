@@ -0,0 +1,95 @@
+import pytest
+
+import resilience
+from resilience import CircuitBreaker, CircuitOpenError, RetryQueue
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(resilience.time, 'monotonic', clock)
+    return clock
+
+
+def test_backoff_doubles_up_to_the_cap():
+    queue = RetryQueue(base_delay=5, max_delay=30, jitter=0)
+    assert [queue.backoff(attempt) for attempt in range(1, 6)] == [5, 10, 20, 30, 30]
+
+
+def test_backoff_jitter_stays_in_bounds():
+    queue = RetryQueue(base_delay=10, jitter=0.25)
+    assert all(7.5 <= queue.backoff(1) <= 12.5 for _ in range(100))
+
+
+def test_urls_are_released_after_their_backoff(clock):
+    queue = RetryQueue(max_attempts=3, base_delay=5, jitter=0)
+    assert queue.push("https://www.seek.com.au/job/1", "timeout")
+    assert queue.pop_ready() == []
+    assert queue.seconds_until_ready() == 5
+    assert queue.queued_urls() == {"https://www.seek.com.au/job/1"}
+
+    clock.sleep(5)
+    assert queue.pop_ready() == ["https://www.seek.com.au/job/1"]
+    assert len(queue) == 0
+    assert queue.seconds_until_ready() is None
+
+
+def test_url_is_given_up_after_max_attempts(clock):
+    queue = RetryQueue(max_attempts=2, jitter=0)
+    assert queue.push("https://www.seek.com.au/job/1", "timeout")
+    assert not queue.push("https://www.seek.com.au/job/1", ValueError("still failing"))
+    assert queue.exhausted == [("https://www.seek.com.au/job/1", "still failing")]
+    assert len(queue) == 1
+
+
+def test_circuit_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker(failure_threshold=3, cooldown=60)
+    assert not breaker.record_failure()
+    breaker.record_success()
+    assert not breaker.record_failure()
+    assert not breaker.record_failure()
+    assert breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.remaining_cooldown() == 60
+
+
+def test_open_circuit_waits_out_the_cooldown_then_lets_a_trial_through(clock):
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=60)
+    breaker.record_failure()
+    clock.sleep(20)
+    breaker.before_request(sleep=clock.sleep)
+    assert clock.now == 1060
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.trips == 0
+
+
+def test_failed_trial_doubles_the_cooldown(clock):
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=60, max_cooldown=100)
+    breaker.record_failure()
+    breaker.before_request(sleep=clock.sleep)
+    assert breaker.record_failure()
+    assert breaker.cooldown == 100
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_portal_is_abandoned_after_max_trips(clock):
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=1, max_trips=2)
+    breaker.record_failure()
+    breaker.before_request(sleep=clock.sleep)
+    breaker.record_failure()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(sleep=clock.sleep)
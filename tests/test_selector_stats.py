@@ -0,0 +1,56 @@
+from selector_stats import SelectorStats
+
+
+CHAIN = 'Seek.company'
+SELECTORS = ['[data-automation="advertiser-name"]', '[data-automation="jobCompany"]']
+
+
+def test_untried_chain_keeps_declared_order():
+    assert SelectorStats(path=None).order(CHAIN, SELECTORS) == SELECTORS
+
+
+def test_selector_that_hits_moves_first():
+    stats = SelectorStats(path=None)
+    for _ in range(3):
+        stats.record(CHAIN, SELECTORS, hit=SELECTORS[1])
+    assert stats.order(CHAIN, SELECTORS) == SELECTORS[::-1]
+    assert stats.hit_rate(CHAIN, SELECTORS[0]) == 0.2
+    assert stats.hit_rate(CHAIN, SELECTORS[1]) == 0.8
+
+
+def test_counts_are_halved_at_the_window():
+    stats = SelectorStats(path=None, window=4)
+    for _ in range(4):
+        stats.record(CHAIN, SELECTORS[:1], hit=SELECTORS[0])
+    assert stats.chains[CHAIN][SELECTORS[0]]['tries'] == 2
+    assert stats.chains[CHAIN][SELECTORS[0]]['hits'] == 2
+
+
+def test_dead_selectors():
+    stats = SelectorStats(path=None)
+    for _ in range(20):
+        stats.record(CHAIN, SELECTORS, hit=SELECTORS[1])
+    assert stats.dead_selectors() == [(CHAIN, SELECTORS[0], 20)]
+    assert "✗    0/20   " + SELECTORS[0] in stats.report()
+
+
+def test_replayed_lookups_add_up():
+    worker = SelectorStats(path=None)
+    worker.lookups = []
+    worker.record(CHAIN, SELECTORS, hit=SELECTORS[1])
+    worker.record('Seek.location', ['[data-automation="job-detail-location"]'])
+
+    parent = SelectorStats(path=None)
+    parent.replay(worker.lookups)
+    parent.replay(worker.lookups)
+    assert parent.snapshot("Seek.")[CHAIN][SELECTORS[1]]['hits'] == 2
+    assert parent.snapshot("Seek.")['Seek.location']['[data-automation="job-detail-location"]']['tries'] == 2
+    assert parent.snapshot("Jora.") == {}
+
+
+def test_stats_survive_a_reload(tmp_path):
+    path = str(tmp_path / "selector_stats.json")
+    stats = SelectorStats(path)
+    stats.record(CHAIN, SELECTORS, hit=SELECTORS[1])
+    stats.save()
+    assert SelectorStats(path).order(CHAIN, SELECTORS) == SELECTORS[::-1]
@@ -0,0 +1,76 @@
+import pytest
+
+from work_queue import CLAIMED, DONE, FAILED, PENDING, WorkQueue
+
+
+URLS = [
+    "https://www.seek.com.au/job/81000001",
+    "https://www.seek.com.au/job/81000002",
+]
+
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = WorkQueue(str(tmp_path / "work_queue.db"), visibility_timeout=300, max_attempts=2)
+    yield queue
+    queue.close()
+
+
+def test_publish_ignores_known_jobs(queue):
+    assert queue.publish('Seek', URLS) == 2
+    assert queue.publish('Seek', URLS + ["https://www.seek.com.au/job/81000001?type=standout"]) == 0
+    assert queue.counts('Seek')[PENDING] == 2
+
+
+def test_claims_are_exclusive(queue):
+    queue.publish('Seek', URLS)
+    first = queue.claim('worker-1')
+    second = queue.claim('worker-2')
+    assert {first['job_url'], second['job_url']} == set(URLS)
+    assert queue.claim('worker-3') is None
+    assert queue.counts()[CLAIMED] == 2
+
+
+def test_expired_claim_is_handed_out_again(queue):
+    queue.publish('Seek', URLS[:1])
+    stale = queue.claim('worker-1', visibility_timeout=-1)
+    reclaimed = queue.claim('worker-2')
+    assert reclaimed['job_id'] == stale['job_id']
+    assert reclaimed['attempts'] == 2
+
+    # The first worker's late ack must not overwrite the new claim
+    queue.ack(stale, {'title': 'late'})
+    assert queue.counts()[CLAIMED] == 1
+    queue.ack(reclaimed, {'title': 'Chef'})
+    assert list(queue.results()) == [{'title': 'Chef'}]
+    assert queue.counts()[DONE] == 1
+
+
+def test_expired_claims_stop_at_max_attempts(queue):
+    queue.publish('Seek', URLS[:1])
+    queue.claim('worker-1', visibility_timeout=-1)
+    queue.claim('worker-2', visibility_timeout=-1)
+    assert queue.claim('worker-3') is None
+    assert queue.counts()[FAILED] == 1
+    assert not queue.has_open_work()
+
+
+def test_fail_retries_until_max_attempts(queue):
+    queue.publish('Seek', URLS[:1])
+    assert queue.fail(queue.claim('worker-1'), "timeout") is True
+    assert queue.fail(queue.claim('worker-1'), "timeout") is False
+    assert queue.counts()[FAILED] == 1
+    assert not queue.has_open_work()
+
+
+def test_publishing_marker(queue):
+    assert not queue.publishing_finished('Seek')
+    queue.start_publishing('Seek')
+    assert not queue.publishing_finished('Seek')
+    queue.finish_publishing('Seek')
+    assert queue.publishing_finished('Seek')
+    assert not queue.publishing_finished('Jora')
+
+    # A new coordinator run clears the previous run's marker
+    queue.start_publishing('Seek')
+    assert not queue.publishing_finished('Seek')
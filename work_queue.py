@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Durable Work Queue for Sharded Crawling
+A file-backed SQLite queue shared by one coordinator and any number of worker
+processes. The coordinator publishes job URLs discovered on the listing pages;
+workers claim, fetch and ack them. Claims expire after a visibility timeout, so
+jobs held by a crashed worker are handed out again. The coordinator marks each
+portal's publishing as finished, so workers know an empty queue means done
+rather than not started yet.
+"""
+
+import json
+import os
+import socket
+import sqlite3
+import time
+from job_ids import canonical_job_id
+
+
+PENDING = "pending"
+CLAIMED = "claimed"
+DONE = "done"
+FAILED = "failed"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    portal TEXT NOT NULL,
+    job_id TEXT NOT NULL UNIQUE,
+    job_url TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    claimed_by TEXT,
+    visible_at REAL NOT NULL DEFAULT 0,
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_claim ON jobs (status, portal, visible_at);
+CREATE TABLE IF NOT EXISTS publishing (
+    portal TEXT PRIMARY KEY,
+    started_at REAL NOT NULL,
+    finished_at REAL
+);
+"""
+
+
+def default_worker_id():
+    """hostname:pid, unique across the hosts sharing one queue file"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class WorkQueue:
+    """
+    SQLite-backed job queue.
+
+    Every job is stored once per canonical job ID, so publishing the same
+    posting twice (e.g. from overlapping listing pages) never leads to a second
+    fetch. Claims are made inside an IMMEDIATE transaction, so two workers can
+    never claim the same row.
+    """
+
+    def __init__(self, path="work_queue.db", visibility_timeout=300, max_attempts=3):
+        self.path = path
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def publish(self, portal, job_urls):
+        """Add job URLs to the queue; returns how many were new"""
+        now = time.time()
+        rows = []
+        for job_url in job_urls:
+            job_id = canonical_job_id(job_url, portal)
+            if job_id:
+                rows.append((portal, job_id, job_url, now, now))
+        if not rows:
+            return 0
+        before = self.conn.total_changes
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO jobs (portal, job_id, job_url, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return self.conn.total_changes - before
+
+    def start_publishing(self, portal):
+        """Coordinator: mark a portal's listing walk as under way (clears an earlier run's marker)"""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO publishing (portal, started_at, finished_at) VALUES (?, ?, NULL)",
+            (portal, time.time())
+        )
+
+    def finish_publishing(self, portal):
+        """Coordinator: every job URL of this portal has been published"""
+        now = time.time()
+        self.conn.execute(
+            "INSERT INTO publishing (portal, started_at, finished_at) VALUES (?, ?, ?) "
+            "ON CONFLICT (portal) DO UPDATE SET finished_at = excluded.finished_at",
+            (portal, now, now)
+        )
+
+    def publishing_finished(self, portal):
+        """True once the coordinator has finished publishing this portal"""
+        row = self.conn.execute(
+            "SELECT 1 FROM publishing WHERE portal = ? AND finished_at IS NOT NULL", (portal,)
+        ).fetchone()
+        return row is not None
+
+    def claim(self, worker_id, portal=None, visibility_timeout=None):
+        """
+        Claim the next available job: pending and due, or claimed by a worker
+        whose visibility timeout has expired. An expired claim that has used up
+        max_attempts is marked failed instead, so a job that keeps crashing its
+        worker is not handed out forever. Returns a dict or None.
+        """
+        now = time.time()
+        timeout = self.visibility_timeout if visibility_timeout is None else visibility_timeout
+        query = (
+            "SELECT id, portal, job_id, job_url, attempts FROM jobs "
+            "WHERE status IN (?, ?) AND visible_at <= ?"
+        )
+        params = [PENDING, CLAIMED, now]
+        if portal:
+            query += " AND portal = ?"
+            params.append(portal)
+        query += " ORDER BY visible_at, id LIMIT 1"
+
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.conn.execute(
+                "UPDATE jobs SET status = ?, error = COALESCE(error, 'claim expired'), updated_at = ? "
+                "WHERE status = ? AND visible_at <= ? AND attempts >= ?",
+                (FAILED, now, CLAIMED, now, self.max_attempts)
+            )
+            row = self.conn.execute(query, params).fetchone()
+            if row is None:
+                self.conn.execute("COMMIT")
+                return None
+            self.conn.execute(
+                "UPDATE jobs SET status = ?, claimed_by = ?, visible_at = ?, "
+                "attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                (CLAIMED, worker_id, now + timeout, now, row['id'])
+            )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        item = dict(row)
+        item['attempts'] += 1
+        item['claimed_by'] = worker_id
+        return item
+
+    def ack(self, item, result):
+        """Mark a claimed job as done and store its scraped record"""
+        self._finish(item, DONE, result=json.dumps(result, ensure_ascii=False))
+
+    def fail(self, item, error, retry_delay=0):
+        """
+        Release a claimed job after a failed fetch. It becomes visible again after
+        retry_delay seconds, or is marked failed once max_attempts is reached.
+        Returns True if the job will be retried.
+        """
+        retry = item['attempts'] < self.max_attempts
+        self._finish(
+            item, PENDING if retry else FAILED,
+            error=str(error), visible_at=time.time() + retry_delay
+        )
+        return retry
+
+    def _finish(self, item, status, result=None, error=None, visible_at=0):
+        # Only the current claim holder may finish a job; a worker whose claim
+        # expired and was re-issued must not overwrite the new claim.
+        self.conn.execute(
+            "UPDATE jobs SET status = ?, result = COALESCE(?, result), error = ?, "
+            "visible_at = ?, updated_at = ? WHERE id = ? AND claimed_by = ? AND status = ?",
+            (status, result, error, visible_at, time.time(), item['id'], item['claimed_by'], CLAIMED)
+        )
+
+    def counts(self, portal=None):
+        """Number of jobs per status"""
+        query = "SELECT status, COUNT(*) FROM jobs"
+        params = []
+        if portal:
+            query += " WHERE portal = ?"
+            params.append(portal)
+        query += " GROUP BY status"
+        counts = {PENDING: 0, CLAIMED: 0, DONE: 0, FAILED: 0}
+        counts.update(dict(self.conn.execute(query, params).fetchall()))
+        return counts
+
+    def has_open_work(self, portal=None):
+        """True while any job is still pending or claimed"""
+        counts = self.counts(portal)
+        return counts[PENDING] + counts[CLAIMED] > 0
+
+    def results(self, portal=None):
+        """Yield the scraped records of all completed jobs"""
+        query = "SELECT result FROM jobs WHERE status = ?"
+        params = [DONE]
+        if portal:
+            query += " AND portal = ?"
+            params.append(portal)
+        query += " ORDER BY id"
+        for (result,) in self.conn.execute(query, params):
+            yield json.loads(result)